@@ -15,10 +15,19 @@
 #   January, 2023.
 
 import numpy as np
+import Scripts.Cache as Cache
+import Scripts.Functions as Functions
+import Scripts.Geometry as Geometry
 import Scripts.Gammas as Gammas
+import Scripts.Multigrid as Multigrid
 import Scripts.Neighbors as Neighbors
+import Scripts.Profile as Profile
+import Scripts.Relaxation as Relaxation
+import Scripts.Schwarz as Schwarz
+import Scripts.Shared as Shared
+import Scripts.Solvers as Solvers
 
-def Mesh(x, y, phi, f):
+def Mesh(x, y, phi, f, method = 'gs', omega = 1, cache = False, stats = False, rtol = 1e-10, atol = 0, stall = 100, tol = 0, m_it = 40000, u0 = None):
     # 2D Poisson Equation implemented in Logically Rectangular Meshes.
     # 
     # This routine calculates an approximation to the solution of Poisson's equation in 2D using a Generalized Finite Differences scheme in logically rectangular meshes.
@@ -30,62 +39,85 @@ def Mesh(x, y, phi, f):
     # Input parameters
     #   x           m x n           Array               Array with the coordinates in x of the nodes.
     #   y           m x n           Array               Array with the coordinates in y of the nodes.
-    #   phi                         function            Function declared with the boundary condition.
-    #   f                           function            Function declared with the right side of the equation.
+    #   phi                         function            Function declared with the boundary condition, or an m x n array with its
+    #                                                   values on the nodes (see Functions.Evaluate).
+    #   f                           function            Function declared with the right side of the equation, or an m x n array
+    #                                                   with its values on the nodes.
+    #   method                      string              Relaxation method: 'gs', 'jacobi' or 'sequential' (see Relaxation.Mesh),
+    #                                                   or 'multigrid' for the geometric multigrid solver (see Multigrid.Mesh),
+    #                                                   which needs an odd number of nodes on each side to coarsen the mesh.
+    #   omega                       Real                Relaxation weight, or 'auto' for the successive over-relaxation weight
+    #                                                   estimated from the Jacobi spectral radius (see Relaxation.Mesh_Omega);
+    #                                                   'jacobi' and 'multigrid' use 1.
+    #   cache                       bool                If True, the Gammas are read from the operator cache (see Cache.Mesh).
+    #   stats                       bool                If True, the solver report is also returned, with the measurements of each
+    #                                                   stage and the convergence history (see Profile.Report).
+    #   rtol                        Real                Tolerance for the largest residual, relative to the initial one.
+    #   atol                        Real                Absolute tolerance for the largest residual.
+    #   stall                       integer             Iterations without improving the residual after which the solver stops.
+    #   tol                         Real                Tolerance for the largest update, 0 to stop only by the residual.
+    #   m_it                        integer             Maximum number of iterations.
+    #   u0          m x n           Array               Initial approximation on the interior nodes, zero if None; a coarser
+    #                                                   solution can be brought to this mesh with Interpolation.Mesh.
     # 
     # Output parameters
     #   u_ap        m x n           Array               Array with the approximation computed by the routine.
     #   u_ex        m x n           Array               Array with the theoretical solution.
+    #   info                        dict                Solver report with the method, weight finally used (after the restarts of
+    #                                                   an over-relaxation), iterations, whether it converged and the reason to
+    #                                                   stop (see Relaxation.Reasons), and residual history (only if stats is
+    #                                                   True). A warning is issued if the solver did not converge.
 
     # Variable initialization
+    report = Profile.Report() if stats else None                                    # Profiling report, only if requested.
     me   = x.shape                                                                  # The size of the mesh is found.
     m    = me[0]                                                                    # The number of nodes in x.
     n    = me[1]                                                                    # The number of nodes in y.
-    err  = 1                                                                        # err initialization in 1.
-    iter = 0                                                                        # Number of iterations.
-    tol  = 1e-16                                                                    # The tolerance is defined.
-    m_it = 40000                                                                    # Maximum number of iterations.
     u_ap = np.zeros([m,n])                                                          # u_ap initialization with zeros.
-    u_ex = np.zeros([m,n])                                                          # u_ex initialization with zeros.
+    if u0 is not None:                                                              # If there is an initial approximation.
+        u_ap[:,:] = u0                                                              # The boundary values are replaced below.
+    F    = np.zeros([m,n])                                                          # F initialization with zeros.
 
     # Boundary conditions
-    for i in range(m):                                                              # For each of the nodes on the x boundaries.
-        u_ap[i, 0]   = phi(x[i, 0],   y[i, 0])                                      # The boundary condition is assigned at the first y.
-        u_ap[i, n-1] = phi(x[i, n-1], y[i, n-1])                                    # The boundary condition is assigned at the last y.
-    for j in range(n):                                                              # For each of the nodes on the y boundaries.
-        u_ap[0,   j] = phi(x[0,   j], y[0,   j])                                    # The boundary condition is assigned at the first x.
-        u_ap[m-1, j] = phi(x[m-1, j], y[m-1, j])                                    # The boundary condition is assigned at the last x.
+    with Profile.Stage(report, 'boundary'):
+        u_ex = Functions.Evaluate(phi, x, y)                                        # phi is evaluated once, on all the nodes.
+        u_ap[[0, m-1], :] = u_ex[[0, m-1], :]                                       # The boundary condition is assigned at the first and last x.
+        u_ap[:, [0, n-1]] = u_ex[:, [0, n-1]]                                       # The boundary condition is assigned at the first and last y.
 
     # Computation of Gamma values
     L = np.vstack([[0], [0], [2], [0], [2]])                                        # The values of the differential operator are assigned.
-    Gamma = Gammas.Mesh(x, y, L)                                                    # Gamma computation.
+    if cache:                                                                       # If the operator cache is used.
+        with Profile.Stage(report, 'cache'):
+            Gamma, K, key = Cache.Mesh(x, y, L)                                     # Gamma computation, or reading.
+    else:                                                                           # If the operator is computed.
+        with Profile.Stage(report, 'gammas'):
+            Gamma = Gammas.Mesh(x, y, L)                                            # Gamma computation.
+
+    # Right side of the equation
+    with Profile.Stage(report, 'rhs'):
+        F[1:m-1, 1:n-1] = Functions.Evaluate(f, x, y)[1:m-1, 1:n-1]                 # f is evaluated once, on all the nodes.
 
     # A Generalized Finite Differences Method
-    while err >= tol and iter <= m_it:                                              # Check for iterations and tolerance.
-        err = 0                                                                     # Error becomes zero to be able to update.
-        for i in range(1,m-1):                                                      # For each of the nodes on the x axis.
-            for j in range(1,n-1):                                                  # For each of the nodes on the y axis.
-                t = (f(x[i, j], y[i, j]) - (            \
-                    Gamma[i, j, 1]*u_ap[i + 1, j    ] + \
-                    Gamma[i, j, 2]*u_ap[i + 1, j + 1] + \
-                    Gamma[i, j, 3]*u_ap[i    , j + 1] + \
-                    Gamma[i, j, 4]*u_ap[i - 1, j + 1] + \
-                    Gamma[i, j, 5]*u_ap[i - 1, j    ] + \
-                    Gamma[i, j, 6]*u_ap[i - 1, j - 1] + \
-                    Gamma[i, j, 7]*u_ap[i    , j - 1] + \
-                    Gamma[i, j, 8]*u_ap[i + 1, j - 1]))/Gamma[i, j, 0]              # u_ap is calculated at the central node.
-                err = max(err, abs(t - u_ap[i, j]));                                # Error computation.
-                u_ap[i,j] = t;                                                      # The previously computed value is assigned.
-        iter += 1                                                                   # 1 is added to the number of iterations.
-    
-    # Theoretical Solution
-    for i in range(m):                                                              # For all the nodes on x.
-        for j in range(n):                                                          # For all the nodes on y.
-            u_ex[i,j] = phi(x[i,j], y[i,j])                                         # The theoretical solution is computed.
+    with Profile.Stage(report, 'solve'):
+        if method == 'multigrid':                                                   # Geometric multigrid.
+            if omega == 'auto':                                                     # The smoother is not over-relaxed.
+                omega = 1
+            u_ap, iter, reason = Multigrid.Mesh(x, y, L, u_ap, F, Gamma, fmg = u0 is None, omega = omega, tol = rtol, m_it = m_it, \
+                                                callback = Profile.History(report)) # The system is solved by V-cycles.
+        else:                                                                       # Relaxation.
+            if omega == 'auto':                                                     # If the weight is estimated, for Gauss-Seidel.
+                omega = 1 if method == 'jacobi' else Relaxation.Mesh_Omega(Gamma)
+            weights = [omega]                                                       # The weight of each run.
+            u_ap, iter, reason = Relaxation.Mesh(Gamma, u_ap, F, method, omega, tol, m_it, \
+                                                 Profile.History(report), rtol, atol, stall, weights.append)
+            omega = weights[-1]                                                     # The weight of the last restart.
     
+    if stats:                                                                       # If the solver report was requested.
+        return u_ap, u_ex, dict(method = method, omega = omega, iterations = iter, converged = reason in Relaxation.Converged, \
+                                reason = reason, **report)
     return u_ap, u_ex
 
-def Triangulation(p, tt, phi, f):
+def Triangulation(p, tt, phi, f, method = 'gs', omega = 1, cache = False, stats = False, rtol = 1e-10, atol = 0, stall = 100, tol = 0, m_it = 40000, u0 = None, workers = None):
     # 2D Poisson Equation implemented in Triangulations.
     # 
     # This routine calculates an approximation to the solution of Poisson's equation in 2D using a Generalized Finite Differences scheme in triangulations.
@@ -95,58 +127,123 @@ def Triangulation(p, tt, phi, f):
     # \nabla^2 \phi = f
     # 
     # Input parameters
-    #   p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
-    #   tt          n x 3           Array           Array with the correspondence of the n triangles.
-    #   phi                         function        Function declared with the boundary condition.
-    #   f                           function        Function declared with the right side of the equation.
+    #   p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary, or a
+    #                                               Geometry (see Geometry); its neighbors are used if it has them.
+    #   tt          n x 3           Array           Array with the correspondence of the n triangles, or None for the ones of
+    #                                               the Geometry.
+    #   phi                         function        Function declared with the boundary condition, or an m x 1 array with its
+    #                                               values on the nodes (see Functions.Evaluate).
+    #   f                           function        Function declared with the right side of the equation, or an m x 1 array
+    #                                               with its values on the nodes.
+    #   method                      string          Relaxation method: 'gs', 'jacobi' or 'sequential' (see Relaxation.Cloud),
+    #                                               'additive' or 'multiplicative' for the domain decomposition on several
+    #                                               cores (see Schwarz.Cloud), 'shared' for weighted Jacobi on several
+    #                                               processes sharing the arrays (see Shared.Cloud), or 'amg' for the
+    #                                               algebraic multigrid solver (see AMG.Solve).
+    #   omega                       Real            Relaxation weight, or 'auto' for the successive over-relaxation weight
+    #                                               estimated from the Jacobi spectral radius (see Relaxation.Cloud_Omega);
+    #                                               'jacobi', 'additive', 'multiplicative' and 'shared' use 1.
+    #   cache                       bool            If True, the neighbors and Gammas are read from the operator cache (see Cache.Cloud).
+    #   stats                       bool            If True, the solver report is also returned, with the measurements of each
+    #                                               stage and the convergence history (see Profile.Report).
+    #   rtol                        Real            Tolerance for the largest residual, relative to the initial one.
+    #   atol                        Real            Absolute tolerance for the largest residual.
+    #   stall                       integer         Iterations without improving the residual after which the solver stops.
+    #   tol                         Real            Tolerance for the largest update, 0 to stop only by the residual.
+    #   m_it                        integer         Maximum number of iterations.
+    #   u0          m x 1           Array           Initial approximation on the interior nodes, zero if None; a coarser
+    #                                               solution can be brought to this cloud with Interpolation.Triangulation or
+    #                                               Interpolation.Cloud.
+    #   workers                     integer         Number of threads of the domain decomposition, one subdomain for each of
+    #                                               them, or of processes of 'shared'; by default the number of processors.
     # 
     # Output parameters
     #   u_ap        m x 1           Array           Array with the approximation computed by the routine.
     #   u_ex        m x 1           Array           Array with the theoretical solution.
+    #   vec         m x nvec        Array           Array with the correspondence of the nvec neighbors of each node.
+    #   info                        dict            Solver report with the method, weight finally used (after the restarts of
+    #                                               an over-relaxation, None for 'amg'), iterations, whether it converged
+    #                                               and the reason to stop (see Relaxation.Reasons), and residual history
+    #                                               (only if stats is True). A warning is issued if the solver did not
+    #                                               converge.
     
     # Variable initialization
-    m    = len(p[:,0])                                                              # The total number of nodes is calculated.
+    report = Profile.Report() if stats else None                                    # Profiling report, only if requested.
+    if isinstance(p, Geometry.Geometry) and tt is None:                             # The triangles of the Geometry.
+        tt = p.tt
+    xy, bnd = Geometry.Nodes(p)                                                     # The coordinates and the boundary nodes.
+    vec  = None                                                                     # A Geometry gives its own neighbors.
+    m    = len(xy)                                                                  # The total number of nodes is calculated.
     nvec = 8                                                                        # The maximum number of nodes.
-    err  = 1                                                                        # err initialization in 1.
-    iter = 0                                                                        # Number of iterations.
-    tol  = 1e-10                                                                     # The tolerance is defined.
-    m_it = 40000                                                                    # Maximum number of iterations.
     u_ap = np.zeros([m])                                                            # u_ap initialization with zeros.
-    u_ex = np.zeros([m])                                                            # u_ex initialization with zeros.
+    if u0 is not None:                                                              # If there is an initial approximation.
+        u_ap[:] = u0                                                                # The boundary values are replaced below.
+    F    = np.zeros([m])                                                            # F initialization with zeros.
     
     # Boundary conditions
-    for i in np.arange(m):                                                          # For all the nodes.
-        if p[i,2] == 1:                                                             # If the node is in the boundary.
-            u_ap[i]   = phi(p[i, 0], p[i, 1])                                       # The boundary condition is assigned.
+    with Profile.Stage(report, 'boundary'):
+        u_ex = Functions.Evaluate(phi, xy[:,0], xy[:,1])                            # phi is evaluated once, on all the nodes.
+        u_ap[bnd] = u_ex[bnd]                                                       # The boundary condition is assigned.
     
-    # Neighbor search for all the nodes.
-    vec = Neighbors.Triangulation(p, tt, nvec)                                      # Neighbor search with the proper routine.
-
-    # Computation of Gamma values
+    # Neighbor search and computation of Gamma values
     L = np.vstack([[0], [0], [2], [0], [2]])                                        # The values of the differential operator are assigned.
-    Gamma = Gammas.Cloud(p, vec, L)                                                 # Gamma computation.
+    if cache:                                                                       # If the operator cache is used.
+        with Profile.Stage(report, 'cache'):
+            vec, Gamma, K, key = Cache.Cloud(p, L, nvec, tt)                        # Neighbors and Gammas, computed or read.
+    else:                                                                           # If the operator is computed.
+        with Profile.Stage(report, 'neighbors'):
+            if not Geometry.Has_Neighbors(p):                                       # If the Geometry has no neighbors.
+                vec = Neighbors.Triangulation(p, tt, nvec)                          # Neighbor search with the proper routine.
+        with Profile.Stage(report, 'gammas'):
+            Gamma = Gammas.Cloud(p, vec, L)                                         # Gamma computation.
+
+    # Right side of the equation
+    with Profile.Stage(report, 'rhs'):
+        F[~bnd] = Functions.Evaluate(f, xy[:,0], xy[:,1])[~bnd]                     # f is evaluated once, on all the nodes.
 
     # A Generalized Finite Differences Method
-    while err >= tol and iter <= m_it:                                              # Check for iterations and tolerance.
-        err = 0                                                                     # Error becomes zero to be able to update.
-        for i in np.arange(m):                                                      # For each of the nodes.
-            if p[i,2] == 0:                                                         # If the node is not in the boundary.
-                utemp = 0                                                           # utemp is initialized with zero.
-                nvec = sum(vec[i,:] != -1)                                          # The number of neighbors of the central node.
-                for j in np.arange(1,nvec+1):                                       # For each of the neighbor nodes.
-                    utemp = utemp + Gamma[i, j]*u_ap[int(vec[i, j-1])]              # utemp is computed.
-                t = (f(p[i, 0], p[i, 1]) - utemp)/Gamma[i,0]                        # The central node is added to the approximation.
-                err = max(err, abs(t - u_ap[i]));                                   # Error computation.
-                u_ap[i] = t;                                                        # The previously computed value is assigned.
-        iter += 1                                                                   # 1 is added to the number of iterations.
+    with Profile.Stage(report, 'solve'):
+        if method == 'amg':                                                         # Algebraic multigrid.
+            if not cache:                                                           # If K was not read from the cache.
+                K = Gammas.Assemble_Cloud(p, vec, Gamma, sparse = True)             # K matrix assembly.
+            inner    = ~bnd                                                         # The interior nodes.
+            u_b      = np.where(inner, 0, u_ap)                                     # Only the boundary values.
+            un, info = Solvers.Solve(K, F - K@u_b + u_b, 'amg', rtol, m_it, \
+                                     callback = Profile.History(report), x0 = u_ap) # The system is solved by V-cycles.
+            iter     = info['iterations']                                           # Number of V-cycles.
+            reason   = info['reason']                                               # Solve warns if it did not converge.
+            omega    = None                                                         # The V-cycles have no weight.
+            u_ap[inner] = un[inner]                                                 # Save the computed solution.
+        elif method in ('additive', 'multiplicative'):                              # Domain decomposition.
+            if omega == 'auto':                                                     # The subdomain sweeps are not over-relaxed.
+                omega = 1
+            weights = [omega]                                                       # The weight of each run.
+            u_ap, iter, reason = Schwarz.Cloud(*Geometry.Split(p, vec), Gamma, u_ap, F, method, omega, tol, m_it, \
+                                               Profile.History(report), rtol, atol, stall, workers, restart = weights.append)
+            omega = weights[-1]                                                     # The weight of the last restart.
+        elif method == 'shared':                                                    # Jacobi on several processes.
+            if omega == 'auto':                                                     # The Jacobi weight is not estimated.
+                omega = 1
+            weights = [omega]                                                       # The weight of each run.
+            u_ap, iter, reason = Shared.Cloud(*Geometry.Split(p, vec), Gamma, u_ap, F, omega, tol, m_it, \
+                                              Profile.History(report), rtol, atol, stall, workers, weights.append)
+            omega = weights[-1]                                                     # The weight of the last restart.
+        else:                                                                       # Relaxation.
+            if omega == 'auto':                                                     # If the weight is estimated, for Gauss-Seidel.
+                omega = 1 if method == 'jacobi' else Relaxation.Cloud_Omega(p, vec, Gamma)
+            weights = [omega]                                                       # The weight of each run.
+            u_ap, iter, reason = Relaxation.Cloud(p, vec, Gamma, u_ap, F, method, omega, tol, m_it, \
+                                                  Profile.History(report), rtol, atol, stall, weights.append)
+            omega = weights[-1]                                                     # The weight of the last restart.
     
-    # Theoretical Solution
-    for i in range(m):                                                              # For all the nodes.
-        u_ex[i] = phi(p[i,0], p[i,1])                                               # The theoretical solution is computed.
-
+    if vec is None:                                                                 # The neighbors of the Geometry, as vec.
+        vec = p.Vec()
+    if stats:                                                                       # If the solver report was requested.
+        return u_ap, u_ex, vec, dict(method = method, omega = omega, iterations = iter, \
+                                     converged = reason in Relaxation.Converged, reason = reason, **report)
     return u_ap, u_ex, vec
 
-def Cloud(p, phi, f):
+def Cloud(p, phi, f, method = 'gs', omega = 1, cache = False, stats = False, rtol = 1e-10, atol = 0, stall = 100, tol = 0, m_it = 40000, u0 = None, workers = None):
     # 2D Poisson Equation implemented in unstructured clouds of points.
     # 
     # This routine calculates an approximation to the solution of Poisson's equation in 2D using a Generalized Finite Differences scheme in unstructured clouds of points.
@@ -156,57 +253,119 @@ def Cloud(p, phi, f):
     # \nabla^2 \phi = f
     # 
     # Input parameters
-    #   p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
-    #   phi                         function        Function declared with the boundary condition.
-    #   f                           function        Function declared with the right side of the equation.
+    #   p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary, or a
+    #                                               Geometry (see Geometry); its neighbors are used if it has them.
+    #   phi                         function        Function declared with the boundary condition, or an m x 1 array with its
+    #                                               values on the nodes (see Functions.Evaluate).
+    #   f                           function        Function declared with the right side of the equation, or an m x 1 array
+    #                                               with its values on the nodes.
+    #   method                      string          Relaxation method: 'gs', 'jacobi' or 'sequential' (see Relaxation.Cloud),
+    #                                               'additive' or 'multiplicative' for the domain decomposition on several
+    #                                               cores (see Schwarz.Cloud), 'shared' for weighted Jacobi on several
+    #                                               processes sharing the arrays (see Shared.Cloud), or 'amg' for the
+    #                                               algebraic multigrid solver (see AMG.Solve).
+    #   omega                       Real            Relaxation weight, or 'auto' for the successive over-relaxation weight
+    #                                               estimated from the Jacobi spectral radius (see Relaxation.Cloud_Omega);
+    #                                               'jacobi', 'additive', 'multiplicative' and 'shared' use 1.
+    #   cache                       bool            If True, the neighbors and Gammas are read from the operator cache (see Cache.Cloud).
+    #   stats                       bool            If True, the solver report is also returned, with the measurements of each
+    #                                               stage and the convergence history (see Profile.Report).
+    #   rtol                        Real            Tolerance for the largest residual, relative to the initial one.
+    #   atol                        Real            Absolute tolerance for the largest residual.
+    #   stall                       integer         Iterations without improving the residual after which the solver stops.
+    #   tol                         Real            Tolerance for the largest update, 0 to stop only by the residual.
+    #   m_it                        integer         Maximum number of iterations.
+    #   u0          m x 1           Array           Initial approximation on the interior nodes, zero if None; a coarser
+    #                                               solution can be brought to this cloud with Interpolation.Triangulation or
+    #                                               Interpolation.Cloud.
+    #   workers                     integer         Number of threads of the domain decomposition, one subdomain for each of
+    #                                               them, or of processes of 'shared'; by default the number of processors.
     # 
     # Output parameters
     #   u_ap        m x 1           Array           Array with the approximation computed by the routine.
     #   u_ex        m x 1           Array           Array with the theoretical solution.
+    #   vec         m x nvec        Array           Array with the correspondence of the nvec neighbors of each node.
+    #   info                        dict            Solver report with the method, weight finally used (after the restarts of
+    #                                               an over-relaxation, None for 'amg'), iterations, whether it converged
+    #                                               and the reason to stop (see Relaxation.Reasons), and residual history
+    #                                               (only if stats is True). A warning is issued if the solver did not
+    #                                               converge.
 
     # Variable initialization
-    m    = len(p[:,0])                                                              # The total number of nodes is calculated.
+    report = Profile.Report() if stats else None                                    # Profiling report, only if requested.
+    xy, bnd = Geometry.Nodes(p)                                                     # The coordinates and the boundary nodes.
+    vec  = None                                                                     # A Geometry gives its own neighbors.
+    m    = len(xy)                                                                  # The total number of nodes is calculated.
     nvec = 8                                                                        # The maximum number of nodes.
-    err  = 1                                                                        # err initialization in 1.
-    iter = 0                                                                        # Number of iterations.
-    tol  = 1e-10                                                                     # The tolerance is defined.
-    m_it = 40000                                                                    # Maximum number of iterations.
     u_ap = np.zeros([m])                                                            # u_ap initialization with zeros.
-    u_ex = np.zeros([m])                                                            # u_ex initialization with zeros.
+    if u0 is not None:                                                              # If there is an initial approximation.
+        u_ap[:] = u0                                                                # The boundary values are replaced below.
+    F    = np.zeros([m])                                                            # F initialization with zeros.
 
     # Boundary conditions
-    for i in np.arange(m):                                                          # For all the nodes.
-        if p[i,2] == 1:                                                             # If the node is in the boundary.
-            u_ap[i]   = phi(p[i, 0], p[i, 1])                                       # The boundary condition is assigned.
+    with Profile.Stage(report, 'boundary'):
+        u_ex = Functions.Evaluate(phi, xy[:,0], xy[:,1])                            # phi is evaluated once, on all the nodes.
+        u_ap[bnd] = u_ex[bnd]                                                       # The boundary condition is assigned.
     
-    # Neighbor search for all the nodes.
-    vec = Neighbors.Cloud(p, nvec)                                                  # Neighbor search with the proper routine.
-
-    # Computation of Gamma values
+    # Neighbor search and computation of Gamma values
     L = np.vstack([[0], [0], [2], [0], [2]])                                        # The values of the differential operator are assigned.
-    Gamma = Gammas.Cloud(p, vec, L)                                                 # Gamma computation.
+    if cache:                                                                       # If the operator cache is used.
+        with Profile.Stage(report, 'cache'):
+            vec, Gamma, K, key = Cache.Cloud(p, L, nvec)                            # Neighbors and Gammas, computed or read.
+    else:                                                                           # If the operator is computed.
+        with Profile.Stage(report, 'neighbors'):
+            if not Geometry.Has_Neighbors(p):                                       # If the Geometry has no neighbors.
+                vec = Neighbors.Cloud(p, nvec)                                      # Neighbor search with the proper routine.
+        with Profile.Stage(report, 'gammas'):
+            Gamma = Gammas.Cloud(p, vec, L)                                         # Gamma computation.
+
+    # Right side of the equation
+    with Profile.Stage(report, 'rhs'):
+        F[~bnd] = Functions.Evaluate(f, xy[:,0], xy[:,1])[~bnd]                     # f is evaluated once, on all the nodes.
 
     # A Generalized Finite Differences Method
-    while err >= tol and iter <= m_it:                                              # Check for iterations and tolerance.
-        err = 0                                                                     # Error becomes zero to be able to update.
-        for i in np.arange(m):                                                      # For each of the nodes.
-            if p[i,2] == 0:                                                         # If the node is not in the boundary.
-                utemp = 0                                                           # utemp is initialized with zero.
-                nvec = sum(vec[i,:] != -1)                                          # The number of neighbors of the central node.
-                for j in np.arange(1,nvec+1):                                       # For each of the neighbor nodes.
-                    utemp = utemp + Gamma[i, j]*u_ap[int(vec[i, j-1])]              # utemp is computed.
-                t = (f(p[i, 0], p[i, 1]) - utemp)/Gamma[i,0]                        # The central node is added to the approximation.
-                err = max(err, abs(t - u_ap[i]));                                   # Error computation.
-                u_ap[i] = t;                                                        # The previously computed value is assigned.
-        iter += 1                                                                   # 1 is added to the number of iterations.
+    with Profile.Stage(report, 'solve'):
+        if method == 'amg':                                                         # Algebraic multigrid.
+            if not cache:                                                           # If K was not read from the cache.
+                K = Gammas.Assemble_Cloud(p, vec, Gamma, sparse = True)             # K matrix assembly.
+            inner    = ~bnd                                                         # The interior nodes.
+            u_b      = np.where(inner, 0, u_ap)                                     # Only the boundary values.
+            un, info = Solvers.Solve(K, F - K@u_b + u_b, 'amg', rtol, m_it, \
+                                     callback = Profile.History(report), x0 = u_ap) # The system is solved by V-cycles.
+            iter     = info['iterations']                                           # Number of V-cycles.
+            reason   = info['reason']                                               # Solve warns if it did not converge.
+            omega    = None                                                         # The V-cycles have no weight.
+            u_ap[inner] = un[inner]                                                 # Save the computed solution.
+        elif method in ('additive', 'multiplicative'):                              # Domain decomposition.
+            if omega == 'auto':                                                     # The subdomain sweeps are not over-relaxed.
+                omega = 1
+            weights = [omega]                                                       # The weight of each run.
+            u_ap, iter, reason = Schwarz.Cloud(*Geometry.Split(p, vec), Gamma, u_ap, F, method, omega, tol, m_it, \
+                                               Profile.History(report), rtol, atol, stall, workers, restart = weights.append)
+            omega = weights[-1]                                                     # The weight of the last restart.
+        elif method == 'shared':                                                    # Jacobi on several processes.
+            if omega == 'auto':                                                     # The Jacobi weight is not estimated.
+                omega = 1
+            weights = [omega]                                                       # The weight of each run.
+            u_ap, iter, reason = Shared.Cloud(*Geometry.Split(p, vec), Gamma, u_ap, F, omega, tol, m_it, \
+                                              Profile.History(report), rtol, atol, stall, workers, weights.append)
+            omega = weights[-1]                                                     # The weight of the last restart.
+        else:                                                                       # Relaxation.
+            if omega == 'auto':                                                     # If the weight is estimated, for Gauss-Seidel.
+                omega = 1 if method == 'jacobi' else Relaxation.Cloud_Omega(p, vec, Gamma)
+            weights = [omega]                                                       # The weight of each run.
+            u_ap, iter, reason = Relaxation.Cloud(p, vec, Gamma, u_ap, F, method, omega, tol, m_it, \
+                                                  Profile.History(report), rtol, atol, stall, weights.append)
+            omega = weights[-1]                                                     # The weight of the last restart.
     
-    # Theoretical Solution
-    for i in range(m):                                                              # For all the nodes.
-        u_ex[i] = phi(p[i,0], p[i,1])                                             # The theoretical solution is computed.
-
+    if vec is None:                                                                 # The neighbors of the Geometry, as vec.
+        vec = p.Vec()
+    if stats:                                                                       # If the solver report was requested.
+        return u_ap, u_ex, vec, dict(method = method, omega = omega, iterations = iter, \
+                                     converged = reason in Relaxation.Converged, reason = reason, **report)
     return u_ap, u_ex, vec
 
-def Mesh_K(x, y, phi, f):
+def Mesh_K(x, y, phi, f, solver = 'lu', stats = False, cache = False, u0 = None, precision = 'double'):
     # 2D Poisson Equation implemented in Logically Rectangular Meshes.
     # 
     # This routine calculates an approximation to the solution of Poisson's equation in 2D using a Generalized Finite Differences scheme in logically rectangular meshes.
@@ -218,47 +377,73 @@ def Mesh_K(x, y, phi, f):
     # Input parameters
     #   x           m x n           Array               Array with the coordinates in x of the nodes.
     #   y           m x n           Array               Array with the coordinates in y of the nodes.
-    #   phi                         function            Function declared with the boundary condition.
-    #   f                           function            Function declared with the right side of the equation.
+    #   phi                         function            Function declared with the boundary condition, or an m x n array with its
+    #                                                   values on the nodes (see Functions.Evaluate).
+    #   f                           function            Function declared with the right side of the equation, or an m x n array
+    #                                                   with its values on the nodes.
+    #   solver                      string              Linear solver: 'dense', 'lu', 'gmres', 'bicgstab' or 'amg' (see Solvers.Solve).
+    #   stats                       bool                If True, the solver report is also returned, with the measurements of each
+    #                                                   stage and the convergence history (see Profile.Report).
+    #   cache                       bool                If True, K and its factorization are read from the operator cache (see Cache.Mesh).
+    #   u0          m x n           Array               Initial approximation on the interior nodes for the iterative solvers,
+    #                                                   zero if None (see Interpolation.Mesh).
+    #   precision                   string              'double', or 'mixed' to factorize in float32 and refine the solution in
+    #                                                   float64 (see Solvers.Solve).
     # 
     # Output parameters
     #   u_ap        m x n           Array               Array with the approximation computed by the routine.
     #   u_ex        m x n           Array               Array with the theoretical solution.
+    #   info                        dict                Solver report with the iterations, residual, whether it converged and the
+    #                                                   reason to stop (only if stats is True).
 
     # Variable initialization
+    report = Profile.Report() if stats else None                                    # Profiling report, only if requested.
     me   = x.shape                                                                  # The size of the mesh is found.
     m    = me[0]                                                                    # The number of nodes in x.
     n    = me[1]                                                                    # The number of nodes in y.
     u_ap = np.zeros([m,n])                                                          # u_ap initialization with zeros.
-    u_ex = np.zeros([m,n])                                                          # u_ex initialization with zeros.
     
     # Boundary conditions
-    for i in range(m):                                                              # For each of the nodes on the x boundaries.
-        u_ap[i, 0]   = phi(x[i, 0],   y[i, 0])                                      # The boundary condition is assigned at the first y.
-        u_ap[i, n-1] = phi(x[i, n-1], y[i, n-1])                                    # The boundary condition is assigned at the last y.
-    for j in range(n):                                                              # For each of the nodes on the y boundaries.
-        u_ap[0,   j] = phi(x[0,   j], y[0,   j])                                    # The boundary condition is assigned at the first x.
-        u_ap[m-1, j] = phi(x[m-1, j], y[m-1, j])                                    # The boundary condition is assigned at the last x.
+    with Profile.Stage(report, 'boundary'):
+        u_ex = Functions.Evaluate(phi, x, y)                                        # phi is evaluated once, on all the nodes.
+        u_ap[[0, m-1], :] = u_ex[[0, m-1], :]                                       # The boundary condition is assigned at the first and last x.
+        u_ap[:, [0, n-1]] = u_ex[:, [0, n-1]]                                       # The boundary condition is assigned at the first and last y.
 
     # Computation of Gamma values
     L = np.vstack([[0], [0], [2], [0], [2]])                                        # The values of the differential operator are assigned.
-    K, R = Gammas.K_Mesh(x, y, L, phi, f)                                                      # Gamma computation.
+    factor = None                                                                   # The factorization is computed by the solver.
+    if cache:                                                                       # If the operator cache is used.
+        with Profile.Stage(report, 'cache'):
+            Gamma, K, key = Cache.Mesh(x, y, L)                                     # Gamma computation, or reading.
+            if solver == 'lu':                                                      # If the sparse LU is used.
+                factor = Cache.Factor(key, K, precision)                            # The factorization is computed only once.
+    else:                                                                           # If the operator is computed.
+        with Profile.Stage(report, 'gammas'):
+            Gamma = Gammas.Mesh(x, y, L)                                            # Gamma computation.
+        with Profile.Stage(report, 'assembly'):
+            sparse = solver != 'dense' or precision == 'mixed'                      # The mixed dense solve starts from CSR.
+            K = Gammas.Assemble_Mesh(Gamma, sparse = sparse)                        # K matrix assembly.
+    with Profile.Stage(report, 'rhs'):
+        R = Gammas.R_Mesh(x, y, u_ex, f)                                            # Right hand side of the system.
     
     # A Generalized Finite Differences Method
-    un = np.linalg.lstsq(K,R)[0]
-    
-    for i in np.arange(1,m-1):                                                      # For each of the interior nodes on x.
-        for j in np.arange(1,n-1):                                                  # For each of the interior nodes on y.
-            u_ap[i, j] = un[i + (j)*m]                                              # u_ap values are assigned.
-    
-    # Theoretical Solution
-    for i in range(m):                                                              # For all the nodes on x.
-        for j in range(n):                                                          # For all the nodes on y.
-            u_ex[i,j] = phi(x[i,j], y[i,j])                                         # The theoretical solution is computed.
+    with Profile.Stage(report, 'solve'):
+        x0 = None                                                                   # Initial approximation of the solver.
+        if u0 is not None:                                                          # If there is an initial approximation.
+            x0 = u_ap.copy()
+            x0[1:m-1, 1:n-1] = np.asarray(u0)[1:m-1, 1:n-1]                         # The boundary values are kept.
+            x0 = x0.transpose().ravel()                                             # The nodes are numbered as i + j*m.
+        un, info = Solvers.Solve(K, R, solver, factor = factor, callback = Profile.History(report), \
+                                 x0 = x0, precision = precision)                    # The system is solved.
+        un = un.reshape([n, m]).transpose()                                         # The nodes are numbered as i + j*m.
+        u_ap[1:m-1, 1:n-1] = un[1:m-1, 1:n-1]                                       # u_ap values are assigned.
     
+    if stats:                                                                       # If the solver report was requested.
+        info.update(report)                                                         # The measurements are added.
+        return u_ap, u_ex, info
     return u_ap, u_ex
 
-def Cloud_K(p, phi, f):
+def Cloud_K(p, phi, f, solver = 'lu', stats = False, cache = False, u0 = None, precision = 'double'):
     # 2D Poisson Equation implemented in unstructured clouds of points.
     # 
     # This routine calculates an approximation to the solution of Poisson's equation in 2D using a Generalized Finite Differences scheme in unstructured clouds of points.
@@ -268,49 +453,247 @@ def Cloud_K(p, phi, f):
     # \nabla^2 \phi = f
     # 
     # Input parameters
-    #   p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
-    #   phi                         function        Function declared with the boundary condition.
-    #   f                           function        Function declared with the right side of the equation.
+    #   p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary, or a
+    #                                               Geometry (see Geometry); its neighbors are used if it has them.
+    #   phi                         function        Function declared with the boundary condition, or an m x 1 array with its
+    #                                               values on the nodes (see Functions.Evaluate).
+    #   f                           function        Function declared with the right side of the equation, or an m x 1 array
+    #                                               with its values on the nodes.
+    #   solver                      string          Linear solver: 'dense', 'lu', 'gmres', 'bicgstab' or 'amg' (see Solvers.Solve).
+    #   stats                       bool            If True, the solver report is also returned, with the measurements of each
+    #                                               stage and the convergence history (see Profile.Report).
+    #   cache                       bool            If True, the neighbors, K and its factorization are read from the operator cache (see Cache.Cloud).
+    #   u0          m x 1           Array           Initial approximation on the interior nodes for the iterative solvers,
+    #                                               zero if None (see Interpolation.Cloud).
+    #   precision                   string          'double', or 'mixed' to factorize in float32 and refine the solution in
+    #                                               float64 (see Solvers.Solve).
     # 
     # Output parameters
     #   u_ap        m x 1           Array           Array with the approximation computed by the routine.
     #   u_ex        m x 1           Array           Array with the theoretical solution.
+    #   vec         m x nvec        Array           Array with the correspondence of the nvec neighbors of each node.
+    #   info                        dict            Solver report with the iterations, residual, whether it converged and the
+    #                                               reason to stop (only if stats is True).
 
     # Variable initialization
-    m    = len(p[:,0])                                                              # The total number of nodes is calculated.
+    report = Profile.Report() if stats else None                                    # Profiling report, only if requested.
+    xy, bnd = Geometry.Nodes(p)                                                     # The coordinates and the boundary nodes.
+    vec  = None                                                                     # A Geometry gives its own neighbors.
+    m    = len(xy)                                                                  # The total number of nodes is calculated.
     nvec = 8                                                                        # The maximum number of nodes.
     u_ap = np.zeros([m])                                                            # u_ap initialization with zeros.
-    u_ex = np.zeros([m])                                                            # u_ex initialization with zeros.
     R    = np.zeros([m])
 
     # Boundary conditions
-    for i in np.arange(m):                                                          # For all the nodes.
-        if p[i,2] == 1:                                                             # If the node is in the boundary.
-            u_ap[i]   = phi(p[i, 0], p[i, 1])                                       # The boundary condition is assigned.
+    with Profile.Stage(report, 'boundary'):
+        u_ex = Functions.Evaluate(phi, xy[:,0], xy[:,1])                            # phi is evaluated once, on all the nodes.
+        u_ap[bnd] = u_ex[bnd]                                                       # The boundary condition is assigned.
     
-    # Neighbor search for all the nodes.
-    vec = Neighbors.Cloud(p, nvec)                                                  # Neighbor search with the proper routine.
-
-    # Computation of Gamma values
+    # Neighbor search and computation of Gamma values
     L = np.vstack([[0], [0], [2], [0], [2]])                                        # The values of the differential operator are assigned.
-    K = Gammas.Cloud_K(p, vec, L)                                                   # Gamma computation.
+    factor = None                                                                   # The factorization is computed by the solver.
+    if cache:                                                                       # If the operator cache is used.
+        with Profile.Stage(report, 'cache'):
+            vec, Gamma, K, key = Cache.Cloud(p, L, nvec)                            # Neighbors and K, computed or read.
+            if solver == 'lu':                                                      # If the sparse LU is used.
+                factor = Cache.Factor(key, K, precision)                            # The factorization is computed only once.
+    else:                                                                           # If the operator is computed.
+        with Profile.Stage(report, 'neighbors'):
+            if not Geometry.Has_Neighbors(p):                                       # If the Geometry has no neighbors.
+                vec = Neighbors.Cloud(p, nvec)                                      # Neighbor search with the proper routine.
+        with Profile.Stage(report, 'gammas'):
+            Gamma = Gammas.Cloud(p, vec, L)                                         # Gamma computation.
+        with Profile.Stage(report, 'assembly'):
+            sparse = solver != 'dense' or precision == 'mixed'                      # The mixed dense solve starts from CSR.
+            K     = Gammas.Assemble_Cloud(p, vec, Gamma, sparse = sparse)           # K matrix assembly.
 
     # R computation
-    for i in np.arange(m):
-        if p[i,2] == 0:
-            R[i] += f(p[i, 0], p[i, 1])
-        if p[i,2] == 1:
-            R   -= K[:,i]*phi(p[i,0], p[i,1])
-            R[i] += phi(p[i,0], p[i,1])
+    with Profile.Stage(report, 'rhs'):
+        R[~bnd] = Functions.Evaluate(f, xy[:,0], xy[:,1])[~bnd]                     # f is evaluated once, on all the nodes.
+        R = R - K@u_ap + u_ap                                                       # The boundary values are moved to the right side.
     
     # A Generalized Finite Differences Method
-    K = np.linalg.pinv(K)
-    un  = K@R
-    for i in np.arange(m):                                                          # For all the nodes.
-        if p[i,2] == 0:                                                             # If the node is an inner node.
-            u_ap[i] = un[i]                                                         # Save the computed solution.
+    with Profile.Stage(report, 'solve'):
+        x0 = None                                                                   # Initial approximation of the solver.
+        if u0 is not None:                                                          # If there is an initial approximation.
+            x0 = np.where(bnd, 0, u0)                                               # The boundary rows were eliminated.
+        un, info = Solvers.Solve(K, R, solver, factor = factor, callback = Profile.History(report), \
+                                 x0 = x0, precision = precision)                    # The system is solved.
+        u_ap[~bnd] = un[~bnd]                                                       # Save the computed solution on the inner nodes.
     
-    # Theoretical Solution
-    u_ex = phi(p[:,0], p[:,1])                                                      # The theoretical solution is computed.
+    if vec is None:                                                                 # The neighbors of the Geometry, as vec.
+        vec = p.Vec()
+    if stats:                                                                       # If the solver report was requested.
+        info.update(report)                                                         # The measurements are added.
+        return u_ap, u_ex, vec, info
+    return u_ap, u_ex, vec
+
+class Mesh_Solver:
+    # 2D Poisson Equation solver for many right sides in Logically Rectangular Meshes.
+    # 
+    # This object assembles and factorizes the K matrix of a logically rectangular mesh only once, and then solves Poisson's equation
+    # for any number of boundary conditions and right sides. All the right sides of a batch are solved with a single blocked
+    # back-substitution.
+    # 
+    # Input parameters
+    #   x           m x n           Array               Array with the coordinates in x of the nodes.
+    #   y           m x n           Array               Array with the coordinates in y of the nodes.
+    #   cache                       bool                If True, K and its factorization are read from the operator cache (see Cache.Mesh).
+    #   precision                   string              'double', or 'mixed' to factorize in float32 and refine the solutions in
+    #                                                   float64 (see Solvers.Solve).
+
+    def __init__(self, x, y, cache = False, precision = 'double'):
+        L = np.vstack([[0], [0], [2], [0], [2]])                                    # The values of the differential operator are assigned.
+        if cache:                                                                   # If the operator cache is used.
+            Gamma, K, key = Cache.Mesh(x, y, L)                                     # Gamma computation, or reading.
+            self.factor = Cache.Factor(key, K, precision)                           # The factorization is computed only once.
+        else:                                                                       # If the operator is computed.
+            K = Gammas.Assemble_Mesh(Gammas.Mesh(x, y, L), sparse = True)           # K matrix assembly.
+            self.factor = Solvers.Factor(K, precision)                              # K is factorized.
+        self.x = x                                                                  # Coordinates in x of the nodes.
+        self.y = y                                                                  # Coordinates in y of the nodes.
+        self.K = K                                                                  # K matrix.
+        self.precision = precision                                                  # Precision of the factorization.
+
+    def Solve_RHS(self, R):
+        # Solution of K un = R for a matrix R with a right hand side on each column.
+        # 
+        # Input parameters
+        #   R           mn x nrhs       Array               Right hand sides of the system, with the nodes numbered as i + j*m.
+        # 
+        # Output parameters
+        #   un          mn x nrhs       Array               Solutions of the system.
+
+        if self.precision == 'mixed':                                               # Refined in float64.
+            return Solvers.Refine(self.K, R, lambda r: Solvers.Apply(self.factor, r))[0]
+        return self.factor.solve(np.asarray(R, dtype=float))                        # Blocked back-substitution.
+
+    def Solve_Batch(self, problems):
+        # Solution of Poisson's equation for a batch of problems.
+        # 
+        # Input parameters
+        #   problems                    list                List of (phi, f) pairs with the boundary condition and the right side.
+        # 
+        # Output parameters
+        #   u_ap        m x n x nrhs    Array               Array with the approximations computed by the routine.
+        #   u_ex        m x n x nrhs    Array               Array with the theoretical solutions.
+
+        m, n = self.x.shape                                                         # The size of the mesh.
+        u_ex = np.stack([Functions.Evaluate(phi, self.x, self.y) for phi, f in problems], axis=2)
+        R    = np.column_stack([Gammas.R_Mesh(self.x, self.y, u_ex[:,:,k], f) for k, (phi, f) in enumerate(problems)])
+        un   = self.Solve_RHS(R)                                                    # All the systems are solved at once.
+        u_ap = un.reshape([n, m, -1]).transpose([1, 0, 2]).copy()                   # The nodes are numbered as i + j*m.
+        u_ap[0,:,:] = u_ex[0,:,:]                                                   # The boundary conditions are assigned.
+        u_ap[m-1,:,:] = u_ex[m-1,:,:]
+        u_ap[:,0,:] = u_ex[:,0,:]
+        u_ap[:,n-1,:] = u_ex[:,n-1,:]
+        return u_ap, u_ex
+
+    def Solve(self, phi, f):
+        # Solution of Poisson's equation for a single problem.
+        # 
+        # Input parameters
+        #   phi                         function            Function declared with the boundary condition, or an m x n array with
+        #                                                   its values on the nodes (see Functions.Evaluate).
+        #   f                           function            Function declared with the right side of the equation, or an m x n
+        #                                                   array with its values on the nodes.
+        # 
+        # Output parameters
+        #   u_ap        m x n           Array               Array with the approximation computed by the routine.
+        #   u_ex        m x n           Array               Array with the theoretical solution.
+
+        u_ap, u_ex = self.Solve_Batch([(phi, f)])                                   # A batch with a single problem.
+        return u_ap[:,:,0], u_ex[:,:,0]
+
+class Cloud_Solver:
+    # 2D Poisson Equation solver for many right sides in unstructured clouds of points and triangulations.
+    # 
+    # This object finds the neighbors, assembles and factorizes the K matrix only once, and then solves Poisson's equation for any
+    # number of boundary conditions and right sides. All the right sides of a batch are solved with a single blocked
+    # back-substitution.
+    # 
+    # Input parameters
+    #   p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary, or a
+    #                                               Geometry (see Geometry); its neighbors are used if it has them.
+    #   tt          n x 3           Array           Array with the correspondence of the n triangles. If given, or if the Geometry
+    #                                               has them, the neighbors are found in the triangulation, otherwise in the cloud of points.
+    #   nvec                        integer         Maximum number of neighbors.
+    #   cache                       bool            If True, the neighbors, K and its factorization are read from the operator cache (see Cache.Cloud).
+    #   precision                   string          'double', or 'mixed' to factorize in float32 and refine the solutions in
+    #                                               float64 (see Solvers.Solve).
+
+    def __init__(self, p, tt = None, nvec = 8, cache = False, precision = 'double'):
+        L = np.vstack([[0], [0], [2], [0], [2]])                                    # The values of the differential operator are assigned.
+        if isinstance(p, Geometry.Geometry) and tt is None:                         # The triangles of the Geometry.
+            tt = p.tt
+        xy, bnd = Geometry.Nodes(p)                                                 # The coordinates and the boundary nodes.
+        vec     = None                                                              # A Geometry gives its own neighbors.
+        if cache:                                                                   # If the operator cache is used.
+            vec, Gamma, K, key = Cache.Cloud(p, L, nvec, tt)                        # Neighbors and K, computed or read.
+            self.factor = Cache.Factor(key, K, precision)                           # The factorization is computed only once.
+        else:                                                                       # If the operator is computed.
+            known = Geometry.Has_Neighbors(p)                                       # If the Geometry has neighbors.
+            if not known and tt is None:                                            # Cloud of points.
+                vec = Neighbors.Cloud(p, nvec)                                      # Neighbor search with the proper routine.
+            elif not known:                                                         # Triangulation.
+                vec = Neighbors.Triangulation(p, tt, nvec)                          # Neighbor search with the proper routine.
+            K = Gammas.Cloud_K(p, vec, L, sparse = True)                            # Gamma computation.
+            self.factor = Solvers.Factor(K, precision)                              # K is factorized.
+        self.xy    = xy                                                             # Coordinates of the nodes.
+        self.vec   = p.Vec() if vec is None else vec                                # Neighbors of each node.
+        self.K     = K                                                              # K matrix.
+        self.precision = precision                                                  # Precision of the factorization.
+        self.inner = np.flatnonzero(~bnd)                                           # The inner nodes.
+        self.bnd   = np.flatnonzero(bnd)                                            # The boundary nodes.
+
+    def Solve_RHS(self, R):
+        # Solution of K un = R for a matrix R with a right hand side on each column.
+        # 
+        # Input parameters
+        #   R           m x nrhs        Array           Right hand sides of the system, with the boundary values already eliminated.
+        # 
+        # Output parameters
+        #   un          m x nrhs        Array           Solutions of the system.
+
+        if self.precision == 'mixed':                                               # Refined in float64.
+            return Solvers.Refine(self.K, R, lambda r: Solvers.Apply(self.factor, r))[0]
+        return self.factor.solve(np.asarray(R, dtype=float))                        # Blocked back-substitution.
+
+    def Solve_Batch(self, problems):
+        # Solution of Poisson's equation for a batch of problems.
+        # 
+        # Input parameters
+        #   problems                    list            List of (phi, f) pairs with the boundary condition and the right side.
+        # 
+        # Output parameters
+        #   u_ap        m x nrhs        Array           Array with the approximations computed by the routine.
+        #   u_ex        m x nrhs        Array           Array with the theoretical solutions.
+
+        m    = len(self.xy)                                                         # The total number of nodes.
+        u_ap = np.zeros([m, len(problems)])                                         # u_ap initialization with zeros.
+        u_ex = np.zeros([m, len(problems)])                                         # u_ex initialization with zeros.
+        R    = np.zeros([m, len(problems)])                                         # R initialization with zeros.
+        for k, (phi, f) in enumerate(problems):                                     # For each of the problems.
+            u_ex[:,k] = Functions.Evaluate(phi, self.xy[:,0], self.xy[:,1])         # phi is evaluated once, on all the nodes.
+            u_ap[self.bnd,k]   = u_ex[self.bnd,k]                                   # The boundary condition is assigned.
+            R[self.inner,k]    = Functions.Evaluate(f, self.xy[:,0], self.xy[:,1])[self.inner]
+        R  = R - self.K@u_ap + u_ap                                                 # The boundary values are moved to the right side.
+        un = self.Solve_RHS(R)                                                      # All the systems are solved at once.
+        u_ap[self.inner,:] = un[self.inner,:]                                       # Save the computed solution.
+        return u_ap, u_ex
+
+    def Solve(self, phi, f):
+        # Solution of Poisson's equation for a single problem.
+        # 
+        # Input parameters
+        #   phi                         function        Function declared with the boundary condition, or an m x 1 array with
+        #                                               its values on the nodes (see Functions.Evaluate).
+        #   f                           function        Function declared with the right side of the equation, or an m x 1
+        #                                               array with its values on the nodes.
+        # 
+        # Output parameters
+        #   u_ap        m x 1           Array           Array with the approximation computed by the routine.
+        #   u_ex        m x 1           Array           Array with the theoretical solution.
 
-    return u_ap, u_ex, vec
\ No newline at end of file
+        u_ap, u_ex = self.Solve_Batch([(phi, f)])                                   # A batch with a single problem.
+        return u_ap[:,0], u_ex[:,0]
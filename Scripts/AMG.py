@@ -0,0 +1,238 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+# Algebraic multigrid
+# Smoothed aggregation for the sparse K matrices of clouds of points and triangulations, which have no grid hierarchy.
+# The nodes are grouped in aggregates of strongly connected nodes, the tentative prolongator is constant on each aggregate and it
+# is smoothed with a damped Jacobi step. The coarse matrices are the Galerkin products R K P with R = P^T.
+# The hierarchies are cached by a hash of K, so repeated solves on the same cloud skip the setup.
+
+import numpy as np
+from collections import OrderedDict
+from scipy.sparse import csr_matrix, diags, eye
+from scipy.sparse.linalg import LinearOperator
+import Scripts.Solvers as Solvers
+from Scripts.Cache import Key
+
+Hierarchies     = OrderedDict()                                                     # Hierarchies already built.
+Max_Hierarchies = 8                                                                 # Maximum number of hierarchies kept in memory.
+
+def Aggregate(A, theta = 0.08):
+    """
+    Aggregate
+    Function to group the nodes in aggregates of strongly connected nodes.
+    Node j is strongly connected to node i if |a_ij| >= theta sqrt(|a_ii a_jj|), on the symmetric part of |A|.
+
+    Input:
+        A           m x m           Array           Sparse matrix of the level.
+        theta                       Real            Strength of connection threshold.
+
+    Output:
+        agg         m x 1           Array           Array with the aggregate of each node.
+        nagg                        integer         Number of aggregates.
+    """
+
+    # Strength of connection
+    m = A.shape[0]                                                                  # The size of the matrix.
+    S = abs(A)                                                                      # Absolute values of the entries.
+    S = csr_matrix((S + S.transpose())/2)                                           # Symmetric part.
+    d = np.sqrt(np.abs(A.diagonal()))                                               # Square root of the diagonal.
+    d[d == 0] = 1                                                                   # Rows without diagonal are not scaled.
+    S = diags(1/d)@S@diags(1/d)                                                     # Scaled entries.
+    S = csr_matrix(S.multiply(S >= theta))                                          # Only the strong connections are kept.
+    S.setdiag(0)                                                                    # A node is not connected to itself.
+    S.eliminate_zeros()
+    ptr, idx = S.indptr, S.indices                                                  # Strong neighbors in CSR format.
+
+    # First pass: nodes whose strong neighbors are all free start an aggregate
+    agg  = np.zeros([m], dtype=int) - 1                                             # No node is aggregated.
+    nagg = 0                                                                        # Number of aggregates.
+    for i in np.arange(m):                                                          # For each of the nodes.
+        nb = idx[ptr[i]:ptr[i+1]]                                                   # Strong neighbors of the node.
+        if agg[i] == -1 and len(nb) > 0 and (agg[nb] == -1).all():                  # If the node and its neighbors are free.
+            agg[i]  = nagg                                                          # A new aggregate with the node...
+            agg[nb] = nagg                                                          # ...and its strong neighbors.
+            nagg   += 1
+
+    # Second pass: free nodes join a neighboring aggregate
+    free = np.where(agg == -1)[0]                                                   # Nodes not aggregated yet.
+    for i in free:                                                                  # For each of the free nodes.
+        nb = idx[ptr[i]:ptr[i+1]]                                                   # Strong neighbors of the node.
+        nb = nb[agg[nb] != -1]                                                      # Neighbors already aggregated.
+        if len(nb) > 0:                                                             # If there is a neighboring aggregate.
+            agg[i] = agg[nb[0]]                                                     # The node joins it.
+
+    # Third pass: the remaining nodes are aggregates on their own
+    free = np.where(agg == -1)[0]                                                   # Nodes still not aggregated.
+    agg[free] = nagg + np.arange(len(free))                                         # Each one is a new aggregate.
+    nagg     += len(free)
+
+    return agg, nagg
+
+def Radius(A, it = 15):
+    """
+    Radius
+    Function to estimate the spectral radius of a sparse matrix with a few power iterations.
+
+    Input:
+        A           m x m           Array           Sparse matrix.
+        it                          integer         Number of power iterations.
+
+    Output:
+        rho                         Real            Estimation of the spectral radius.
+    """
+
+    v   = np.random.default_rng(0).random(A.shape[0])                               # Random starting vector.
+    rho = 0                                                                         # rho initialization with zero.
+    for k in range(it):                                                             # For each of the power iterations.
+        w   = A@v                                                                   # The matrix is applied.
+        rho = np.linalg.norm(w)/np.linalg.norm(v)                                   # Growth of the vector.
+        if rho == 0:                                                                # If the vector is in the kernel.
+            break
+        v   = w/np.linalg.norm(w)                                                   # The vector is normalized.
+    return rho
+
+def Setup(K, theta = 0.08, max_levels = 10, max_coarse = 100):
+    """
+    Setup
+    Function to build the smoothed aggregation hierarchy of K, or to get it from the cache if it was already built.
+
+    Input:
+        K           m x m           Array           K Matrix with the computed Gammas, dense or sparse.
+        theta                       Real            Strength of connection threshold.
+        max_levels                  integer         Maximum number of levels.
+        max_coarse                  integer         Size under which a level is solved directly.
+
+    Output:
+        levels                      list            List with the matrices and operators of each level.
+        factor                      SuperLU         LU factorization of the coarsest matrix.
+    """
+
+    A   = csr_matrix(K, dtype=float)                                                # The matrix in CSR format.
+    key = Key('AMG ' + str(theta) + ' ' + str(max_levels) + ' ' + str(max_coarse), \
+              A.indptr, A.indices, A.data)                                          # The key of the matrix.
+    if key in Hierarchies:                                                          # If the hierarchy was already built.
+        Hierarchies.move_to_end(key)                                                # The hierarchy is the most recently used.
+        return Hierarchies[key]
+
+    levels = []                                                                     # The levels of the hierarchy.
+    while len(levels) < max_levels - 1 and A.shape[0] > max_coarse:                 # While the level is too big.
+        Dinv = 1/A.diagonal()                                                       # Inverse of the diagonal.
+        DA   = diags(Dinv)@A                                                        # Jacobi iteration matrix, plus the identity.
+        rho  = Radius(DA)                                                           # Its spectral radius.
+        agg, nagg = Aggregate(A, theta)                                             # Aggregates of the level.
+        if nagg >= A.shape[0]:                                                      # If the level cannot be coarsened.
+            break
+        T    = csr_matrix((np.ones(A.shape[0]), (np.arange(A.shape[0]), agg)), \
+                          shape=(A.shape[0], nagg))                                 # Tentative prolongator.
+        T    = T@diags(1/np.sqrt(np.asarray(T.sum(axis=0)).ravel()))                # The columns are normalized.
+        P    = csr_matrix((eye(A.shape[0]) - (4/3)/rho*DA)@T)                       # Smoothed prolongator.
+        R    = csr_matrix(P.transpose())                                            # Restriction.
+        levels.append({'A': A, 'Dinv': Dinv, 'omega': (4/3)/rho, 'P': P, 'R': R})   # The level is stored.
+        A    = csr_matrix(R@A@P)                                                    # Galerkin coarse matrix.
+    levels.append({'A': A})                                                         # The coarsest level.
+    factor = Solvers.Factor(A)                                                      # The coarsest matrix is factorized.
+
+    Hierarchies[key] = (levels, factor)                                             # The hierarchy is cached.
+    while len(Hierarchies) > Max_Hierarchies:                                       # While there are too many hierarchies.
+        Hierarchies.popitem(last=False)                                             # The least recently used one is discarded.
+    return levels, factor
+
+def Cycle(levels, factor, b, x = None, l = 0, nu = 2):
+    """
+    Cycle
+    Function to apply a V-cycle from level l to the coarsest one, with damped Jacobi smoothing.
+
+    Input:
+        levels                      list            List with the matrices and operators of each level.
+        factor                      SuperLU         LU factorization of the coarsest matrix.
+        b           m x 1           Array           Right hand side on level l.
+        x           m x 1           Array           Initial approximation on level l, zero if not given.
+        l                           integer         Level to start the cycle.
+        nu                          integer         Number of smoothing sweeps before and after the coarse correction.
+
+    Output:
+        x           m x 1           Array           Improved approximation on level l.
+    """
+
+    if l == len(levels) - 1:                                                        # If this is the coarsest level.
+        return factor.solve(b)                                                      # Direct solution.
+    lev = levels[l]                                                                 # The operators of the level.
+    A   = lev['A']                                                                  # The matrix of the level.
+    w   = lev['omega']*lev['Dinv']                                                  # Damped inverse of the diagonal.
+    if x is None:                                                                   # If there is no initial approximation.
+        x = w*b                                                                     # First Jacobi sweep from zero.
+        k = 1
+    else:
+        x = x.copy()                                                                # The approximation is copied.
+        k = 0
+    for k in range(k, nu):                                                          # Pre-smoothing.
+        x += w*(b - A@x)
+    xc = Cycle(levels, factor, lev['R']@(b - A@x), None, l + 1, nu)                 # The coarse correction.
+    x += lev['P']@xc                                                                # The correction is added.
+    for k in range(nu):                                                             # Post-smoothing.
+        x += w*(b - A@x)
+    return x
+
+def Preconditioner(K):
+    """
+    Preconditioner
+    Function to build an operator that applies one V-cycle, to be used as a preconditioner in a Krylov method.
+
+    Input:
+        K           m x m           Array           K Matrix with the computed Gammas, dense or sparse.
+
+    Output:
+        M                           LinearOperator  One V-cycle from a zero initial approximation.
+    """
+
+    levels, factor = Setup(K)                                                       # The hierarchy of K.
+    return LinearOperator(K.shape, lambda b: Cycle(levels, factor, np.ravel(b)))
+
+def Solve(K, R, tol = 1e-10, m_it = 100, x = None, callback = None):
+    """
+    Solve
+    Function to solve the linear system K un = R with algebraic multigrid V-cycles as a standalone solver.
+
+    Input:
+        K           m x m           Array           K Matrix with the computed Gammas, dense or sparse.
+        R           m x 1           Array           Right hand side of the system.
+        tol                         Real            Tolerance for the residual, relative to the right hand side.
+        m_it                        integer         Maximum number of V-cycles.
+        x           m x 1           Array           Initial approximation, zero if not given.
+        callback                    function        Function called with the relative residual after each V-cycle.
+
+    Output:
+        un          m x 1           Array           Solution of the system.
+        iter                        integer         Number of V-cycles.
+    """
+
+    levels, factor = Setup(K)                                                       # The hierarchy of K.
+    A    = levels[0]['A']                                                           # K in CSR format.
+    R    = np.asarray(R, dtype=float).ravel()                                       # The right hand side as a vector.
+    nR   = np.linalg.norm(R)                                                        # Norm of the right hand side.
+    un   = np.zeros(len(R)) if x is None else np.array(x, dtype=float)              # Initial approximation.
+    iter = 0                                                                        # Number of iterations.
+    res  = np.linalg.norm(R - A@un)                                                 # Norm of the residual.
+    while res > tol*nR and iter < m_it:                                             # Check for iterations and tolerance.
+        un    = Cycle(levels, factor, R, un)                                        # One V-cycle.
+        res   = np.linalg.norm(R - A@un)                                            # Norm of the residual.
+        iter += 1                                                                   # 1 is added to the number of iterations.
+        if callback is not None:                                                    # If the history is requested.
+            callback(res/nR if nR > 0 else res)
+    return un, iter
@@ -0,0 +1,282 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+# Benchmark
+# Each case runs a routine of Poisson_2D with its profiling report on, so the stages measured are the ones of the routine itself
+# (see Profile) and not a copy of its pipeline: boundary conditions, neighbor search, Gammas, assembly of K, right hand side and
+# solution. The reading of the region and the errors are measured around the routine. Every stage is timed and, in a second run
+# under tracemalloc, its peak memory is measured, so the tracing does not slow down the timings. The in-memory caches are emptied
+# before each run, so every stage is measured cold.
+
+import os
+import json
+import time
+import tracemalloc
+import numpy as np
+import Poisson_2D
+import Scripts.AMG as AMG
+import Scripts.Cache as Cache
+import Scripts.Errors as Errors
+import Scripts.Store as Store
+
+Kinds = ['Mesh', 'Mesh_K', 'Triangulation', 'Cloud', 'Cloud_K']                     # Routines of Poisson_2D.
+
+def phi(x, y):
+    return 2*np.exp(2*x+y)                                                          # Boundary condition of the benchmark.
+
+def f(x, y):
+    return 10*np.exp(2*x+y)                                                         # Right side of the benchmark.
+
+def Reset():
+    """
+    Reset
+    Function to empty the in-memory caches, so the next stage is measured cold.
+    """
+
+    Errors.Areas.clear()                                                            # Areas of the error norms.
+    AMG.Hierarchies.clear()                                                         # Algebraic multigrid hierarchies.
+    Cache.Factors.clear()                                                           # LU factorizations.
+
+def Measure(stages, name, fun, *args, repeat = 1, memory = True):
+    """
+    Measure
+    Function to run a stage, storing its wall time and peak memory.
+
+    Input:
+        stages                      dict            Measurements of the case, the stage is added.
+        name                        string          Name of the stage.
+        fun                         function        Function of the stage.
+        args                                        Arguments of the function.
+        repeat                      integer         Number of timed runs, the fastest one is kept.
+        memory                      bool            If True, the peak memory is measured in one more run.
+
+    Output:
+        out                                         Output of the function.
+    """
+
+    best = np.inf                                                                   # Fastest run.
+    for r in range(repeat):                                                         # For each of the timed runs.
+        Reset()
+        t0   = time.perf_counter()
+        out  = fun(*args)                                                           # The stage is run.
+        best = min(best, time.perf_counter() - t0)
+    stages[name] = {'time': best}
+    if memory:                                                                      # If the memory is measured.
+        Reset()
+        tracemalloc.start()
+        fun(*args)                                                                  # The stage is run again.
+        stages[name]['memory'] = tracemalloc.get_traced_memory()[1]                 # Peak memory in bytes.
+        tracemalloc.stop()
+    return out
+
+def Read(kind, region, size):
+    """
+    Read
+    Function to open a region of the store and read all its arrays, so the stage measures the reading from disk and not only the
+    opening of the memory maps.
+
+    Input:
+        kind                        string          'Meshes' or 'Clouds'.
+        region                      string          Name of the region.
+        size                        string          Size of the region.
+
+    Output:
+        mat                         dict            Dict with the arrays of the region, as memory maps.
+    """
+
+    mat = Store.Load(kind, region, size)
+    for value in mat.values():                                                      # Every page of each array is read.
+        np.asarray(value).sum()
+    return mat
+
+def Run(kind, mat):
+    """
+    Run
+    Function to solve a case with its routine of Poisson_2D, with the profiling report on.
+
+    Input:
+        kind                        string          Routine: 'Mesh', 'Mesh_K', 'Triangulation', 'Cloud' or 'Cloud_K'.
+        mat                         dict            Dict with the arrays of the region.
+
+    Output:
+        u_ap                        Array           Array with the computed solution.
+        u_ex                        Array           Array with the theoretical solution.
+        vec                         Array           Array with the neighbors of each node, None for a mesh.
+        info                        dict            Solver report with the measurements of each stage (see Profile.Report).
+    """
+
+    if kind == 'Mesh':
+        u_ap, u_ex, info = Poisson_2D.Mesh(mat['x'], mat['y'], phi, f, stats = True)
+        return u_ap, u_ex, None, info
+    if kind == 'Mesh_K':
+        u_ap, u_ex, info = Poisson_2D.Mesh_K(mat['x'], mat['y'], phi, f, stats = True)
+        return u_ap, u_ex, None, info
+    if kind == 'Triangulation':
+        return Poisson_2D.Triangulation(mat['p'], mat['tt'], phi, f, stats = True)
+    if kind == 'Cloud':
+        return Poisson_2D.Cloud(mat['p'], phi, f, stats = True)
+    if kind == 'Cloud_K':
+        return Poisson_2D.Cloud_K(mat['p'], phi, f, stats = True)
+    raise ValueError('Unknown routine: ' + str(kind))
+
+def Case(kind, region, size, repeat = 1, memory = True):
+    """
+    Case
+    Function to measure a routine of Poisson_2D on a region, stage by stage.
+
+    Input:
+        kind                        string          Routine: 'Mesh', 'Mesh_K', 'Triangulation', 'Cloud' or 'Cloud_K'.
+        region                      string          Name of the region.
+        size                        string          Size of the region.
+        repeat                      integer         Number of timed runs of each stage.
+        memory                      bool            If True, the peak memory of each stage is measured.
+
+    Output:
+        record                      dict            Measurements of the case.
+    """
+
+    stages = {}                                                                     # Measurements of each stage.
+    opts   = {'repeat': repeat, 'memory': memory}
+    folder = 'Meshes' if kind in ('Mesh', 'Mesh_K') else 'Clouds'                   # Logically rectangular meshes or clouds.
+    mat    = Measure(stages, 'load', Read, folder, region, size, **opts)
+
+    for r in range(repeat):                                                         # For each of the timed runs.
+        Reset()
+        u_ap, u_ex, vec, info = Run(kind, mat)                                      # The routine measures its own stages.
+        for name, s in info['stages'].items():                                      # The fastest run of each stage is kept.
+            stages[name] = {'time': min(s['time'], stages.get(name, {'time': np.inf})['time'])}
+    if memory:                                                                      # If the memory is measured.
+        Reset()
+        tracemalloc.start()
+        try:
+            traced = Run(kind, mat)[-1]                                             # The routine is run again.
+        finally:
+            tracemalloc.stop()
+        for name, s in traced['stages'].items():                                    # Peak memory of each stage in bytes.
+            stages[name]['memory'] = s['memory']
+
+    if vec is None:                                                                 # Logically rectangular mesh.
+        Measure(stages, 'errors', Errors.Mesh, mat['x'], mat['y'], u_ap, u_ex, **opts)
+    else:                                                                           # Triangulation or cloud of points.
+        Measure(stages, 'errors', Errors.Cloud, mat['p'], vec, u_ap, u_ex, **opts)
+
+    record = {'kind': kind, 'region': region, 'size': size, 'nodes': int(np.size(u_ap)), 'iterations': int(info['iterations']), \
+              'time': sum(s['time'] for s in stages.values()), 'stages': stages}
+    if memory:                                                                      # The largest peak of all the stages.
+        record['memory'] = max(s['memory'] for s in stages.values())
+    return record
+
+def Suite(regions, sizes, kinds = Kinds, repeat = 1, memory = True):
+    """
+    Suite
+    Function to measure every routine on every region and size.
+
+    Input:
+        regions                     list            Names of the regions.
+        sizes                       list            Sizes of the regions.
+        kinds                       list            Routines of Poisson_2D to measure.
+        repeat                      integer         Number of timed runs of each stage.
+        memory                      bool            If True, the peak memory of each stage is measured.
+
+    Output:
+        results                     list            Measurements of each case.
+    """
+
+    results = []
+    for kind in kinds:                                                              # For each of the routines.
+        for region in regions:                                                      # For each of the regions.
+            for size in sizes:                                                      # For each of the sizes.
+                results.append(Case(kind, region, size, repeat, memory))
+                r = results[-1]
+                print('%-13s %s_%s %7d nodes %8.3f s %6d it' % (kind, region, size, r['nodes'], r['time'], r['iterations']))
+    return results
+
+def Save(results, name):
+    """
+    Save
+    Function to write the measurements to a JSON file.
+
+    Input:
+        results                     list            Measurements of each case.
+        name                        string          Name of the file.
+    """
+
+    os.makedirs(os.path.dirname(name) or '.', exist_ok = True)
+    with open(name, 'w') as file:
+        json.dump(results, file, indent = 1)
+
+def Load(name):
+    """
+    Load
+    Function to read the measurements from a JSON file.
+
+    Input:
+        name                        string          Name of the file.
+
+    Output:
+        results                     list            Measurements of each case.
+    """
+
+    with open(name) as file:
+        return json.load(file)
+
+def Compare(results, baseline, threshold = 0.1):
+    """
+    Compare
+    Function to compare the measurements against a baseline, stage by stage.
+
+    Input:
+        results                     list            Measurements of each case.
+        baseline                    list            Measurements of the baseline.
+        threshold                   Real            Relative change over which a stage is reported as a regression.
+
+    Output:
+        changes                     list            List with (kind, region, size, stage, quantity, old, new, change) for every
+                                                    stage found in both, the change is relative to the baseline.
+        regressions                 list            The changes larger than the threshold.
+    """
+
+    base    = {(r['kind'], r['region'], r['size']): r for r in baseline}            # The baseline cases by name.
+    changes = []
+    for r in results:                                                               # For each of the cases.
+        b = base.get((r['kind'], r['region'], r['size']))
+        if b is None:                                                               # The case is not in the baseline.
+            continue
+        for stage, s in r['stages'].items():                                        # For each of the stages.
+            for q in ('time', 'memory'):                                            # For each of the quantities.
+                old = b['stages'].get(stage, {}).get(q)
+                if old is None or q not in s:                                       # The quantity was not measured.
+                    continue
+                change = (s[q] - old)/old if old > 0 else 0.0
+                changes.append((r['kind'], r['region'], r['size'], stage, q, old, s[q], change))
+    regressions = [c for c in changes if c[-1] > threshold]
+    return changes, regressions
+
+def Report(changes, threshold = 0.1):
+    """
+    Report
+    Function to print the changes against the baseline, marking the regressions.
+
+    Input:
+        changes                     list            Changes found by Compare.
+        threshold                   Real            Relative change over which a stage is reported as a regression.
+    """
+
+    for kind, region, size, stage, q, old, new, change in changes:
+        mark = '  REGRESSION' if change > threshold else ''
+        print('%-13s %s_%s %-9s %-6s %12.4g -> %12.4g %+8.1f%%%s' % (kind, region, size, stage, q, old, new, 100*change, mark))
@@ -0,0 +1,263 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+# Operator cache
+# The neighbors, the Gamma values and the assembled sparse K of each geometry are stored on disk, so a repeated run on the same
+# region skips the setup. Each entry is keyed by a hash of the coordinates, the differential operator L and the search options,
+# so a change in the geometry gives a new key and the old entry is never used again; it is eventually evicted as the least
+# recently used one.
+# SuperLU factorizations cannot be written to disk, they are kept in memory for the life of the process.
+# Several processes may share the folder: an entry is written to a temporary file and published with os.replace, so a reader
+# sees either the whole entry or none, and an entry removed by another process while it is read or evicted is just skipped.
+
+import os
+import hashlib
+import tempfile
+import numpy as np
+from collections import OrderedDict
+from scipy.sparse import csr_matrix
+import Scripts.Gammas as Gammas
+import Scripts.Geometry as Geometry
+import Scripts.Neighbors as Neighbors
+import Scripts.Solvers as Solvers
+
+Folder      = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Cache')
+Max_Entries = 64                                                                    # Maximum number of geometries stored on disk, None for no eviction.
+Max_Factors = 8                                                                     # Maximum number of factorizations kept in memory.
+Factors     = OrderedDict()                                                         # Factorizations kept in memory.
+
+def Key(kind, *arrays):
+    """
+    Key
+    Function to identify a geometry by a hash of its arrays.
+
+    Input:
+        kind                        string          Kind of geometry and any option that changes the operator.
+        arrays                      Arrays          Arrays that define the geometry.
+
+    Output:
+        key                         string          Key of the geometry.
+    """
+
+    h = hashlib.sha1(kind.encode())                                                 # The hash is initialized with the kind.
+    for a in arrays:                                                                # For each of the arrays.
+        a = np.ascontiguousarray(a)                                                 # The array as a contiguous block.
+        h.update(str(a.shape).encode() + str(a.dtype).encode())                     # Its shape and type.
+        h.update(a.tobytes())                                                       # Its values.
+    return h.hexdigest()
+
+def Load(key):
+    """
+    Load
+    Function to read an entry of the cache from disk.
+
+    Input:
+        key                         string          Key of the geometry.
+
+    Output:
+        data                        dict            Arrays of the entry, None if the entry is not in the cache.
+    """
+
+    name = os.path.join(Folder, key + '.npz')                                       # The file of the entry.
+    try:
+        with np.load(name) as npz:                                                  # The entry is read.
+            data = {k: npz[k] for k in npz.files}
+    except FileNotFoundError:                                                       # If the entry is not in the cache.
+        return None
+    except (OSError, ValueError):                                                   # A damaged entry is discarded.
+        Remove(name)
+        return None
+    try:
+        os.utime(name)                                                              # The entry is the most recently used.
+    except FileNotFoundError:                                                       # Evicted meanwhile by another process.
+        pass
+    return data
+
+def Save(key, **data):
+    """
+    Save
+    Function to write an entry of the cache to disk, evicting the least recently used entries when the cache is full.
+
+    Input:
+        key                         string          Key of the geometry.
+        data                        Arrays          Arrays of the entry.
+    """
+
+    os.makedirs(Folder, exist_ok=True)                                              # The folder is created if needed.
+    name = os.path.join(Folder, key + '.npz')                                       # The file of the entry.
+    fd, temp = tempfile.mkstemp(suffix='.tmp', dir=Folder)                          # Unique, so readers never see a partial entry.
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            np.savez(file, **data)                                                  # The entry is written.
+        os.replace(temp, name)                                                      # The entry is published.
+    except BaseException:
+        Remove(temp)
+        raise
+    if Max_Entries is not None:                                                     # If the eviction is on.
+        Evict()
+
+def Evict():
+    """
+    Evict
+    Function to remove the least recently used entries over Max_Entries. Entries removed meanwhile by another process are skipped.
+    """
+
+    files = []
+    for f in os.listdir(Folder):                                                    # For each of the entries.
+        if f.endswith('.npz'):
+            try:
+                files.append((os.path.getmtime(os.path.join(Folder, f)), f))
+            except FileNotFoundError:                                               # Already evicted by another process.
+                pass
+    files.sort()                                                                    # Entries from the least to the most recently used.
+    for mtime, f in files[:max(0, len(files) - Max_Entries)]:                       # For each entry over the limit.
+        Remove(os.path.join(Folder, f))                                             # The entry is evicted.
+
+def Remove(name):
+    """
+    Remove
+    Function to remove a file of the cache that another process may have removed already.
+
+    Input:
+        name                        string          Name of the file.
+    """
+
+    try:
+        os.remove(name)
+    except FileNotFoundError:                                                       # Removed by another process.
+        pass
+
+def Clear():
+    """
+    Clear
+    Function to remove all the entries of the cache, on disk and in memory.
+    """
+
+    Factors.clear()                                                                 # The factorizations are discarded.
+    if os.path.isdir(Folder):                                                       # If the cache exists.
+        for f in os.listdir(Folder):                                                # For each of the entries.
+            if f.endswith('.npz'):
+                Remove(os.path.join(Folder, f))                                     # The entry is removed.
+
+def Sparse(data):
+    """
+    Sparse
+    Function to rebuild the sparse K matrix of a cache entry.
+
+    Input:
+        data                        dict            Arrays of the entry.
+
+    Output:
+        K           m x m           Array           K Matrix with the computed Gammas, in CSR format.
+    """
+
+    return csr_matrix((data['K_data'], data['K_indices'], data['K_indptr']), shape=tuple(data['K_shape']))
+
+def Cloud(p, L, nvec = 8, tt = None):
+    """
+    Cloud
+    Function to get the operator of a triangulation or an unstructured cloud of points, from the cache if possible.
+
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary, or a
+                                                    Geometry (see Geometry); if it has neighbors, they are used and not
+                                                    searched, and they are part of the key.
+        L           5 x 1           Array           Array with the values of the differential operator.
+        nvec                        integer         Maximum number of neighbors.
+        tt          n x 3           Array           Array with the correspondence of the n triangles. If given, the neighbors
+                                                    are found in the triangulation, otherwise in the cloud of points.
+
+    Output:
+        vec         m x nvec        Array           Array with the correspondence of the nvec neighbors of each node.
+        Gamma       m x nvec+1      Array           Array with the computed gamma values.
+        K           m x m           Array           K Matrix with the computed Gammas, in CSR format.
+        key                         string          Key of the geometry.
+    """
+
+    p, vec = Geometry.Split(p)                                                      # A Geometry is stored as loose arrays.
+    if vec is not None:                                                             # The neighbors of the Geometry.
+        key = Key('Neighbors', p, np.asarray(L, dtype=float), vec)
+    elif tt is None:                                                                # Cloud of points.
+        key = Key('Cloud ' + str(nvec), p, np.asarray(L, dtype=float))
+    else:                                                                           # Triangulation.
+        key = Key('Triangulation ' + str(nvec), p, np.asarray(L, dtype=float), tt)
+    data = Load(key)                                                                # The entry is searched on disk.
+    if data is not None:                                                            # If the operator was already computed.
+        return data['vec'], data['Gamma'], Sparse(data), key
+
+    if vec is None and tt is None:                                                  # Cloud of points.
+        vec = Neighbors.Cloud(p, nvec)                                              # Neighbor search with the proper routine.
+    elif vec is None:                                                               # Triangulation.
+        vec = Neighbors.Triangulation(p, tt, nvec)                                  # Neighbor search with the proper routine.
+    Gamma = Gammas.Cloud(p, vec, L)                                                 # Gamma computation.
+    K     = Gammas.Assemble_Cloud(p, vec, Gamma, sparse=True)                       # K matrix assembly.
+    Save(key, vec=vec, Gamma=Gamma, K_data=K.data, K_indices=K.indices, K_indptr=K.indptr, K_shape=np.array(K.shape))
+    return vec, Gamma, K, key
+
+def Mesh(x, y, L):
+    """
+    Mesh
+    Function to get the operator of a logically rectangular mesh, from the cache if possible.
+
+    Input:
+        x           m x n           Array           Array with the coordinates in x of the nodes.
+        y           m x n           Array           Array with the coordinates in y of the nodes.
+        L           5 x 1           Array           Array with the values of the differential operator.
+
+    Output:
+        Gamma       m x n x 9       Array           Array with the computed gamma values.
+        K           mn x mn         Array           K Matrix with the computed Gammas, in CSR format.
+        key                         string          Key of the geometry.
+    """
+
+    key  = Key('Mesh', x, y, np.asarray(L, dtype=float))                            # The key of the geometry.
+    data = Load(key)                                                                # The entry is searched on disk.
+    if data is not None:                                                            # If the operator was already computed.
+        return data['Gamma'], Sparse(data), key
+
+    Gamma = Gammas.Mesh(x, y, L)                                                    # Gamma computation.
+    K     = Gammas.Assemble_Mesh(Gamma, sparse=True)                                # K matrix assembly.
+    Save(key, Gamma=Gamma, K_data=K.data, K_indices=K.indices, K_indptr=K.indptr, K_shape=np.array(K.shape))
+    return Gamma, K, key
+
+def Factor(key, K, precision = 'double'):
+    """
+    Factor
+    Function to get the sparse LU factorization of K, reusing the one computed before for the same geometry.
+    The factorization is kept in memory only, for the life of the process and up to Max_Factors of them: SuperLU objects cannot
+    be written to disk, so a new process factorizes the cached K again.
+
+    Input:
+        key                         string          Key of the geometry.
+        K           m x m           Array           K Matrix with the computed Gammas.
+        precision                   string          Precision of the factorization (see Solvers.Factor), each one is kept
+                                                    apart.
+
+    Output:
+        factor                      SuperLU         LU factorization of K.
+    """
+
+    if precision != 'double':                                                       # The single precision one is kept apart.
+        key = key + '_' + precision
+    if key in Factors:                                                              # If K was already factorized.
+        Factors.move_to_end(key)                                                    # The factorization is the most recently used.
+        return Factors[key]
+    Factors[key] = Solvers.Factor(K, precision)                                     # K is factorized.
+    while len(Factors) > Max_Factors:                                               # While there are too many factorizations.
+        Factors.popitem(last=False)                                                 # The least recently used one is discarded.
+    return Factors[key]
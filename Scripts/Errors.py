@@ -17,6 +17,13 @@ Last Modification:
 """
 
 import numpy as np
+from collections import OrderedDict
+from Scripts.Cache import Key
+from Scripts.Gammas import Stencil
+import Scripts.Geometry as Geometry
+
+Areas     = OrderedDict()                                                           # Cache with the areas of each geometry.
+Max_Areas = 32                                                                      # Maximum number of geometries in the cache.
 
 def PolyArea(x,y):
     """
@@ -34,8 +41,119 @@ def PolyArea(x,y):
     area = 0.5*np.abs(np.dot(x, np.roll(y, 1)) - np.dot(y, np.roll(x, 1)))
 
     return area
- 
-def Mesh(x, y, u_ap, u_ex):
+
+def Mesh_Area(x, y):
+    """
+    Mesh_Area
+    Function to calculate the area of the polygon defined by the 8 immediate neighbors of each interior node of a logically rectangular mesh.
+    All the areas are computed at once with the shoelace formula, and they are cached for each geometry.
+    
+    Input:
+        x           m x n           Array           Array with the coordinates in x of the nodes.
+        y           m x n           Array           Array with the coordinates in y of the nodes.
+    
+    Output:
+        area        m x n           Array           Area of the polygon of each node, zero on the boundary.
+    """
+
+    key = Key('Mesh', x, y)                                                         # The key of the geometry.
+    if key in Areas:                                                                # If the areas were already computed.
+        Areas.move_to_end(key)                                                      # The geometry is the most recently used.
+        return Areas[key]
+
+    m    = len(x[:,0])                                                              # The number of nodes in x.
+    n    = len(x[0,:])                                                              # The number of nodes in y.
+    area = np.zeros([m,n])                                                          # area initialization with zeros.
+    px   = np.stack([x[1+di:m-1+di, 1+dj:n-1+dj] for di, dj in Stencil])            # The x-values of the polygons are stored.
+    py   = np.stack([y[1+di:m-1+di, 1+dj:n-1+dj] for di, dj in Stencil])            # The y-values of the polygons are stored.
+    area[1:m-1, 1:n-1] = 0.5*np.abs((px*np.roll(py, 1, axis=0)).sum(axis=0) - \
+                                    (py*np.roll(px, 1, axis=0)).sum(axis=0))        # Area computation.
+
+    return Store(key, area)
+
+def Cloud_Area(p, vec):
+    """
+    Cloud_Area
+    Function to calculate the area of the polygon defined by the neighbors of each node of a triangulation or an unstructured cloud of points.
+    All the areas are computed at once with the shoelace formula, and they are cached for each geometry.
+    
+    Input:
+        p           m x 2           Array           Array with the coordinates of the nodes, or a Geometry (see Geometry).
+        vec         m x nvec        Array           Array with the correspondence of the nvec neighbors of each node, or None
+                                                    for the ones of the Geometry.
+    
+    Output:
+        area        m x 1           Array           Area of the polygon of each node.
+    """
+
+    p, vec = Geometry.Split(p, vec)                                                 # A Geometry is given as loose arrays.
+    key = Key('Cloud', p[:,0], p[:,1], vec)                                         # The key of the geometry.
+    if key in Areas:                                                                # If the areas were already computed.
+        Areas.move_to_end(key)                                                      # The geometry is the most recently used.
+        return Areas[key]
+
+    mask  = vec != -1                                                               # The existing neighbors of each node.
+    nvec  = mask.sum(axis=1)                                                        # The number of neighbors of each node.
+    idx   = np.where(mask, vec, 0)                                                  # Padded neighbor indices.
+    polix = p[idx,0]                                                                # The x-values of the polygons are stored.
+    poliy = p[idx,1]                                                                # The y-values of the polygons are stored.
+    k     = np.arange(vec.shape[1])                                                 # The position of each vertex.
+    prev  = np.where(k == 0, nvec[:,None] - 1, k - 1)                               # The previous vertex of each polygon, closing the polygon.
+    prev  = np.maximum(prev, 0)                                                     # Nodes without neighbors have no polygon.
+    rows  = np.arange(len(vec))[:,None]                                             # The node of each vertex.
+    terms = polix*poliy[rows, prev] - poliy*polix[rows, prev]                       # Shoelace terms.
+    area  = 0.5*np.abs(np.where(mask, terms, 0).sum(axis=1))                        # Area computation.
+
+    return Store(key, area)
+
+def Store(key, area):
+    """
+    Store
+    Function to keep the areas of a geometry in the cache, discarding the least recently used geometry when the cache is full.
+    
+    Input:
+        key                         string          Key of the geometry.
+        area                        Array           Areas of the geometry.
+    
+    Output:
+        area                        Array           Areas of the geometry.
+    """
+
+    area.flags.writeable = False                                                    # The cached areas are shared, so they are read only.
+    Areas[key] = area                                                               # The areas are stored.
+    while len(Areas) > Max_Areas:                                                   # While the cache is too big.
+        Areas.popitem(last=False)                                                   # The least recently used geometry is discarded.
+    return area
+
+def Norms(area, u_ap, u_ex):
+    """
+    Norms
+    Function to compute the norms of the error with the areas of the nodes as quadrature weights.
+    If the solutions have more dimensions than area, as in problems that depend on time, a norm is computed for each of the extra entries.
+    
+    Input:
+        area        m x n           Array           Area of the polygon of each node.
+        u_ap        m x n x t       Array           Array with the computed solution.
+        u_ex        m x n x t       Array           Array with the theoretical solution.
+    
+    Output:
+        er          t x 1           Array           Mean square error.
+        er_inf      t x 1           Array           Maximum absolute error.
+        er_rel      t x 1           Array           Mean square error relative to the mean square norm of the theoretical solution.
+    """
+
+    u_ap   = np.asarray(u_ap)                                                       # The computed solution as an array.
+    u_ex   = np.asarray(u_ex)                                                       # The theoretical solution as an array.
+    axes   = tuple(range(area.ndim))                                                # The axes of the nodes.
+    w      = area.reshape(area.shape + (1,)*(u_ap.ndim - area.ndim))                # The weights broadcast over the extra axes.
+    er     = np.sqrt((w*(u_ap - u_ex)**2).sum(axis=axes))                           # Mean square error computation.
+    er_inf = np.abs(u_ap - u_ex).max(axis=axes)                                     # Maximum error computation.
+    nr     = np.sqrt((w*u_ex**2).sum(axis=axes))                                    # Mean square norm of the theoretical solution.
+    er_rel = er/np.where(nr > 0, nr, 1)                                             # Relative error computation.
+
+    return er, er_inf, er_rel
+
+def Mesh(x, y, u_ap, u_ex, norms = False):
     """
     Mesh_Transient
     Function to compute the error in a logically rectangular mesh for a problem that depends on time.
@@ -46,65 +164,38 @@ def Mesh(x, y, u_ap, u_ex):
         y           m x n           Array           Array with the coordinates in y of the nodes.
         u_ap        m x n x t       Array           Array with the computed solution.
         u_ex        m x n x t       Array           Array with the theoretical solution.
+        norms                       bool            If True, the maximum and relative errors are also returned (see Norms).
     
     Output:
         er          t x 1           Array           Mean square error computed on each time step.
     """
 
-    m = len(x[:,0])                                                                 # The number of nodes in x.
-    n = len(x[0,:])                                                                 # The number of nodes in y.
-    er   = 0                                                                        # er initialization with 0.
-    area = np.zeros([m,n])                                                          # area initialization with zeros.
+    area = Mesh_Area(x, y)                                                          # Area computation.
+    er   = Norms(area, u_ap, u_ex)                                                  # Error computation.
+    if norms:                                                                       # If all the norms were requested.
+        return er
+    return er[0]
 
-    for i in np.arange(1,m-1):                                                      # For each of the nodes on the x axis.
-        for j in np.arange(1,n-1):                                                  # For each of the nodes on the y axis.
-            px = np.array([x[i+1, j], x[i+1, j+1], x[i, j+1], x[i-1, j+1], \
-                           x[i-1, j], x[i-1, j-1], x[i, j-1], x[i+1, j-1]])         # The x-values of the polygon are stored.
-            py = np.array([y[i+1, j], y[i+1, j+1], y[i, j+1], y[i-1, j+1], \
-                           y[i-1, j], y[i-1, j-1], y[i, j-1], y[i+1, j-1]])         # The y-values of the polygon are stored.
-            area[i,j] = PolyArea(px,py)                                             # Area computation.
-
-    for i in np.arange(m):                                                          # For each of the nodes on the x axis.
-        for j in np.arange(n):                                                      # For each of the nodes on the y axis.
-            er = er + area[i,j]*(u_ap[i,j] - u_ex[i,j])**2                          # Mean square error computation.
-    
-    er = np.sqrt(er)                                                                # The square root is computed.
-    
-    return er
-
-def Cloud(p, vec, u_ap, u_ex):
+def Cloud(p, vec, u_ap, u_ex, norms = False):
     """
     Cloud
     Function to compute the error in a triangulation or an unstructured cloud of points for a problem that depends on time.
     The polygon used to calculate the area is the one defined by all the immediate neighbors of the central node.
     
     Input:
-        p           m x 2           Array           Array with the coordinates of the nodes.
-        vec         m x nvec        Array           Array with the correspondence of the nvec neighbors of each node.
+        p           m x 2           Array           Array with the coordinates of the nodes, or a Geometry (see Geometry).
+        vec         m x nvec        Array           Array with the correspondence of the nvec neighbors of each node, or None
+                                                    for the ones of the Geometry.
         u_ap        m x t           Array           Array with the computed solution.
         u_ex        m x t           Array           Array with the theoretical solution.
+        norms                       bool            If True, the maximum and relative errors are also returned (see Norms).
     
     Output:
         er          t x 1           Array           Mean square error computed on each time step.
     """
 
-    m    = len(p[:,0])                                                              # The total number of nodes is calculated.
-    er   = 0                                                                        # er initialization with 0.
-    area = np.zeros(m)                                                              # area initialization with zeros.
-
-    for i in np.arange(m):
-        nvec = sum(vec[i,:] != -1)                                                  # The number of neighbors of the central node.
-        polix = np.zeros([nvec])                                                    # The x-values of the polygon are stored.
-        poliy = np.zeros([nvec])                                                    # The y-values of the polygon are stored.
-        for j in np.arange(nvec):                                                   # For each of the neighbor nodes.
-            vec1 = int(vec[i,j])                                                    # The index of the node is found.
-            polix[j] = p[vec1,0]                                                    # The x coordinate of the node is stored.
-            poliy[j] = p[vec1,1]                                                    # The y coordinate of the node is stored.
-        area[i] = PolyArea(polix, poliy)                                            # Area computation.
-
-    for i in np.arange(m):                                                          # For each of the nodes.
-        er = er + area[i]*(u_ap[i] - u_ex[i])**2                                    # Mean square error computation.
-
-    er = np.sqrt(er)                                                                # The square root is computed.
-    
-    return er
\ No newline at end of file
+    area = Cloud_Area(p, vec)                                                       # Area computation.
+    er   = Norms(area, u_ap, u_ex)                                                  # Error computation.
+    if norms:                                                                       # If all the norms were requested.
+        return er
+    return er[0]
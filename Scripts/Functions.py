@@ -0,0 +1,51 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+# Functions
+# The boundary condition phi and the right side f are given to the solvers as functions of (x, y) or as arrays already evaluated
+# on the nodes. A function is called once with the full coordinate arrays; a function that only works with scalars, as one written
+# with math.exp or with an if on its arguments, is evaluated node by node through np.vectorize.
+
+import numpy as np
+
+def Evaluate(fun, x, y):
+    """
+    Evaluate
+    Function to evaluate a boundary condition or a right side on all the nodes at once.
+
+    Input:
+        fun                                         Function of (x, y), or an array or scalar with its values on the nodes.
+        x                           Array           Array with the coordinates in x of the nodes.
+        y                           Array           Array with the coordinates in y of the nodes, with the shape of x.
+
+    Output:
+        u                           Array           Array with the values on the nodes, with the shape of x.
+    """
+
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if not callable(fun):                                                           # The values are already computed.
+        u = np.asarray(fun, dtype=float)
+        if u.size == x.size and u.shape != x.shape:                                 # A column vector of a cloud.
+            u = u.reshape(x.shape)
+        return np.broadcast_to(u, x.shape).copy()                                   # A scalar is a constant function.
+    try:
+        u = np.asarray(fun(x, y), dtype=float)                                      # A single call with all the nodes.
+        return np.broadcast_to(u, x.shape).copy()
+    except (TypeError, ValueError):                                                 # The function only works with scalars.
+        return np.vectorize(fun, otypes=[float])(x, y)
@@ -15,11 +15,41 @@
 #   January, 2023.
 
 import numpy as np
+from scipy.sparse import coo_matrix
+import Scripts.Functions as Functions
+import Scripts.Geometry as Geometry
  
+# Position of the 8 neighbors of the Gammas.Mesh stencil relative to the central node.
+Stencil = [(1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1)]
+
+def Batch(dx, dy, L):
+    """
+    Batched Gammas Computation.
+     
+    This function computes the Gamma values of many nodes at once. The local M matrices of all the nodes are stacked into a single
+    k x 5 x nvec array and their pseudoinverses are computed in one call.
+    A node with less than nvec neighbors is handled by masking: its missing neighbors must have dx = dy = 0, the corresponding column
+    of M is zero and its Gamma is zero, exactly as if the column was not there.
+     
+    Input:
+        dx          k x nvec        Array           Array with the distances in x from each node to its neighbors.
+        dy          k x nvec        Array           Array with the distances in y from each node to its neighbors.
+        L           5 x 1           Array           Array with the values of the differential operator.
+     
+    Output:
+        Gamma       k x nvec+1      Array           Array with the computed gamma values, the central node first.
+    """
+    M     = np.stack([dx, dy, dx**2, dx*dy, dy**2], axis=1)                         # M matrices are assembled.
+    M     = np.linalg.pinv(M)                                                       # The pseudoinverses of the matrices M.
+    YY    = (M@L)[:,:,0]                                                            # M*L computation.
+    Gamma = np.hstack([-YY.sum(axis=1, keepdims=True), YY])                         # Gamma values are found.
+    return Gamma
+
 def Mesh(x, y, L):
     # 2D Meshes Gammas Computation.
     # 
     # This routine computes the Gamma values for logically rectangular meshes.
+    # The neighbors of each node are ordered as in Stencil.
     # 
     # Input parameters
     #   x           m x n           Array           Array with the coordinates in x of the nodes.
@@ -33,25 +63,15 @@ def Mesh(x, y, L):
     m        = me[0]                                                                # The number of nodes in x.
     n        = me[1]                                                                # The number of nodes in y.
     Gamma    = np.zeros([m,n,9])                                                    # Gamma initialization with zeros.
+    dx       = np.zeros([m-2,n-2,8])                                                # dx initialization with zeros.
+    dy       = np.zeros([m-2,n-2,8])                                                # dy initialization with zeros.
+
+    for k, (di, dj) in enumerate(Stencil):                                          # For each of the neighbor nodes.
+        dx[:,:,k] = x[1+di:m-1+di, 1+dj:n-1+dj] - x[1:m-1, 1:n-1]                   # dx is computed.
+        dy[:,:,k] = y[1+di:m-1+di, 1+dj:n-1+dj] - y[1:m-1, 1:n-1]                   # dy is computed.
 
-    for i in range(1,m-1):                                                          # For each of the nodes in x.
-        for j in range(1,n-1):                                                      # For each of the nodes in y.
-            dx = np.array([x[i + 1, j]   - x[i, j], x[i + 1, j + 1] - x[i, j], \
-                           x[i, j + 1]   - x[i, j], x[i - 1, j + 1] - x[i, j], \
-                           x[i - 1, j]   - x[i, j], x[i - 1, j - 1] - x[i, j], \
-                           x[i, j - 1]   - x[i, j], x[i + 1, j - 1] - x[i, j]])     # dx is computed.
-            
-            dy = np.array([y[i + 1, j]   - y[i, j], y[i + 1, j + 1] - y[i, j], \
-                           y[i, j + 1]   - y[i, j], y[i - 1, j + 1] - y[i, j], \
-                           y[i - 1, j]   - y[i, j], y[i - 1, j - 1] - y[i, j], \
-                           y[i, j - 1]   - y[i, j], y[i + 1, j - 1] - y[i, j]])     # dy is computed.
-            
-            M = np.vstack([[dx], [dy], [dx**2], [dx*dy], [dy**2]])                  # M matrix is assembled.
-            M = np.linalg.pinv(M)                                                   # The pseudoinverse of matrix M.
-            YY = M@L                                                                # M*L computation.
-            Gem = np.vstack([-sum(YY), YY])                                         # Gamma values are found.
-            for k in range(9):                                                      # For each of the Gamma values.
-                Gamma[i,j,k] = Gem[k]                                               # The Gamma value is stored.
+    Gem = Batch(dx.reshape([-1,8]), dy.reshape([-1,8]), L)                          # Gamma values are found.
+    Gamma[1:m-1, 1:n-1, :] = Gem.reshape([m-2,n-2,9])                               # The Gamma values are stored.
 
     return Gamma
 
@@ -61,133 +81,206 @@ def Cloud(p, vec, L):
     # This routine computes the Gamma values for unstructured clouds of points and triangulations.
     # 
     # Input parameters
-    #   p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
-    #   vec         m x o           Array           Array with the correspondence of the o neighbors of each node.
+    #   p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary, or a
+    #                                               Geometry (see Geometry).
+    #   vec         m x o           Array           Array with the correspondence of the o neighbors of each node, or None for
+    #                                               the ones of the Geometry.
     #   L           5 x 1           Array           Array with the values of the differential operator.
     # 
     # Output parameters
     #   Gamma       m x n x o       Array           Array with the computed gamma values.
 
-    nvec  = len(vec[0,:])                                                           # The maximum number of neighbors.
-    m     = len(p[:,0])                                                             # The total number of nodes.
+    xy, bnd   = Geometry.Nodes(p)                                                   # The coordinates of the nodes.
+    inner, nb = Geometry.Inner(p, vec)                                              # The nodes that are not in the boundary.
+    nvec  = nb.shape[1]                                                             # The maximum number of neighbors.
+    m     = len(xy)                                                                 # The total number of nodes.
     Gamma = np.zeros([m, nvec+1])                                                   # Gamma initialization with zeros.
 
-    for i in np.arange(m):                                                          # For each of the nodes.
-        if p[i,2] == 0:                                                             # If the node is not in the boundary.
-            nvec = sum(vec[i,:] != -1)                                              # The total number of neighbors of the node.
-            dx = np.zeros([nvec])                                                   # dx initialization with zeros.
-            dy = np.zeros([nvec])                                                   # dy initialization with zeros.
-
-            for j in np.arange(nvec):                                               # For each of the neighbor nodes.
-                vec1 = int(vec[i, j])                                               # The neighbor index is found.
-                dx[j] = p[vec1, 0] - p[i,0]                                         # dx is computed.
-                dy[j] = p[vec1, 1] - p[i,1]                                         # dy is computed.
-
-            M = np.vstack([[dx], [dy], [dx**2], [dx*dy], [dy**2]])                  # M matrix is assembled.
-            M = np.linalg.pinv(M)                                                   # The pseudoinverse of matrix M.
-            YY = M@L                                                                # M*L computation.
-            Gem = np.vstack([-sum(YY), YY]).transpose()                             # Gamma values are found.
-            for j in np.arange(nvec+1):                                             # For each of the Gamma values.
-                Gamma[i,j] = Gem[0,j]                                               # The Gamma value is stored.
+    dx, dy       = Deltas(xy, nb, inner)                                            # dx and dy are computed.
+    Gamma[inner] = Batch(dx, dy, L)                                                 # Gamma values are found.
     
     return Gamma
 
-def K_Mesh(x, y, L, phi, f):
-    me = x.shape
-    m = me[0]
-    n = me[1]
-    K = np.zeros([(m-2)*(n-2), (m-2)*(n-2)])
-    R  = np.zeros([(m-2)*(n-2), 1])
-
-    for i in np.arange(1,m-1):
-        for j in np.arange(1,n-1):
-            u = np.array(x[i-1:i+2, j-1:j+2])
-            v = np.array(y[i-1:i+2, j-1:j+2])
-            dx = np.hstack([u[0,0] - u[1,1], u[1,0] - u[1,1], \
-                            u[2,0] - u[1,1], u[0,1] - u[1,1], \
-                            u[2,1] - u[1,1], u[0,2] - u[1,1], \
-                            u[1,2] - u[1,1], u[2,2] - u[1,1]])
-            dy = np.hstack([v[0,0] - v[1,1], v[1,0] - v[1,1], \
-                            v[2,0] - v[1,1], v[0,1] - v[1,1], \
-                            v[2,1] - v[1,1], v[0,2] - v[1,1], \
-                            v[1,2] - v[1,1], v[2,2] - v[1,1]])
-            M = np.vstack([[dx], [dy], [dx**2], [dx*dy], [dy**2]])
-            M = np.linalg.pinv(M)
-            YY = M@L
-            Gamma = np.vstack([-sum(YY), YY])
-            p = m*(j) + i
-            K[p, p-1]   = Gamma[4]
-            K[p, p]     = Gamma[0]
-            K[p, p+1]   = Gamma[5]
-            K[p, p-1-m] = Gamma[1]
-            K[p, p-m]   = Gamma[2]
-            K[p, p+1-m] = Gamma[3]
-            K[p, p-1+m] = Gamma[6]
-            K[p, p+m]   = Gamma[7]
-            K[p, p+1+m] = Gamma[8]
-
-            temp     = (i-1) + (m-2)*(j-1)                                      # Se buscan los nodos que son frontera.
-            R[temp] += Gamma[0]*f(x[i,j], y[i,j])                              # Se agrega f al lado derecho.
-    
-    for j in np.arange(n):
-        K[m*j, m*j] = 0
-    
-    for i in np.arange(1,m-1):
-        p       = i+(n-1)*m
-        K[i, i] = 0
-        K[p, p] = 0
-
-        temp       = i-1                                                        # Se asigna el valor de temp como los nodos de la primera frontera en x.
-        R[temp] += phi(x[i,0], y[i,0])                                          # Se guarda la condición de frontera en el lado derecho.
-        temp       = (i-1) + (m-2)*((m-1)-2)                                    # Se asigna el valor de temp como los nodos de la última frontera en x.
-        R[temp] += phi(x[i,m-1], y[i,m-1])                                      # Se guarda la condición de frontera en el lado derecho.
-        temp       = (m-2)*(i-1)                                                # Se asigna el valor de temp para los nodos de la primera frontera en y.
-        R[temp] += phi(x[0,i], y[0,i])                                          # Se guarda la condición de frontera en el lado derecho.
-        temp       = ((m-1)-2) + (m-2)*(i-1)                                    # Se asgina el valor de temp para los nodos de la última frontera en y.
-        R[temp] += phi(x[m-1,i], y[m-1,i])                                      # Se guarda la condición de frontera en el lado derecho.                
+def Deltas(xy, nb, inner):
+    """
+    Distances to the Neighbors.
+     
+    This function computes the distances from a set of nodes to their neighbors, with zero for the missing neighbors.
+     
+    Input:
+        xy          m x 2           Array           Array with the coordinates of the nodes.
+        nb          k x nvec        Array           Array with the neighbors of each node of the set, padded with -1.
+        inner       k x 1           Array           Array with the indices of the nodes.
+     
+    Output:
+        dx          k x nvec        Array           Array with the distances in x from each node to its neighbors.
+        dy          k x nvec        Array           Array with the distances in y from each node to its neighbors.
+    """
+    nb   = np.where(nb != -1, nb, inner[:,None])                                    # Missing neighbors point to the node itself.
+    dx   = xy[nb,0] - xy[inner,0][:,None]                                           # dx is computed, zero for the missing neighbors.
+    dy   = xy[nb,1] - xy[inner,1][:,None]                                           # dy is computed, zero for the missing neighbors.
+    return dx, dy
+
+def K_Mesh(x, y, L, phi, f, sparse = False):
+    """
+    2D Meshes Gammas Computation.
+     
+    This function computes the Gamma values for logically rectangular meshes, and assemble the K matrix for the computations.
+    The nodes are numbered as i + j*m, the rows of the boundary nodes are the identity and hold the boundary condition in R.
+     
+    Input:
+        x           m x n           Array           Array with the coordinates in x of the nodes.
+        y           m x n           Array           Array with the coordinates in y of the nodes.
+        L           5 x 1           Array           Array with the values of the differential operator.
+        phi                         function        Function declared with the boundary condition, or an m x n array with its
+                                                    values on the nodes (see Functions.Evaluate).
+        f                           function        Function declared with the right side of the equation, or an m x n array
+                                                    with its values on the nodes.
+        sparse                      bool            If True, K is assembled directly as a sparse CSR matrix.
+     
+    Output:
+        K           mn x mn         Array           K Matrix with the computed Gammas.
+        R           mn x 1          Array           Right hand side of the system.
+    """
+    Gamma = Mesh(x, y, L)                                                           # Gamma computation.
+    K     = Assemble_Mesh(Gamma, sparse)                                            # K matrix assembly.
+    R     = R_Mesh(x, y, phi, f)                                                    # Right hand side of the system.
     
     return K, R
 
-def Cloud_K(p, vec, L):
+def Assemble_Mesh(Gamma, sparse = False):
+    """
+    Mesh Matrix Assembly.
+     
+    This function assembles the K matrix of a logically rectangular mesh from its Gamma values.
+    The nodes are numbered as i + j*m and the rows of the boundary nodes are the identity.
+     
+    Input:
+        Gamma       m x n x 9       Array           Array with the computed gamma values.
+        sparse                      bool            If True, K is assembled directly as a sparse CSR matrix.
+     
+    Output:
+        K           mn x mn         Array           K Matrix with the computed Gammas.
+    """
+    # Variable initialization
+    m    = Gamma.shape[0]                                                           # The number of nodes in x.
+    n    = Gamma.shape[1]                                                           # The number of nodes in y.
+    off  = np.array([0] + [di + dj*m for di, dj in Stencil])                        # Position of the stencil nodes relative to the central one.
+    num  = np.arange(m*n).reshape([n, m]).transpose()                               # The nodes are numbered as i + j*m.
+    bnd  = np.hstack([num[0,:], num[m-1,:], num[1:m-1,0], num[1:m-1,n-1]])          # The boundary nodes.
+    inn  = num[1:m-1, 1:n-1].ravel()                                                # The interior nodes.
+
+    # Matrix assembly
+    Gamma = Gamma[1:m-1, 1:n-1, :].reshape([-1, 9])                                 # Gamma values of the interior nodes.
+    rows  = [np.repeat(inn, 9), bnd]                                                # Row indices of the nonzero values of K.
+    cols  = [(inn[:,None] + off).ravel(), bnd]                                      # Column indices of the nonzero values of K.
+    vals  = [Gamma.ravel(), np.ones([len(bnd)])]                                    # Boundary rows are the identity.
+    K     = Assemble(np.hstack(rows), np.hstack(cols), np.hstack(vals), m*n, sparse)# K matrix assembly.
+    
+    return K
+
+def R_Mesh(x, y, phi, f):
+    """
+    Mesh Right Hand Side.
+     
+    This function computes the right hand side of the K system of a logically rectangular mesh.
+    The nodes are numbered as i + j*m, the boundary nodes hold the boundary condition and the interior ones the right side of the equation.
+     
+    Input:
+        x           m x n           Array           Array with the coordinates in x of the nodes.
+        y           m x n           Array           Array with the coordinates in y of the nodes.
+        phi                         function        Function declared with the boundary condition, or an m x n array with its
+                                                    values on the nodes (see Functions.Evaluate).
+        f                           function        Function declared with the right side of the equation, or an m x n array
+                                                    with its values on the nodes.
+     
+    Output:
+        R           mn x 1          Array           Right hand side of the system.
+    """
+    me   = x.shape                                                                  # The size of the mesh is found.
+    m    = me[0]                                                                    # The number of nodes in x.
+    n    = me[1]                                                                    # The number of nodes in y.
+
+    R    = Functions.Evaluate(phi, x, y)                                            # The boundary condition is stored.
+    R[1:m-1, 1:n-1] = Functions.Evaluate(f, x, y)[1:m-1, 1:n-1]                     # The right side of the equation.
+
+    return R.transpose().ravel()                                                    # The nodes are numbered as i + j*m.
+
+def Cloud_K(p, vec, L, sparse = False):
     """
     2D Clouds of Points Gammas Computation.
      
     This function computes the Gamma values for clouds of points, and assemble the K matrix for the computations.
      
     Input:
-        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
-        vec         m x nvec        Array           Array with the correspondence of the 'nvec' neighbors of each node.
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary, or a
+                                                    Geometry (see Geometry).
+        vec         m x nvec        Array           Array with the correspondence of the 'nvec' neighbors of each node, or None
+                                                    for the ones of the Geometry.
         L           5 x 1           Array           Array with the values of the differential operator.
+        sparse                      bool            If True, K is assembled directly as a sparse CSR matrix.
+     
+     Output:
+        K           m x m           Array           K Matrix with the computed Gammas.
+    """
+    Gamma = Cloud(p, vec, L)                                                        # Gamma computation.
+    K     = Assemble_Cloud(p, vec, Gamma, sparse)                                   # K matrix assembly.
+    
+    return K
+
+def Assemble_Cloud(p, vec, Gamma, sparse = False):
+    """
+    Cloud Matrix Assembly.
+     
+    This function assembles the K matrix of a triangulation or a cloud of points from its Gamma values.
+    The rows of the boundary nodes are the identity.
+     
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary, or a
+                                                    Geometry (see Geometry).
+        vec         m x nvec        Array           Array with the correspondence of the 'nvec' neighbors of each node, or None
+                                                    for the ones of the Geometry.
+        Gamma       m x nvec+1      Array           Array with the computed gamma values.
+        sparse                      bool            If True, K is assembled directly as a sparse CSR matrix.
      
      Output:
         K           m x m           Array           K Matrix with the computed Gammas.
     """
     # Variable initialization
-    nvec  = len(vec[0,:])                                                           # The maximum number of neighbors.
-    m     = len(p[:,0])                                                             # The total number of nodes.
-    K     = np.zeros([m,m])                                                         # K initialization with zeros.
+    xy, bnd   = Geometry.Nodes(p)                                                   # The coordinates of the nodes.
+    inner, nb = Geometry.Inner(p, vec)                                              # The inner nodes and their neighbors.
+    m     = len(xy)                                                                 # The total number of nodes.
+    bnd   = np.flatnonzero(bnd)                                                     # The boundary nodes.
+    
+    # Matrix assembly
+    mask  = np.hstack([np.ones([len(inner),1], dtype=bool), nb != -1])              # The central node and its existing neighbors.
+    cols  = np.hstack([inner[:,None], nb])                                          # The central node and its neighbors.
+    rows  = [np.repeat(inner, mask.shape[1]).reshape(mask.shape)[mask], bnd]        # Row indices of the nonzero values of K.
+    cols  = [cols[mask], bnd]                                                       # Column indices of the nonzero values of K.
+    vals  = [Gamma[inner][mask], np.ones([len(bnd)])]                               # Boundary rows are the identity.
+    K     = Assemble(np.hstack(rows), np.hstack(cols), np.hstack(vals), m, sparse)  # K matrix assembly.
     
-    # Gammas computation and Matrix assembly
-    for i in np.arange(m):                                                          # For each of the nodes.
-        if p[i,2] == 0:                                                             # If the node is an inner node.
-            nvec = sum(vec[i,:] != -1)                                              # The total number of neighbors of the node.
-            dx   = np.zeros([nvec])                                                 # dx initialization with zeros.
-            dy   = np.zeros([nvec])                                                 # dy initialization with zeros.
-            for j in np.arange(nvec):                                               # For each of the neighbor nodes.
-                vec1  = int(vec[i, j])                                              # The neighbor index is found.
-                dx[j] = p[vec1, 0] - p[i,0]                                         # dx is computed.
-                dy[j] = p[vec1, 1] - p[i,1]                                         # dy is computed.
-            M     = np.vstack([[dx], [dy], [dx**2], [dx*dy], [dy**2]])              # M matrix is assembled.
-            M     = np.linalg.pinv(M)                                               # The pseudoinverse of matrix M.
-            YY    = M@L                                                             # M*L computation.
-            Gamma = np.vstack([-sum(YY), YY]).transpose()                           # Gamma values are found.
-            K[i,i] = Gamma[0,0]                                                     # The corresponding Gamma for the central node.
-            for j in np.arange(nvec):                                               # For each of the neighbor nodes.
-                K[i, vec[i,j]] = Gamma[0,j+1]                                       # The corresponding Gamma for the neighbor node.
-            
-        if p[i,2] == 1:                                                             # If the node is in the boundary.
-            K[i,i] = 0                                                              # Central node weight is equal to 0.
-            for j in np.arange(nvec):                                               # For each of the neighbor nodes.
-                K[:, i] = 0                                                         # Neighbor node weight is equal to 0.
-                K[i,i] = 1
-    return K
\ No newline at end of file
+    return K
+
+def Assemble(rows, cols, vals, m, sparse = False):
+    """
+    Matrix Assembly.
+     
+    This function assembles the K matrix from the lists of its nonzero values, either as a dense array or directly in sparse CSR format.
+     
+    Input:
+        rows        k x 1           Array           Array with the row index of each nonzero value.
+        cols        k x 1           Array           Array with the column index of each nonzero value.
+        vals        k x 1           Array           Array with the nonzero values.
+        m                           integer         Size of the matrix.
+        sparse                      bool            If True, K is returned as a sparse CSR matrix.
+     
+     Output:
+        K           m x m           Array           Assembled K matrix.
+    """
+    if sparse:                                                                      # If the sparse format is requested.
+        K = coo_matrix((vals, (rows, cols)), shape = (m, m)).tocsr()                # K is built in COO format and converted to CSR.
+    else:                                                                           # If the dense format is requested.
+        K = np.zeros([m, m])                                                        # K initialization with zeros.
+        np.add.at(K, (rows, cols), vals)                                            # The values are stored, duplicates are summed as in COO.
+    return K
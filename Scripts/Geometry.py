@@ -0,0 +1,177 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+# Geometry
+# Compact container for a triangulation or an unstructured cloud of points. Instead of p, m x 3 with the boundary flag as a float
+# column, and vec, m x nvec int64 padded with -1, it keeps the coordinates as a contiguous m x 2 float64 array, the boundary as a
+# boolean mask, the interior and boundary nodes as int32 index lists, and the neighbors in CSR form: int32 offsets ptr and indices
+# idx, the neighbors of node i being idx[ptr[i]:ptr[i+1]]. The number of neighbors of each node is np.diff(ptr).
+# The functions of Neighbors, Gammas, Relaxation, Errors, Cache and Poisson_2D that take p (and vec) also take a Geometry. The
+# assembly and the relaxation read it through Nodes and Inner, which build the padded rows of the interior nodes straight from the
+# CSR arrays, so neither p nor the full vec is formed; the other routines convert it with Split. If it already has neighbors,
+# Poisson_2D and Cache do not search them again.
+
+import numpy as np
+
+class Geometry:
+    # Triangulation or unstructured cloud of points.
+    #
+    # Input parameters
+    #   p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+    #   vec         m x nvec        Array           Array with the correspondence of the nvec neighbors of each node, padded
+    #                                               with -1, or None if the neighbors are not known yet.
+    #   tt          n x 3           Array           Array with the correspondence of the n triangles, or None for a cloud.
+
+    __slots__ = ('xy', 'boundary', 'inner', 'bnd', 'ptr', 'idx', 'nvec', 'tt')
+
+    def __init__(self, p, vec = None, tt = None):
+        p             = np.asarray(p)
+        self.xy       = np.ascontiguousarray(p[:,:2], dtype=float)                  # Coordinates of the nodes.
+        self.boundary = np.ascontiguousarray(p[:,2] == 1)                           # Boundary mask.
+        self.inner    = np.flatnonzero(~self.boundary).astype(np.int32)             # The interior nodes.
+        self.bnd      = np.flatnonzero(self.boundary).astype(np.int32)              # The boundary nodes.
+        self.ptr      = None                                                        # No neighbors yet.
+        self.idx      = None
+        self.nvec     = 0                                                           # Width of vec.
+        self.tt       = None                                                        # No triangles.
+        if tt is not None:                                                          # The triangles, numbered from 0.
+            tt      = np.asarray(tt)
+            self.tt = np.ascontiguousarray(tt - 1 if tt.size > 0 and tt.min() == 1 else tt, dtype=np.int32)
+        if vec is not None:                                                         # The neighbors are stored.
+            self.Set_Neighbors(vec)
+
+    @property
+    def m(self):
+        # The total number of nodes.
+        return len(self.xy)
+
+    @property
+    def nbytes(self):
+        # Memory used by the arrays.
+        return sum(getattr(self, name).nbytes for name in self.__slots__ if isinstance(getattr(self, name), np.ndarray))
+
+    def Set_Neighbors(self, vec):
+        # Storage of the neighbors in CSR form.
+        #
+        # Input parameters
+        #   vec         m x nvec        Array           Array with the correspondence of the nvec neighbors of each node, padded with -1.
+
+        vec      = np.asarray(vec)
+        mask     = vec != -1                                                        # The existing neighbors.
+        self.ptr = np.zeros([len(vec) + 1], dtype=np.int32)
+        np.cumsum(mask.sum(axis=1), out=self.ptr[1:])                               # Offsets of the neighbors of each node.
+        self.idx = vec[mask].astype(np.int32)                                       # In order, node by node.
+        self.nvec = vec.shape[1]                                                    # Width of vec.
+        return self
+
+    def Counts(self):
+        # Number of neighbors of each node.
+        return np.diff(self.ptr)
+
+    def Points(self):
+        # The nodes as p, m x 3 with the boundary flag in the last column.
+        return np.column_stack([self.xy, self.boundary.astype(float)])
+
+    def Vec(self, nvec = None, nodes = None):
+        # The neighbors as vec, m x nvec padded with -1; nvec is by default the width of the vec they were stored from. If nodes
+        # is given, only the rows of those nodes are built.
+        nodes  = np.arange(self.m) if nodes is None else np.asarray(nodes)
+        counts = np.diff(self.ptr)[nodes]                                           # Number of neighbors of each node.
+        nvec   = self.nvec if nvec is None else nvec
+        vec    = np.zeros([len(nodes), nvec], dtype=int) - 1                        # The array for the neighbors is initialized.
+        rows   = np.repeat(np.arange(len(nodes)), counts)                           # The row of each neighbor.
+        cols   = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        vec[rows, cols] = self.idx[np.repeat(self.ptr[nodes], counts) + cols]       # Its position among the neighbors of the node.
+        return vec
+
+def Split(p, vec = None):
+    """
+    Split
+    Function to get p and vec as loose arrays from a Geometry, or to leave them as they are.
+
+    Input:
+        p                           Geometry        Geometry, or an m x 3 array with the coordinates of the nodes and a flag for
+                                                    the boundary.
+        vec         m x nvec        Array           Array with the neighbors of each node; if None, the ones of the Geometry.
+
+    Output:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        vec         m x nvec        Array           Array with the neighbors of each node, None if they are not known.
+    """
+
+    if not isinstance(p, Geometry):                                                 # Already loose arrays.
+        return p, vec
+    if vec is None and p.ptr is not None:                                           # The neighbors of the Geometry.
+        vec = p.Vec()
+    return p.Points(), vec
+
+def Nodes(p):
+    """
+    Nodes
+    Function to get the coordinates and the boundary of a Geometry or of p, without converting them.
+
+    Input:
+        p                           Geometry        Geometry, or an m x 3 array with the coordinates of the nodes and a flag for
+                                                    the boundary.
+
+    Output:
+        xy          m x 2           Array           Array with the coordinates of the nodes.
+        boundary    m x 1           Array           Boolean array, True for the boundary nodes.
+    """
+
+    if isinstance(p, Geometry):                                                     # The arrays of the Geometry.
+        return p.xy, p.boundary
+    return p[:,:2], p[:,2] == 1
+
+def Inner(p, vec = None):
+    """
+    Inner
+    Function to get the interior nodes and their neighbors, the rows the assembly and the relaxation work on. For a Geometry they
+    are built from its CSR arrays, for the interior nodes only.
+
+    Input:
+        p                           Geometry        Geometry, or an m x 3 array with the coordinates of the nodes and a flag for
+                                                    the boundary.
+        vec         m x nvec        Array           Array with the neighbors of each node; if None, the ones of the Geometry.
+
+    Output:
+        inner       k x 1           Array           Array with the indices of the interior nodes.
+        nb          k x nvec        Array           Array with the neighbors of the interior nodes, padded with -1.
+    """
+
+    if not isinstance(p, Geometry):                                                 # Loose arrays.
+        inner = np.where(p[:,2] == 0)[0]
+        return inner, vec[inner,:]
+    if vec is None:                                                                 # The neighbors of the Geometry.
+        return p.inner, p.Vec(nodes = p.inner)
+    return p.inner, np.asarray(vec)[p.inner,:]
+
+def Has_Neighbors(p):
+    """
+    Has_Neighbors
+    Function to check if p is a Geometry with its neighbors already stored.
+
+    Input:
+        p                           Geometry        Geometry, or an m x 3 array with the coordinates of the nodes and a flag for
+                                                    the boundary.
+
+    Output:
+        known                       bool            True if the neighbors do not have to be searched.
+    """
+
+    return isinstance(p, Geometry) and p.ptr is not None
@@ -0,0 +1,104 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+# Interpolation
+# Transfer of a solution computed on a coarse discretization to the nodes of a finer one, to be used as the initial approximation
+# of the solvers (nested iteration). The regions come in nested resolutions, so the coarse solution is already close to the fine one
+# and the solver only has to remove the high frequency error.
+
+import numpy as np
+from scipy.interpolate import RBFInterpolator, RegularGridInterpolator
+from scipy.spatial import cKDTree
+
+def Mesh(u, m, n):
+    """
+    Mesh
+    Function to interpolate a solution of a logically rectangular mesh onto a mesh of the same region with m x n nodes.
+    The interpolation is bilinear in the logical space, so it is exact at the shared nodes of nested meshes.
+
+    Input:
+        u           mc x nc         Array           Array with the solution on the coarse mesh.
+        m                           integer         Number of nodes in x of the new mesh.
+        n                           integer         Number of nodes in y of the new mesh.
+
+    Output:
+        v           m x n           Array           Array with the interpolated solution on the new mesh.
+    """
+
+    mc, nc = u.shape                                                                # The size of the coarse mesh.
+    s, t   = np.meshgrid(np.linspace(0, 1, m), np.linspace(0, 1, n), indexing='ij') # Logical coordinates of the new nodes.
+    inter  = RegularGridInterpolator((np.linspace(0, 1, mc), np.linspace(0, 1, nc)), u)
+    return inter(np.column_stack([s.ravel(), t.ravel()])).reshape([m, n])
+
+def Triangulation(p, tt, u, q, k = 8):
+    """
+    Triangulation
+    Function to interpolate a solution of a triangulation onto a set of points, with barycentric coordinates on the triangles.
+    Each point is located among the k triangles with the closest centroids; a point outside all of them, as on a curved boundary,
+    takes the values of the closest triangle with its coordinates clipped.
+
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        tt          n x 3           Array           Array with the correspondence of the n triangles.
+        u           m x 1           Array           Array with the solution on the nodes.
+        q           l x 2           Array           Array with the coordinates of the points, more columns are ignored.
+        k                           integer         Number of candidate triangles of each point.
+
+    Output:
+        v           l x 1           Array           Array with the interpolated solution on the points.
+    """
+
+    # Candidate triangles
+    l    = len(q[:,0])                                                              # The number of points.
+    c    = p[tt,:2].mean(axis=1)                                                    # The centroids of the triangles.
+    cand = cKDTree(c).query(q[:,:2], k=min(k, len(tt)))[1].reshape([l, -1])         # The closest triangles to each point.
+
+    # Barycentric coordinates on each candidate
+    a    = p[tt[cand,0],:2]                                                         # First vertex of the triangles.
+    e1   = p[tt[cand,1],:2] - a                                                     # Edge to the second vertex.
+    e2   = p[tt[cand,2],:2] - a                                                     # Edge to the third vertex.
+    d    = q[:,None,:2] - a                                                         # From the first vertex to the point.
+    det  = e1[...,0]*e2[...,1] - e1[...,1]*e2[...,0]                                # Twice the signed area.
+    l1   = (d[...,0]*e2[...,1] - d[...,1]*e2[...,0])/det                            # Coordinate of the second vertex.
+    l2   = (e1[...,0]*d[...,1] - e1[...,1]*d[...,0])/det                            # Coordinate of the third vertex.
+    lam  = np.stack([1 - l1 - l2, l1, l2], axis=2)                                  # The barycentric coordinates.
+
+    # The containing triangle
+    best = lam.min(axis=2).argmax(axis=1)                                           # All coordinates positive if it contains the point.
+    lam  = np.clip(lam[np.arange(l), best], 0, None)                                # Clipped for the points outside.
+    lam  = lam/lam.sum(axis=1, keepdims=True)                                       # The coordinates add up to one.
+    tri  = tt[cand[np.arange(l), best]]                                             # The vertices of the triangle.
+    return (lam*u[tri]).sum(axis=1)
+
+def Cloud(p, u, q, k = 16):
+    """
+    Cloud
+    Function to interpolate a solution of a cloud of points onto a set of points, with a local radial basis function interpolant.
+
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        u           m x 1           Array           Array with the solution on the nodes.
+        q           l x 2           Array           Array with the coordinates of the points, more columns are ignored.
+        k                           integer         Number of nodes of the local interpolant of each point.
+
+    Output:
+        v           l x 1           Array           Array with the interpolated solution on the points.
+    """
+
+    inter = RBFInterpolator(p[:,:2], u, neighbors=min(k, len(p[:,0])), kernel='thin_plate_spline')
+    return inter(q[:,:2])
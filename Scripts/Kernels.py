@@ -0,0 +1,153 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+# Kernels
+# Node by node loops compiled with Numba when it is installed. Without Numba the same functions run as plain Python, so the
+# sequential Gauss-Seidel sweeps are always taken from here, while Neighbors keeps its NumPy code unless Use is True. The Gammas
+# are not compiled: the batched pseudoinverse of Gammas.Batch is already a single LAPACK call over all the nodes.
+#   Mesh_Sweep, Cloud_Sweep     The same operations in the same order as the Python loops, so the results are identical.
+#   Select                      The neighbors are chosen as in Neighbors.Cloud, so vec is identical.
+# Use can be set to False to force the NumPy code, for instance to compare both.
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:                                                                 # Numba is optional.
+    numba = None
+
+Use = numba is not None                                                             # If the compiled kernels are used.
+
+def Jit(fun):
+    """
+    Jit
+    Decorator to compile a kernel with Numba, or to leave it as Python if Numba is not installed.
+
+    Input:
+        fun                         function        Kernel.
+
+    Output:
+        fun                         function        Compiled kernel, or the same function.
+    """
+
+    if numba is None:                                                               # Without Numba.
+        return fun
+    return numba.njit(cache=True, nogil=True)(fun)                                  # Compiled once, cached on disk.
+
+@Jit
+def Mesh_Sweep(Gamma, u_ap, F, DI, DJ, omega):
+    """
+    Mesh_Sweep
+    Function to apply one lexicographic Gauss-Seidel sweep, node by node, to a logically rectangular mesh.
+
+    Input:
+        Gamma       m x n x 9       Array           Array with the computed gamma values.
+        u_ap        m x n           Array           Array with the approximation, updated in place.
+        F           m x n           Array           Array with the right side of the equation evaluated on the nodes.
+        DI, DJ      8 x 1           Arrays          Position of the neighbors relative to the central node (see Gammas.Stencil).
+        omega                       Real            Relaxation weight.
+
+    Output:
+        err                         Real            Largest update of the sweep.
+        res                         Real            Largest residual of the nodes when they were updated.
+    """
+
+    m, n = u_ap.shape                                                               # The size of the mesh.
+    err  = 0.0
+    res  = 0.0
+    for i in range(1,m-1):                                                          # For each of the nodes on the x axis.
+        for j in range(1,n-1):                                                      # For each of the nodes on the y axis.
+            t = F[i, j]                                                             # t is initialized with the right side.
+            for k in range(len(DI)):                                                # For each of the neighbor nodes.
+                t -= Gamma[i, j, k+1]*u_ap[i + DI[k], j + DJ[k]]                    # The neighbor contribution is removed.
+            t = u_ap[i, j] + omega*(t/Gamma[i, j, 0] - u_ap[i, j])                  # u_ap is calculated at the central node.
+            err = max(err, abs(t - u_ap[i, j]))                                     # Error computation.
+            res = max(res, abs((t - u_ap[i, j])*Gamma[i, j, 0]))                    # Residual of the node.
+            u_ap[i, j] = t                                                          # The previously computed value is assigned.
+    return err, res
+
+@Jit
+def Cloud_Sweep(inner, idx, W, G0, Fi, u_ap, omega):
+    """
+    Cloud_Sweep
+    Function to apply one Gauss-Seidel sweep, node by node in the order of the nodes, to a cloud of points.
+
+    Input:
+        inner       k x 1           Array           Array with the indices of the interior nodes.
+        idx         k x nvec        Array           Padded neighbor indices of the interior nodes.
+        W           k x nvec        Array           Padded neighbor Gammas, zero for the missing neighbors.
+        G0          k x 1           Array           Gammas of the central nodes.
+        Fi          k x 1           Array           Right side on the interior nodes.
+        u_ap        m x 1           Array           Array with the approximation, updated in place.
+        omega                       Real            Relaxation weight.
+
+    Output:
+        err                         Real            Largest update of the sweep.
+        res                         Real            Largest residual of the nodes when they were updated.
+    """
+
+    err = 0.0
+    res = 0.0
+    for k in range(len(inner)):                                                     # For each of the interior nodes.
+        i = inner[k]                                                                # The index of the node.
+        t = Fi[k]                                                                   # t is initialized with the right side.
+        for j in range(idx.shape[1]):                                               # For each of the neighbor nodes.
+            t -= W[k, j]*u_ap[idx[k, j]]                                            # The neighbor contribution is removed.
+        t = u_ap[i] + omega*(t/G0[k] - u_ap[i])                                     # u_ap is calculated at the central node.
+        err = max(err, abs(t - u_ap[i]))                                            # Error computation.
+        res = max(res, abs((t - u_ap[i])*G0[k]))                                    # Residual of the node.
+        u_ap[i] = t                                                                 # The previously computed value is assigned.
+    return err, res
+
+@Jit
+def Select(p, ptr, cand, radius, nvec):
+    """
+    Select
+    Function to choose the neighbors of each node among the candidates found by the KD-tree, as in Neighbors.Cloud.
+
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        ptr         m+1 x 1         Array           Position of the candidates of each node in cand.
+        cand                        Array           Candidates of all the nodes, sorted by index for each node.
+        radius                      Real            Search radius.
+        nvec                        integer         Maximum number of neighbors.
+
+    Output:
+        vec         m x nvec        Array           Array with matching neighbors of each node.
+    """
+
+    m   = len(ptr) - 1                                                              # The number of nodes.
+    vec = np.zeros((m, nvec), dtype=np.int64) - 1                                   # The array for the neighbors is initialized.
+    d2  = np.zeros(nvec)                                                            # Distance to the saved neighbors.
+    for i in range(m):                                                              # For each of the nodes.
+        c = 0                                                                       # Number of neighbors found.
+        for s in range(ptr[i], ptr[i+1]):                                           # For each of the candidates.
+            j = cand[s]
+            d = np.sqrt((p[i,0] - p[j,0])**2 + (p[i,1] - p[j,1])**2)                # Distance to the central node.
+            if j == i or not d < radius:                                            # The node itself and the nodes on the radius.
+                continue
+            if c < nvec:                                                            # The first nvec neighbors are saved.
+                vec[i,c] = j
+                d2[c]    = d
+            else:                                                                   # The rest replace the farthest one.
+                I = np.argmax(d2)                                                   # Look for the greatest distance.
+                if d < d2[I]:                                                       # If the new node is closer.
+                    vec[i,I] = j                                                    # The new neighbor replace the farthest one.
+                    d2[I]    = d                                                    # Its distance is updated.
+            c += 1
+    return vec
@@ -0,0 +1,237 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+# Geometric multigrid
+# The coarse meshes are found by taking every other node of the curvilinear coordinates, and the Gammas are computed again on each
+# level, so every level has its own Generalized Finite Differences operator. The residual is restricted by full weighting and the
+# correction is interpolated bilinearly, both in the logical (i, j) space. The smoother is the multicolor Gauss-Seidel of
+# Relaxation.Mesh and the coarsest level is solved with a sparse LU factorization.
+# Taking every other node only gives a coarse mesh when the number of nodes on each side is odd, as in the meshes of Data/ (21, 41
+# and 81 nodes). A side with an even number of nodes stops the coarsening, and a warning is issued, since the coarsest level, solved
+# by LU, is then a large mesh or the fine mesh itself.
+
+import warnings
+
+import numpy as np
+import Scripts.Gammas as Gammas
+import Scripts.Relaxation as Relaxation
+import Scripts.Solvers as Solvers
+from Scripts.Gammas import Stencil
+
+def Hierarchy(x, y, L, Gamma = None, m_min = 5):
+    """
+    Hierarchy
+    Function to build the levels of the multigrid method for a logically rectangular mesh.
+    A mesh is coarsened while it has an odd number of nodes on each side and more than m_min of them. If a side with an even
+    number of nodes stops the coarsening before that, a warning is issued: the coarsest level is then factorized as it is.
+
+    Input:
+        x           m x n           Array           Array with the coordinates in x of the nodes.
+        y           m x n           Array           Array with the coordinates in y of the nodes.
+        L           5 x 1           Array           Array with the values of the differential operator.
+        Gamma       m x n x 9       Array           Array with the gamma values of the finest mesh, computed if not given.
+        m_min                       integer         Minimum number of nodes on each side of a coarse mesh.
+
+    Output:
+        levels                      list            List with the Gammas of each level, from the finest to the coarsest.
+        factor                      SuperLU         LU factorization of the K matrix of the coarsest level.
+    """
+
+    if Gamma is None:                                                               # If the Gammas are not given.
+        Gamma = Gammas.Mesh(x, y, L)                                                # Gamma computation.
+    levels = [Gamma]                                                                # The finest level.
+    m, n   = x.shape                                                                # The size of the mesh.
+    while m % 2 == 1 and n % 2 == 1 and (m+1)//2 >= m_min and (n+1)//2 >= m_min:    # While the mesh can be coarsened.
+        x = x[::2, ::2]                                                             # Coordinates in x of the coarse mesh.
+        y = y[::2, ::2]                                                             # Coordinates in y of the coarse mesh.
+        m, n = x.shape                                                              # The size of the coarse mesh.
+        levels.append(Gammas.Mesh(x, y, L))                                         # Gamma computation on the coarse mesh.
+    if (m % 2 == 0 or n % 2 == 0) and (m+1)//2 >= m_min and (n+1)//2 >= m_min:      # If an even side stopped the coarsening.
+        warnings.warn('Multigrid.Hierarchy cannot coarsen a mesh of ' + str(m) + ' x ' + str(n) + ' nodes, only an odd number ' + \
+                      'of nodes on each side can be coarsened; it is solved by LU after ' + str(len(levels) - 1) + ' coarsenings.', \
+                      RuntimeWarning, stacklevel = 2)
+    K      = Gammas.Assemble_Mesh(levels[-1], sparse = True)                        # K matrix of the coarsest level.
+    factor = Solvers.Factor(K)                                                      # K is factorized.
+    return levels, factor
+
+def Residual(Gamma, u, F):
+    """
+    Residual
+    Function to compute the residual F - K u on the interior nodes of a logically rectangular mesh.
+
+    Input:
+        Gamma       m x n x 9       Array           Array with the computed gamma values.
+        u           m x n           Array           Array with the current approximation.
+        F           m x n           Array           Array with the right side of the equation evaluated on the nodes.
+
+    Output:
+        r           m x n           Array           Array with the residual, zero on the boundary.
+    """
+
+    m, n = u.shape                                                                  # The size of the mesh.
+    r    = np.zeros([m, n])                                                         # r initialization with zeros.
+    r[1:m-1, 1:n-1] = F[1:m-1, 1:n-1] - Gamma[1:m-1, 1:n-1, 0]*u[1:m-1, 1:n-1]      # The central node.
+    for k, (di, dj) in enumerate(Stencil):                                          # For each of the neighbor nodes.
+        r[1:m-1, 1:n-1] -= Gamma[1:m-1, 1:n-1, k+1]*u[1+di:m-1+di, 1+dj:n-1+dj]     # The neighbor contribution is removed.
+    return r
+
+def Restrict(r):
+    """
+    Restrict
+    Function to restrict a residual to the coarse mesh by full weighting.
+
+    Input:
+        r           m x n           Array           Array with the residual on the fine mesh, zero on the boundary.
+
+    Output:
+        rc          mc x nc         Array           Array with the residual on the coarse mesh, zero on the boundary.
+    """
+
+    m, n = r.shape                                                                  # The size of the fine mesh.
+    rc   = np.zeros([(m+1)//2, (n+1)//2])                                           # rc initialization with zeros.
+    rc[1:-1, 1:-1] = (4*r[2:m-1:2, 2:n-1:2] + \
+                      2*(r[1:m-2:2, 2:n-1:2] + r[3:m:2, 2:n-1:2] + r[2:m-1:2, 1:n-2:2] + r[2:m-1:2, 3:n:2]) + \
+                      r[1:m-2:2, 1:n-2:2] + r[3:m:2, 1:n-2:2] + r[1:m-2:2, 3:n:2] + r[3:m:2, 3:n:2])/16
+    return rc
+
+def Prolong(ec):
+    """
+    Prolong
+    Function to interpolate a correction from the coarse mesh to the fine mesh, bilinearly in the logical space.
+
+    Input:
+        ec          mc x nc         Array           Array with the correction on the coarse mesh.
+
+    Output:
+        e           m x n           Array           Array with the correction on the fine mesh.
+    """
+
+    mc, nc = ec.shape                                                               # The size of the coarse mesh.
+    e      = np.zeros([2*mc-1, 2*nc-1])                                             # e initialization with zeros.
+    e[::2, ::2]   = ec                                                              # The coarse nodes.
+    e[1::2, ::2]  = (ec[:-1,:] + ec[1:,:])/2                                        # The nodes between two coarse nodes in x.
+    e[::2, 1::2]  = (ec[:,:-1] + ec[:,1:])/2                                        # The nodes between two coarse nodes in y.
+    e[1::2, 1::2] = (ec[:-1,:-1] + ec[1:,:-1] + ec[:-1,1:] + ec[1:,1:])/4           # The nodes in the middle of a coarse cell.
+    return e
+
+def Cycle(levels, factor, l, u, F, nu1 = 2, nu2 = 2, omega = 1):
+    """
+    Cycle
+    Function to apply a V-cycle from level l to the coarsest one.
+
+    Input:
+        levels                      list            List with the Gammas of each level.
+        factor                      SuperLU         LU factorization of the K matrix of the coarsest level.
+        l                           integer         Level to start the cycle.
+        u           m x n           Array           Array with the current approximation on level l.
+        F           m x n           Array           Array with the right side on level l.
+        nu1                         integer         Number of smoothing sweeps before the coarse correction.
+        nu2                         integer         Number of smoothing sweeps after the coarse correction.
+        omega                       Real            Relaxation weight of the smoother.
+
+    Output:
+        u           m x n           Array           Array with the improved approximation on level l.
+    """
+
+    Gamma = levels[l]                                                               # The Gammas of the level.
+    m, n  = u.shape                                                                 # The size of the mesh.
+    if l == len(levels) - 1:                                                        # If this is the coarsest level.
+        R = F.copy()                                                                # The right hand side of K.
+        R[0,:], R[m-1,:], R[:,0], R[:,n-1] = u[0,:], u[m-1,:], u[:,0], u[:,n-1]     # The boundary rows hold the boundary values.
+        return factor.solve(R.transpose().ravel()).reshape([n, m]).transpose()      # The nodes are numbered as i + j*m.
+
+    if nu1 > 0:                                                                     # Pre-smoothing.
+        u = Relaxation.Mesh(Gamma, u, F, 'gs', omega, 0, nu1 - 1)[0]
+    rc = Restrict(Residual(Gamma, u, F))                                            # The residual on the coarse mesh.
+    ec = Cycle(levels, factor, l + 1, np.zeros(rc.shape), rc, nu1, nu2, omega)      # The coarse correction, with zero boundary.
+    u  = u + Prolong(ec)                                                            # The correction is added.
+    if nu2 > 0:                                                                     # Post-smoothing.
+        u = Relaxation.Mesh(Gamma, u, F, 'gs', omega, 0, nu2 - 1)[0]
+    return u
+
+def Mesh(x, y, L, u_ap, F, Gamma = None, fmg = True, nu1 = 2, nu2 = 2, omega = 1, tol = 1e-10, m_it = 100, callback = None):
+    """
+    Mesh
+    Function to solve the Generalized Finite Differences system of a logically rectangular mesh by geometric multigrid.
+    The boundary values must be already stored in u_ap, only the interior nodes are updated. The mesh is only coarsened while it
+    has an odd number of nodes on each side (see Hierarchy).
+
+    Input:
+        x           m x n           Array           Array with the coordinates in x of the nodes.
+        y           m x n           Array           Array with the coordinates in y of the nodes.
+        L           5 x 1           Array           Array with the values of the differential operator.
+        u_ap        m x n           Array           Array with the initial approximation and the boundary conditions.
+        F           m x n           Array           Array with the right side of the equation evaluated on the nodes.
+        Gamma       m x n x 9       Array           Array with the gamma values of the mesh, computed if not given.
+        fmg                         bool            If True, the initial approximation is found with a Full Multigrid cycle,
+                                                    solving first on the coarsest mesh and interpolating to the finer ones.
+        nu1                         integer         Number of smoothing sweeps before the coarse correction.
+        nu2                         integer         Number of smoothing sweeps after the coarse correction.
+        omega                       Real            Relaxation weight of the smoother.
+        tol                         Real            Tolerance for the residual, relative to the one of a zero initial
+                                                    approximation, so a good initial approximation saves cycles.
+        m_it                        integer         Maximum number of V-cycles.
+        callback                    function        Function called with the largest residual after each cycle.
+                                                    The cycles stop as soon as the residual is not finite, which happens
+                                                    when the smoother diverges on the mesh.
+
+    Output:
+        u_ap        m x n           Array           Array with the computed approximation.
+        iter                        integer         Number of V-cycles.
+        reason                      string          Reason to stop (see Relaxation.Reasons). A warning is issued if the
+                                                    cycles did not converge.
+    """
+
+    # Variable initialization
+    levels, factor = Hierarchy(x, y, L, Gamma)                                      # The levels of the method.
+    u_ap = np.array(u_ap, dtype=float)                                              # The approximation is copied.
+    iter = 0                                                                        # Number of iterations.
+    u_z  = u_ap.copy()
+    u_z[1:-1, 1:-1] = 0                                                             # Zero initial approximation.
+    r0   = np.abs(Residual(levels[0], u_z, F)).max()                                # Reference residual.
+
+    # Full Multigrid
+    if fmg and len(levels) > 1:                                                     # If the Full Multigrid cycle is used.
+        us = [u_ap]                                                                 # Approximations on each level.
+        Fs = [F]                                                                    # Right sides on each level.
+        for l in range(1, len(levels)):                                             # For each coarse level.
+            us.append(us[-1][::2, ::2].copy())                                      # The boundary values are injected.
+            Fs.append(Fs[-1][::2, ::2].copy())                                      # f is evaluated on the coarse nodes.
+        u = Cycle(levels, factor, len(levels)-1, us[-1], Fs[-1])                    # Solution on the coarsest level.
+        for l in range(len(levels)-2, -1, -1):                                      # From the coarse to the fine levels.
+            e = Prolong(u)                                                          # The solution is interpolated.
+            u = us[l]                                                               # The boundary values of the level.
+            u[1:-1, 1:-1] = e[1:-1, 1:-1]                                           # The interpolation on the interior nodes.
+            u = Cycle(levels, factor, l, u, Fs[l], nu1, nu2, omega)                 # One V-cycle on the level.
+        u_ap = u                                                                    # The approximation on the finest mesh.
+        iter = 1                                                                    # The Full Multigrid cycle.
+
+    # V-cycles
+    err = np.abs(Residual(levels[0], u_ap, F)).max()                                # Current residual.
+    if callback is not None and iter > 0:                                           # If the history is requested.
+        callback(err)
+    while np.isfinite(err) and err > tol*r0 and iter < m_it:                        # Stop if the cycles diverged.
+        u_ap = Cycle(levels, factor, 0, u_ap, F, nu1, nu2, omega)                   # One V-cycle.
+        err  = np.abs(Residual(levels[0], u_ap, F)).max()                           # Residual computation.
+        iter += 1                                                                   # 1 is added to the number of iterations.
+        if callback is not None:                                                    # If the history is requested.
+            callback(err)
+    reason = 'residual' if err <= tol*r0 else 'diverged' if not np.isfinite(err) else 'm_it'
+    Relaxation.Warn('Multigrid.Mesh', reason, iter)                                 # If it did not converge.
+
+    return u_ap, iter, reason
@@ -16,16 +16,51 @@ Last Modification:
     March, 2023.
 """
 
+import warnings
+import itertools
 import numpy as np
+import Scripts.Geometry as Geometry
+import Scripts.Kernels as Kernels
+from scipy.spatial import cKDTree
+
+def Adjacency(tt, m):
+    """
+    Adjacency
+    Function to find the vertex to vertex adjacency of a triangulation from its list of edges.
+    The edges are sorted and made unique once, and the result is stored in CSR format: the neighbors of node i are
+    indices[indptr[i]:indptr[i+1]], sorted by index.
+    
+    Input:
+        tt          n x 3           double          Array with the correspondence of the n triangles.
+        m                           integer         Number of nodes.
+    
+    Output:
+        indptr      m+1 x 1         integer         Array with the position of the first neighbor of each node in indices.
+        indices     k x 1           integer         Array with the neighbors of all the nodes.
+    """
+
+    tt      = np.asarray(tt, dtype=int)                                             # The triangles as integers.
+    e       = tt[:, [0, 1, 1, 2, 2, 0]].reshape([-1, 2])                            # The three edges of each triangle.
+    e       = np.vstack([e, e[:, ::-1]])                                            # Each edge in both directions.
+    e       = e[e[:,0] != e[:,1]]                                                   # Degenerate edges are discarded.
+    key     = np.unique(e[:,0]*m + e[:,1])                                          # Edges are sorted and made unique.
+    rows    = key//m                                                                # The node of each edge.
+    indices = key%m                                                                 # The neighbor of each edge.
+    indptr  = np.zeros([m+1], dtype=int)                                            # indptr initialization with zeros.
+    indptr[1:] = np.cumsum(np.bincount(rows, minlength=m))                          # Position of the neighbors of each node.
+    return indptr, indices
 
 def Triangulation(p, tt, nvec):
     """
     Triangulation
     Function to find the neighbor nodes in a triangulation.
+    The neighbors of each node are the nodes that share an edge with it, sorted by index. Only the first nvec are kept, and
+    a warning lists the nodes with more neighbors than that.
     
     Input:
-        p           m x 2           double          Array with the coordinates of the nodes.
-        tt          n x 3           double          Array with the correspondence of the n triangles.
+        p           m x 2           double          Array with the coordinates of the nodes, or a Geometry (see Geometry).
+        tt          n x 3           double          Array with the correspondence of the n triangles, or None for the ones of
+                                                    the Geometry.
         nvec                        integer         Maximum number of neighbors.
     
     Output:
@@ -33,69 +68,96 @@ def Triangulation(p, tt, nvec):
     """
 
     # Variable initialization
+    if isinstance(p, Geometry.Geometry) and tt is None:                             # The triangles of the Geometry.
+        tt = p.tt
+    p, _ = Geometry.Split(p)                                                        # A Geometry is given as loose arrays.
     m   = len(p[:,0])                                                               # The size if the triangulation is obtained.
     vec = np.zeros([m, nvec], dtype=int)-1                                          # The array for the neighbors is initialized.
 
     # Neighbor search
-    for i in np.arange(m):                                                          # For each of the nodes.
-        kn    = np.argwhere(tt == i)                                                # Search in which triangles the node appears.
-        vec2  = np.setdiff1d(tt[kn[:,0]], i)                                        # Neighbors are stored inside vec2.
-        vec2  = np.vstack([vec2])                                                   # Convert vec2 to a column.
-        nvec2 = sum(vec2[0,:] != -1)                                                # The number of neighbors of the node is calculated.
-        nnvec = np.minimum(nvec, nvec2)                                             # The real number of neighbors.
-        for j in np.arange(nnvec):                                                  # For each of the nodes.
-            vec[i,j] = vec2[0,j]                                                    # Neighbors are saved.
+    indptr, indices = Adjacency(tt, m)                                              # Adjacency of the triangulation.
+    valence = np.diff(indptr)                                                       # The true number of neighbors of each node.
+    rows    = np.repeat(np.arange(m), valence)                                      # The node of each neighbor.
+    rank    = np.arange(len(indices)) - indptr[rows]                                # Position of each neighbor in its node.
+    keep    = rank < nvec                                                           # Only nvec neighbors fit in vec.
+    vec[rows[keep], rank[keep]] = indices[keep]                                     # Neighbors are saved.
+
+    # Nodes with too many neighbors
+    over = np.where(valence > nvec)[0]                                              # Nodes whose neighbors do not fit in vec.
+    if len(over) > 0:                                                               # If some neighbors were dropped.
+        nodes = ', '.join(str(i) for i in over[:10]) + (', ...' if len(over) > 10 else '')
+        warnings.warn(str(len(over)) + ' nodes have more than ' + str(nvec) + \
+                      ' neighbors, only the first ' + str(nvec) + ' are kept: ' + \
+                      nodes, stacklevel=2)                                          # The nodes are reported.
     return vec
 
-def Cloud(p, nvec):
+def Cloud(p, nvec, method = 'radius', radius = None):
     """
     Clouds
     Routine to find the neighbor nodes in a cloud of points generated with dmsh on Python.
+    The search uses a KD-tree, so it takes O(m log m) operations instead of comparing all the pairs of nodes.
     
     Input:
-        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary, or a
+                                                    Geometry (see Geometry).
         nvec                        integer         Maximum number of neighbors.
+        method                      string          Search method:
+                                                        'radius'    The nodes closer than radius are neighbors. If there are more
+                                                                    than nvec, the closest ones are kept.
+                                                        'knn'       The nvec nearest nodes are neighbors, sorted by distance.
+        radius                      Real            Search radius. By default 3/2 of the largest distance from a node to its
+                                                    nearest node, as in the original dmsh clouds.
     
     Output:
         vec         m x nvec        double          Array with matching neighbors of each node.
     """
 
     # Variable initialization
+    p, _ = Geometry.Split(p)                                                        # A Geometry is given as loose arrays.
     m    = len(p[:,0])                                                              # The size if the triangulation is obtained.
     vec  = np.zeros([m, nvec], dtype=int) - 1                                       # The array for the neighbors is initialized.
-    dmin = np.zeros([m, 1]) + 1                                                     # dmin initialization with a "big" value.
+    tree = cKDTree(p[:,0:2])                                                        # Spatial index of the nodes.
+
+    # k nearest neighbors
+    if method == 'knn':                                                             # If the nearest nodes are requested.
+        k       = min(nvec + 1, m)                                                  # The node itself is also found.
+        d, near = tree.query(p[:,0:2], k=k)                                         # Search of the nearest nodes.
+        near    = near.reshape([m, k])                                              # Keep the array 2D even if k = 1.
+        keep    = near != np.arange(m)[:,None]                                      # The central node is discarded.
+        for i in np.arange(m):                                                      # For each of the nodes.
+            nb = near[i, keep[i]][:nvec]                                            # The nearest nodes.
+            vec[i,:len(nb)] = nb                                                    # Neighbors are saved.
+        return vec
+    elif method != 'radius':                                                        # Any other method is not available.
+        raise ValueError('Unknown neighbor search method: ' + str(method))
 
     # Delta computation for finding neighbors
-    for i in np.arange(m):                                                          # For each of the nodes.
-        x    = p[i,0]                                                               # x coordinate of the central node.
-        y    = p[i,1]                                                               # y coordinate of the central node.
-        for j in np.arange(m):                                                      # For all the nodes.
-            if i != j:                                                              # If the the node is different to the central one.
-                x1 = p[j,0]                                                         # x coordinate of the possible neighbor.
-                y1 = p[j,1]                                                         # y coordinate of the possible neighbor.
-                d  = np.sqrt((x - x1)**2 + (y - y1)**2)                             # Distance from the possible neighbor to the central node.
-                dmin[i] = min(dmin[i],d)                                            # Look for the minimum distance.
-    dist = (3/2)*max(max(dmin))
+    if radius is None:                                                              # If the radius is not given.
+        d, near = tree.query(p[:,0:2], k=2)                                         # The closest node, other than the node itself.
+        near    = np.where(near[:,0] == np.arange(m), near[:,1], near[:,0])         # Discard the node itself.
+        dmin    = np.sqrt((p[:,0] - p[near,0])**2 + (p[:,1] - p[near,1])**2)        # Distance from each node to its closest node.
+        radius  = (3/2)*min(1, dmin.max())                                          # The search radius.
 
     # Search of the neighbor nodes
+    cand = tree.query_ball_point(p[:,0:2], r=radius, return_sorted=True)            # Candidates to be neighbors, sorted by index.
+    if Kernels.Use:                                                                 # Node by node, compiled with Numba.
+        ptr  = np.concatenate([[0], np.cumsum([len(c) for c in cand])])             # Position of the candidates of each node.
+        flat = np.fromiter(itertools.chain.from_iterable(cand), dtype=np.int64, count=ptr[-1])
+        return Kernels.Select(np.ascontiguousarray(p, dtype=float), ptr, flat, float(radius), nvec)
     for i in np.arange(m):                                                          # For each of the nodes.
-        x    = p[i,0]                                                               # x coordinate of the central node.
-        y    = p[i,1]                                                               # y coordinate of the central node.
-        temp = 0                                                                    # Temporal variable as a counter.
-        for j in np.arange(m):                                                      # For all the interior nodes.
-            if i != j:                                                              # Check that we are not working with the central node.
-                x1 = p[j,0]                                                         # x coordinate of the possible neighbor.
-                y1 = p[j,1]                                                         # y coordinate of the possible neighbor.
-                d  = np.sqrt((x - x1)**2 + (y - y1)**2)                             # Distance from the possible neighbor to the central node.
-                if d < dist:                                                        # If the distance is smaller or equal to the tolerance distance.
-                    if temp < nvec:                                                 # If the number of neighbors is smaller than nvec.
-                        vec[i,temp] = j                                             # Save the neighbor.
-                        temp       += 1                                             # Increase the counter by 1.
-                    else:                                                           # If the number of neighbors is greater than nvec.
-                        x2 = p[vec[i,:],0]                                          # x coordinates of the current neighbor nodes.
-                        y2 = p[vec[i,:],1]                                          # y coordinates of the current neighbor nodes.
-                        d2 = np.sqrt((x - x2)**2 + (y - y2)**2)                     # The total distance from all the neighbors to the central node.
-                        I  = np.argmax(d2)                                          # Look for the greatest distance.
-                        if d < d2[I]:                                               # If the new node is closer than the farthest neighbor.
-                            vec[i,I] = j                                            # The new neighbor replace the farthest one.
-    return vec
\ No newline at end of file
+        nb = np.array(cand[i], dtype=int)                                           # Candidates of the node.
+        d  = np.sqrt((p[i,0] - p[nb,0])**2 + (p[i,1] - p[nb,1])**2)                 # Distance from the candidates to the central node.
+        ok = (nb != i) & (d < radius)                                               # The node itself and the nodes on the radius are discarded.
+        nb = nb[ok]                                                                 # The neighbors of the node.
+        d  = d[ok]                                                                  # Distance to the neighbors.
+        if len(nb) <= nvec:                                                         # If the number of neighbors is at most nvec.
+            vec[i,:len(nb)] = nb                                                    # Neighbors are saved.
+        else:                                                                       # If the number of neighbors is greater than nvec.
+            vec[i,:] = nb[:nvec]                                                    # The first nvec neighbors are saved.
+            d2       = d[:nvec].copy()                                              # Distance to the saved neighbors.
+            for j in np.arange(nvec, len(nb)):                                      # For the rest of the neighbors.
+                I = np.argmax(d2)                                                   # Look for the greatest distance.
+                if d[j] < d2[I]:                                                    # If the new node is closer than the farthest neighbor.
+                    vec[i,I] = nb[j]                                                # The new neighbor replace the farthest one.
+                    d2[I]    = d[j]                                                 # Its distance is updated.
+    return vec
@@ -0,0 +1,109 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+# Profiling
+# A report is a dict with the measurements of each stage of a routine and the convergence history of its solver.
+# The stages are measured with the Stage context manager; with no report it does nothing, so the routines keep a single code path
+# and pay nothing when the profiling is off. The peak memory of a stage is only measured if tracemalloc is already tracing, since
+# tracing slows down every allocation.
+
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+Null = nullcontext()                                                                # Stage used when the profiling is off.
+
+def Report():
+    """
+    Report
+    Function to start an empty report.
+
+    Output:
+        report                      dict            Report with:
+                                                        'stages'    Dict with the measurements of each stage, in the order
+                                                                    they were run: 'time' in seconds, 'net_blocks' the change
+                                                                    in the number of blocks held by the Python object
+                                                                    allocator (sys.getallocatedblocks), which leaves out the
+                                                                    NumPy buffers and is not a count of allocations, and
+                                                                    'memory' peak in bytes if tracemalloc is tracing.
+                                                        'history'   List with the error of each iteration of the solver.
+    """
+
+    return {'stages': {}, 'history': []}
+
+@contextmanager
+def Measure(report, name):
+    """
+    Measure
+    Context manager that measures the code run inside it as a stage of the report.
+
+    Input:
+        report                      dict            Report, the stage is added.
+        name                        string          Name of the stage.
+    """
+
+    trace = tracemalloc.is_tracing()                                                # If the memory can be measured.
+    if trace:
+        tracemalloc.reset_peak()                                                    # The peak of this stage only.
+    b0 = sys.getallocatedblocks()                                                   # Blocks held before the stage.
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        stage = report['stages'].setdefault(name, {'time': 0.0, 'net_blocks': 0})   # A repeated stage is accumulated.
+        stage['time']       += time.perf_counter() - t0
+        stage['net_blocks'] += sys.getallocatedblocks() - b0
+        if trace:
+            stage['memory'] = max(stage.get('memory', 0), tracemalloc.get_traced_memory()[1])
+
+def Stage(report, name):
+    """
+    Stage
+    Function to get the context manager of a stage.
+
+    Input:
+        report                      dict            Report, None if the profiling is off.
+        name                        string          Name of the stage.
+
+    Output:
+        stage                                       Context manager that measures the stage, or does nothing if there is
+                                                    no report.
+    """
+
+    if report is None:                                                              # If the profiling is off.
+        return Null
+    return Measure(report, name)
+
+def History(report):
+    """
+    History
+    Function to get the callback that stores the convergence history of a solver.
+
+    Input:
+        report                      dict            Report, None if the profiling is off.
+
+    Output:
+        callback                    function        Function called with the error of each iteration, None if there is no
+                                                    report.
+    """
+
+    if report is None:                                                              # If the profiling is off.
+        return None
+    history = report['history']
+    return lambda err: history.append(float(err))                                   # Plain floats, so the report is JSON.
@@ -0,0 +1,556 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+import warnings
+import numpy as np
+import Scripts.Geometry as Geometry
+import Scripts.Kernels as Kernels
+from Scripts.Gammas import Stencil
+
+DI = np.array([di for di, dj in Stencil])                                           # Neighbor positions in x, for the kernels.
+DJ = np.array([dj for di, dj in Stencil])                                           # Neighbor positions in y, for the kernels.
+
+Reasons = {'residual':  'the residual reached the tolerance',                       # Why an iteration stopped.
+           'update':    'the update reached the tolerance',
+           'stalled':   'the residual stagnated',
+           'diverged':  'the iteration diverged',
+           'm_it':      'the maximum number of iterations was reached',
+           'breakdown': 'the Krylov iteration broke down'}
+Converged = ('residual', 'update')                                                  # The reasons that mean convergence.
+
+def Mesh_Update(Gamma, u_ap, F, i0, j0, step):
+    """
+    Mesh_Update
+    Function to compute the Gauss-Seidel value of a set of interior nodes of a logically rectangular mesh.
+    The set is formed by the nodes i0, i0 + step, ... in x and j0, j0 + step, ... in y.
+
+    Input:
+        Gamma       m x n x 9       Array           Array with the computed gamma values.
+        u_ap        m x n           Array           Array with the current approximation.
+        F           m x n           Array           Array with the right side of the equation evaluated on the nodes.
+        i0                          integer         First node of the set in x.
+        j0                          integer         First node of the set in y.
+        step                        integer         Distance between the nodes of the set.
+
+    Output:
+        t           p x q           Array           Array with the new values on the nodes of the set.
+    """
+
+    m, n = u_ap.shape                                                               # The size of the mesh.
+    I    = slice(i0, m-1, step)                                                     # Nodes of the set in x.
+    J    = slice(j0, n-1, step)                                                     # Nodes of the set in y.
+    t    = F[I, J].copy()                                                           # t is initialized with the right side.
+    for k, (di, dj) in enumerate(Stencil):                                          # For each of the neighbor nodes.
+        t -= Gamma[I, J, k+1]*u_ap[i0+di:m-1+di:step, j0+dj:n-1+dj:step]            # The neighbor contribution is removed.
+    t /= Gamma[I, J, 0]                                                             # The central node is added to the approximation.
+    return t
+
+def Mesh_Residual(Gamma, u_ap, F):
+    """
+    Mesh_Residual
+    Function to compute the largest residual F - K u on the interior nodes of a logically rectangular mesh.
+
+    Input:
+        Gamma       m x n x 9       Array           Array with the computed gamma values.
+        u_ap        m x n           Array           Array with the current approximation.
+        F           m x n           Array           Array with the right side of the equation evaluated on the nodes.
+
+    Output:
+        res                         Real            Largest absolute residual.
+    """
+
+    m, n = u_ap.shape                                                               # The size of the mesh.
+    r    = Gamma[1:m-1, 1:n-1, 0]*(Mesh_Update(Gamma, u_ap, F, 1, 1, 1) - u_ap[1:m-1, 1:n-1])
+    return np.abs(r).max() if r.size > 0 else 0.0
+
+def Stop(res, r0, rtol, atol, best, since, stall):
+    """
+    Stop
+    Function to check the residual based stopping criteria of the relaxation methods.
+
+    Input:
+        res                         Real            Current residual.
+        r0                          Real            Reference residual, of the zero initial approximation.
+        rtol                        Real            Tolerance relative to the reference residual.
+        atol                        Real            Absolute tolerance.
+        best                        Real            Smallest residual found so far.
+        since                       integer         Number of iterations since the smallest residual was found.
+        stall                       integer         Number of iterations without a new smallest residual after which the
+                                                    iteration is stagnated, 0 to never stop by stagnation.
+
+    Output:
+        stop                        string          Reason to stop (see Reasons), empty if the iteration goes on: 'residual'
+                                                    if it reached the tolerance, 'diverged' if it is not finite, or
+                                                    'stalled'.
+        best                        Real            Smallest residual found so far, updated.
+        since                       integer         Number of iterations since the smallest residual was found, updated.
+    """
+
+    if not np.isfinite(res):                                                        # Diverged.
+        return 'diverged', best, since
+    if res <= max(atol, rtol*r0):                                                   # Converged.
+        return 'residual', best, since
+    if res < best:                                                                  # A new smallest residual.
+        return '', res, 0
+    stop = 'stalled' if stall > 0 and since + 1 >= stall else ''                    # Stagnation.
+    return stop, best, since + 1
+
+def Reason(stop, err, tol):
+    """
+    Reason
+    Function to find why a relaxation loop ended.
+
+    Input:
+        stop                        string          Reason given by Stop, empty if the residual criteria did not stop it.
+        err                         Real            Largest update of the last iteration.
+        tol                         Real            Tolerance for the largest update.
+
+    Output:
+        reason                      string          Reason to stop (see Reasons).
+    """
+
+    if stop:                                                                        # The residual criteria.
+        return stop
+    if not np.isfinite(err):                                                        # The update overflowed.
+        return 'diverged'
+    return 'update' if err < tol else 'm_it'
+
+def Warn(name, reason, iter):
+    """
+    Warn
+    Function to warn that a solver stopped without converging, so a stagnated or diverged iteration is not taken for a solution.
+
+    Input:
+        name                        string          Name of the solver.
+        reason                      string          Reason to stop (see Reasons).
+        iter                        integer         Number of iterations.
+    """
+
+    if reason not in Converged:                                                     # If it did not converge.
+        warnings.warn(name + ' did not converge after ' + str(iter) + ' iterations: ' + Reasons[reason] + '.', \
+                      RuntimeWarning, stacklevel = 3)
+
+def Radius(jacobi, v, it = 50):
+    """
+    Radius
+    Function to estimate the spectral radius of the Jacobi iteration matrix with a few power iterations.
+    The growth of two consecutive iterations is averaged, since the largest eigenvalues may come in pairs of opposite sign.
+
+    Input:
+        jacobi                      function        Function that applies the Jacobi iteration matrix to a vector.
+        v                           Array           Starting vector, zero on the boundary.
+        it                          integer         Number of power iterations.
+
+    Output:
+        rho                         Real            Estimation of the spectral radius.
+    """
+
+    g = [1.0]                                                                       # Growth of each iteration.
+    v = v/np.linalg.norm(v)                                                         # The vector is normalized.
+    for k in range(it):                                                             # For each of the power iterations.
+        v = jacobi(v)                                                               # The matrix is applied.
+        g.append(np.linalg.norm(v))                                                 # Growth of the vector.
+        if g[-1] == 0 or not np.isfinite(g[-1]):                                    # If the vector vanished or overflowed.
+            return g[-1]
+        v = v/g[-1]                                                                 # The vector is normalized.
+    return np.sqrt(g[-1]*g[-2])
+
+def Omega(rho):
+    """
+    Omega
+    Function to compute the optimal successive over-relaxation weight, 2/(1 + sqrt(1 - rho^2)), from the spectral radius of the
+    Jacobi iteration matrix.
+
+    Input:
+        rho                         Real            Spectral radius of the Jacobi iteration matrix.
+
+    Output:
+        omega                       Real            Relaxation weight, 1 if rho >= 1 since then the estimation does not hold.
+    """
+
+    if not rho < 1:                                                                 # Jacobi does not converge.
+        return 1.0
+    return 2/(1 + np.sqrt(1 - rho**2))                                              # Successive over-relaxation.
+
+def Relax(omega):
+    """
+    Relax
+    Function to get the weight of the restart of an over-relaxation that did not reach the tolerance: halfway to 1, or 1 once it
+    is close, so the number of restarts is bounded.
+
+    Input:
+        omega                       Real            Relaxation weight of the failed iteration.
+
+    Output:
+        omega                       Real            Relaxation weight of the restart.
+    """
+
+    return 1 + (omega - 1)/2 if omega > 1.1 else 1
+
+def Mesh_Omega(Gamma, it = 50):
+    """
+    Mesh_Omega
+    Function to estimate the optimal relaxation weight of a logically rectangular mesh.
+
+    Input:
+        Gamma       m x n x 9       Array           Array with the computed gamma values.
+        it                          integer         Number of power iterations.
+
+    Output:
+        omega                       Real            Relaxation weight.
+    """
+
+    m, n = Gamma.shape[:2]                                                          # The size of the mesh.
+    Z    = np.zeros([m, n])                                                         # Zero right side and boundary.
+    def jacobi(v):                                                                  # Jacobi iteration matrix.
+        w = np.zeros([m, n])
+        w[1:m-1, 1:n-1] = Mesh_Update(Gamma, v, Z, 1, 1, 1)                         # -D^{-1} (K - D) v on the interior nodes.
+        return w
+    v = np.zeros([m, n])
+    v[1:m-1, 1:n-1] = np.random.default_rng(0).random([m-2, n-2])                   # Random starting vector.
+    return Omega(Radius(jacobi, v, it))
+
+def Mesh(Gamma, u_ap, F, method = 'gs', omega = 1, tol = 1e-16, m_it = 40000, callback = None, rtol = 0, atol = 0, stall = 0, restart = None):
+    """
+    Mesh
+    Function to solve the Generalized Finite Differences system of a logically rectangular mesh by relaxation.
+    The boundary values must be already stored in u_ap, only the interior nodes are updated.
+
+    Input:
+        Gamma       m x n x 9       Array           Array with the computed gamma values.
+        u_ap        m x n           Array           Array with the initial approximation and the boundary conditions.
+        F           m x n           Array           Array with the right side of the equation evaluated on the nodes.
+        method                      string          Relaxation method:
+                                                        'gs'            Multicolor Gauss-Seidel. The 9-point stencil couples the
+                                                                        diagonal nodes, so the red-black ordering is extended to the
+                                                                        four colors (i mod 2, j mod 2); nodes of the same color
+                                                                        are independent and updated at once.
+                                                        'jacobi'        Weighted Jacobi.
+                                                        'sequential'    Lexicographic Gauss-Seidel, node by node, compiled
+                                                                        with Numba if it is installed (see Kernels).
+        omega                       Real            Relaxation weight, or 'auto' to estimate the optimal one from the spectral
+                                                    radius of the Jacobi iteration matrix (see Mesh_Omega); the estimation
+                                                    only holds for Gauss-Seidel, 'jacobi' uses 1. If an over-relaxation
+                                                    does not reach the tolerance, the iteration is restarted with the weight
+                                                    halfway to 1.
+        tol                         Real            Tolerance for the largest update, 0 to stop only by the residual.
+        m_it                        integer         Maximum number of iterations.
+        callback                    function        Function called after each iteration with the largest residual, or with the
+                                                    largest update if no residual criterion is used.
+        rtol                        Real            Tolerance for the largest residual, relative to the one of a zero initial
+                                                    approximation, so a good initial approximation saves iterations.
+        atol                        Real            Absolute tolerance for the largest residual.
+        stall                       integer         Number of iterations without a new smallest residual after which the
+                                                    iteration stops, 0 to never stop by stagnation.
+                                                    The residual of a sweep is the largest residual of the nodes when they
+                                                    are updated, so it costs no extra pass; it is only computed if rtol,
+                                                    atol or stall is given. The iteration also stops if it is not finite.
+        restart                     function        Function called with the new weight each time an over-relaxation is
+                                                    restarted, so the weight finally used is known.
+
+    Output:
+        u_ap        m x n           Array           Array with the computed approximation.
+        iter                        integer         Number of iterations.
+        reason                      string          Reason to stop (see Reasons). A warning is issued if the iteration did
+                                                    not converge, unless no tolerance was given.
+    """
+
+    # Variable initialization
+    m, n = u_ap.shape                                                               # The size of the mesh.
+    err  = 1                                                                        # err initialization in 1.
+    iter = 0                                                                        # Number of iterations.
+    u_0  = u_ap                                                                     # The initial approximation.
+    u_ap = np.array(u_ap, dtype=float)                                              # The approximation is copied.
+    if omega == 'auto':                                                             # If the weight is estimated.
+        omega = 1 if method == 'jacobi' else Mesh_Omega(Gamma)                      # Over-relaxed Jacobi does not converge.
+    check = rtol > 0 or atol > 0 or stall > 0                                       # If the residual is needed.
+    stop  = ''                                                                      # Residual based stop.
+    if check:                                                                       # If the residual is needed.
+        u_z   = u_ap.copy()
+        u_z[1:m-1, 1:n-1] = 0                                                       # Zero initial approximation.
+        rz    = Mesh_Residual(Gamma, u_z, F)                                        # Reference residual.
+        r0    = Mesh_Residual(Gamma, u_ap, F)                                       # Initial residual.
+        best  = r0                                                                  # Smallest residual.
+        since = 0                                                                   # Iterations since the smallest residual.
+        stop  = 'residual' if r0 <= max(atol, rtol*rz) else ''                      # The initial guess may be good enough.
+
+    # Relaxation
+    while err >= tol and iter <= m_it and not stop:                                 # Check for iterations and tolerance.
+        err = 0                                                                     # Error becomes zero to be able to update.
+        res = 0                                                                     # Residual of the sweep.
+        if method == 'gs':                                                          # Multicolor Gauss-Seidel.
+            for i0 in (1, 2):                                                       # For each color in x.
+                for j0 in (1, 2):                                                   # For each color in y.
+                    u  = u_ap[i0:m-1:2, j0:n-1:2]                                   # View of the nodes of the color.
+                    d  = omega*(Mesh_Update(Gamma, u_ap, F, i0, j0, 2) - u)         # Update of the nodes of the color.
+                    u += d                                                          # The update is assigned.
+                    if d.size > 0:                                                  # If the color has nodes.
+                        err = max(err, np.abs(d).max())                             # Error computation.
+                        if check:                                                   # Residual of the nodes of the color.
+                            res = max(res, np.abs(d*Gamma[i0:m-1:2, j0:n-1:2, 0]).max())
+        elif method == 'jacobi':                                                    # Weighted Jacobi.
+            d    = omega*(Mesh_Update(Gamma, u_ap, F, 1, 1, 1) - u_ap[1:m-1, 1:n-1])# Update of all the interior nodes.
+            u_ap[1:m-1, 1:n-1] += d                                                 # The update is assigned.
+            err  = np.abs(d).max()                                                  # Error computation.
+            if check:                                                               # Residual of the interior nodes.
+                res = np.abs(d*Gamma[1:m-1, 1:n-1, 0]).max()
+        elif method == 'sequential':                                                # Lexicographic Gauss-Seidel.
+            err, res = Kernels.Mesh_Sweep(Gamma, u_ap, F, DI, DJ, omega)            # Node by node, compiled if possible.
+        else:                                                                       # Any other method is not available.
+            raise ValueError('Unknown relaxation method: ' + str(method))
+        iter += 1                                                                   # 1 is added to the number of iterations.
+        if check:                                                                   # Residual based stop.
+            res = res/omega                                                         # The residual of each node when it was updated.
+            stop, best, since = Stop(res, rz, rtol, atol, best, since, stall)
+        if callback is not None:                                                    # If the history is requested.
+            callback(res if check else err)
+
+    # Over-relaxation safeguard
+    reason = Reason(stop, err, tol)                                                 # Why the iteration ended.
+    if omega > 1 and reason not in Converged and iter < m_it:                       # If the over-relaxation diverged or stagnated.
+        omega = Relax(omega)                                                        # The weight of the restart.
+        if restart is not None:
+            restart(omega)
+        u_ap, it, reason = Mesh(Gamma, u_0, F, method, omega, tol, m_it - iter, callback, rtol, atol, stall, restart)
+        iter += it
+    elif check or tol > 0 or reason == 'diverged':                                  # Unless a fixed number of sweeps was asked.
+        Warn('Relaxation.Mesh', reason, iter)
+
+    return u_ap, iter, reason
+
+def Coloring(p, vec):
+    """
+    Coloring
+    Function to find a multicolor ordering of the interior nodes of a triangulation or an unstructured cloud of points.
+    Two nodes receive the same color only if neither of them is a neighbor of the other, so all the nodes of a color can be updated at once
+    keeping the Gauss-Seidel semantics.
+
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary, or a
+                                                    Geometry (see Geometry).
+        vec         m x nvec        Array           Array with the correspondence of the nvec neighbors of each node, or None
+                                                    for the ones of the Geometry.
+
+    Output:
+        color       m x 1           Array           Array with the color of each interior node, -1 for the boundary nodes.
+    """
+
+    # Variable initialization
+    m         = len(Geometry.Nodes(p)[0])                                           # The total number of nodes.
+    inner, nb = Geometry.Inner(p, vec)                                              # The interior nodes and their neighbors.
+    color     = np.zeros([m], dtype=int) - 1                                        # The colors are initialized with -1.
+    adj       = [[] for i in range(m)]                                              # Adjacency lists in both directions.
+    for k, j in np.argwhere(nb != -1):                                              # For each pair of neighbor nodes.
+        adj[inner[k]].append(nb[k, j])                                              # j is read when updating i.
+        adj[nb[k, j]].append(inner[k])                                              # i is read when updating j.
+
+    # Greedy coloring
+    for i in inner:                                                                 # For each of the interior nodes, in order.
+        used = set(color[adj[i]])                                                   # Colors already used by the neighbors.
+        c    = 0                                                                    # The first color is tried.
+        while c in used:                                                            # While the color is used by a neighbor.
+            c += 1                                                                  # The next color is tried.
+        color[i] = c                                                                # The color is assigned.
+
+    return color
+
+def Cloud_Update(idx, W, G0, Fi, u_ap):
+    """
+    Cloud_Update
+    Function to compute the Gauss-Seidel value of a set of nodes of a triangulation or an unstructured cloud of points.
+
+    Input:
+        idx         k x nvec        Array           Array with the neighbors of the nodes, the missing neighbors point to node 0.
+        W           k x nvec        Array           Array with the Gammas of the neighbors, zero for the missing neighbors.
+        G0          k x 1           Array           Array with the Gamma of the central nodes.
+        Fi          k x 1           Array           Array with the right side of the equation on the nodes.
+        u_ap        m x 1           Array           Array with the current approximation.
+
+    Output:
+        t           k x 1           Array           Array with the new values on the nodes.
+    """
+
+    return (Fi - (W*u_ap[idx]).sum(axis=1))/G0                                      # Gather, multiply and reduce over all the neighbors.
+
+def Cloud_Residual(idx, W, G0, Fi, u_ap, inner):
+    """
+    Cloud_Residual
+    Function to compute the largest residual F - K u on the interior nodes of a triangulation or an unstructured cloud of points.
+
+    Input:
+        idx         k x nvec        Array           Array with the neighbors of the nodes, the missing neighbors point to node 0.
+        W           k x nvec        Array           Array with the Gammas of the neighbors, zero for the missing neighbors.
+        G0          k x 1           Array           Array with the Gamma of the central nodes.
+        Fi          k x 1           Array           Array with the right side of the equation on the nodes.
+        u_ap        m x 1           Array           Array with the current approximation.
+        inner       k x 1           Array           Array with the indices of the nodes.
+
+    Output:
+        res                         Real            Largest absolute residual.
+    """
+
+    r = Fi - G0*u_ap[inner] - (W*u_ap[idx]).sum(axis=1)                             # Residual of each node.
+    return np.abs(r).max() if r.size > 0 else 0.0
+
+def Cloud_Omega(p, vec, Gamma, it = 50):
+    """
+    Cloud_Omega
+    Function to estimate the optimal relaxation weight of a triangulation or an unstructured cloud of points.
+
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary, or a
+                                                    Geometry (see Geometry).
+        vec         m x nvec        Array           Array with the correspondence of the nvec neighbors of each node, or None
+                                                    for the ones of the Geometry.
+        Gamma       m x nvec+1      Array           Array with the computed gamma values.
+        it                          integer         Number of power iterations.
+
+    Output:
+        omega                       Real            Relaxation weight.
+    """
+
+    m         = len(Geometry.Nodes(p)[0])                                           # The total number of nodes.
+    inner, nb = Geometry.Inner(p, vec)                                              # The interior nodes and their neighbors.
+    mask  = nb != -1                                                                # The existing neighbors of the interior nodes.
+    idx   = np.where(mask, nb, 0)                                                   # Padded neighbor indices.
+    W     = np.where(mask, Gamma[inner,1:], 0)                                      # Padded neighbor Gammas.
+    G0    = Gamma[inner,0]                                                          # Gammas of the central nodes.
+    Z     = np.zeros(len(inner))                                                    # Zero right side.
+    def jacobi(v):                                                                  # Jacobi iteration matrix.
+        w = np.zeros([m])
+        w[inner] = Cloud_Update(idx, W, G0, Z, v)                                   # -D^{-1} (K - D) v on the interior nodes.
+        return w
+    v = np.zeros([m])
+    v[inner] = np.random.default_rng(0).random(len(inner))                          # Random starting vector.
+    return Omega(Radius(jacobi, v, it))
+
+def Cloud(p, vec, Gamma, u_ap, F, method = 'gs', omega = 1, tol = 1e-10, m_it = 40000, callback = None, rtol = 0, atol = 0, stall = 0, restart = None):
+    """
+    Cloud
+    Function to solve the Generalized Finite Differences system of a triangulation or an unstructured cloud of points by relaxation.
+    The boundary values must be already stored in u_ap, only the interior nodes are updated.
+
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary, or a
+                                                    Geometry (see Geometry).
+        vec         m x nvec        Array           Array with the correspondence of the nvec neighbors of each node, or None
+                                                    for the ones of the Geometry.
+        Gamma       m x nvec+1      Array           Array with the computed gamma values.
+        u_ap        m x 1           Array           Array with the initial approximation and the boundary conditions.
+        F           m x 1           Array           Array with the right side of the equation evaluated on the nodes.
+        method                      string          Relaxation method:
+                                                        'gs'            Multicolor Gauss-Seidel, the colors are found with Coloring.
+                                                        'jacobi'        Weighted Jacobi.
+                                                        'sequential'    Gauss-Seidel in the order of the nodes, node by node,
+                                                                        compiled with Numba if it is installed (see Kernels).
+        omega                       Real            Relaxation weight, or 'auto' to estimate the optimal one from the spectral
+                                                    radius of the Jacobi iteration matrix (see Cloud_Omega); the estimation
+                                                    only holds for Gauss-Seidel, 'jacobi' uses 1. If an over-relaxation
+                                                    does not reach the tolerance, the iteration is restarted with the weight
+                                                    halfway to 1.
+        tol                         Real            Tolerance for the largest update, 0 to stop only by the residual.
+        m_it                        integer         Maximum number of iterations.
+        callback                    function        Function called after each iteration with the largest residual, or with the
+                                                    largest update if no residual criterion is used.
+        rtol                        Real            Tolerance for the largest residual, relative to the one of a zero initial
+                                                    approximation, so a good initial approximation saves iterations.
+        atol                        Real            Absolute tolerance for the largest residual.
+        stall                       integer         Number of iterations without a new smallest residual after which the
+                                                    iteration stops, 0 to never stop by stagnation.
+                                                    The residual of a sweep is the largest residual of the nodes when they
+                                                    are updated, so it costs no extra pass; it is only computed if rtol,
+                                                    atol or stall is given. The iteration also stops if it is not finite.
+        restart                     function        Function called with the new weight each time an over-relaxation is
+                                                    restarted, so the weight finally used is known.
+
+    Output:
+        u_ap        m x 1           Array           Array with the computed approximation.
+        iter                        integer         Number of iterations.
+        reason                      string          Reason to stop (see Reasons). A warning is issued if the iteration did
+                                                    not converge, unless no tolerance was given.
+    """
+
+    # Variable initialization
+    err   = 1                                                                       # err initialization in 1.
+    iter  = 0                                                                       # Number of iterations.
+    u_0   = u_ap                                                                    # The initial approximation.
+    u_ap  = np.array(u_ap, dtype=float)                                             # The approximation is copied.
+    inner, nb = Geometry.Inner(p, vec)                                              # The interior nodes and their neighbors.
+    mask  = nb != -1                                                                # The existing neighbors of the interior nodes.
+    idx   = np.where(mask, nb, 0)                                                   # Padded neighbor indices.
+    W     = np.where(mask, Gamma[inner,1:], 0)                                      # Padded neighbor Gammas.
+    G0    = Gamma[inner,0]                                                          # Gammas of the central nodes.
+    Fi    = F[inner]                                                                # Right side on the interior nodes.
+
+    if omega == 'auto':                                                             # If the weight is estimated.
+        omega = 1 if method == 'jacobi' else Cloud_Omega(p, vec, Gamma)             # Over-relaxed Jacobi does not converge.
+    if method == 'gs':                                                              # Multicolor Gauss-Seidel.
+        color  = Coloring(p, vec)[inner]                                            # Colors of the interior nodes.
+        groups = [np.where(color == c)[0] for c in np.unique(color)]                # The nodes of each color.
+        groups = [(inner[s], idx[s], W[s], G0[s], Fi[s]) for s in groups]           # The data of each color is gathered once.
+    elif method not in ('jacobi', 'sequential'):                                    # Any other method is not available.
+        raise ValueError('Unknown relaxation method: ' + str(method))
+    check = rtol > 0 or atol > 0 or stall > 0                                       # If the residual is needed.
+    stop  = ''                                                                      # Residual based stop.
+    if check:                                                                       # If the residual is needed.
+        u_z   = u_ap.copy()
+        u_z[inner] = 0                                                              # Zero initial approximation.
+        rz    = Cloud_Residual(idx, W, G0, Fi, u_z, inner)                          # Reference residual.
+        r0    = Cloud_Residual(idx, W, G0, Fi, u_ap, inner)                         # Initial residual.
+        best  = r0                                                                  # Smallest residual.
+        since = 0                                                                   # Iterations since the smallest residual.
+        stop  = 'residual' if r0 <= max(atol, rtol*rz) else ''                      # The initial guess may be good enough.
+
+    # Relaxation
+    while err >= tol and iter <= m_it and not stop:                                 # Check for iterations and tolerance.
+        err = 0                                                                     # Error becomes zero to be able to update.
+        res = 0                                                                     # Residual of the sweep.
+        if method == 'gs':                                                          # Multicolor Gauss-Seidel.
+            for nodes, gi, gW, gG0, gF in groups:                                   # For each color.
+                d = omega*(Cloud_Update(gi, gW, gG0, gF, u_ap) - u_ap[nodes])       # Update of the nodes of the color.
+                u_ap[nodes] += d                                                    # The update is assigned.
+                err = max(err, np.abs(d).max())                                     # Error computation.
+                if check:                                                           # Residual of the nodes of the color.
+                    res = max(res, np.abs(d*gG0).max())
+        elif method == 'jacobi':                                                    # Weighted Jacobi.
+            d = omega*(Cloud_Update(idx, W, G0, Fi, u_ap) - u_ap[inner])            # Update of all the interior nodes.
+            u_ap[inner] += d                                                        # The update is assigned.
+            err = np.abs(d).max()                                                   # Error computation.
+            if check:                                                               # Residual of the interior nodes.
+                res = np.abs(d*G0).max()
+        else:                                                                       # Gauss-Seidel node by node.
+            err, res = Kernels.Cloud_Sweep(inner, idx, W, G0, Fi, u_ap, omega)      # Node by node, compiled if possible.
+        iter += 1                                                                   # 1 is added to the number of iterations.
+        if check:                                                                   # Residual based stop.
+            res = res/omega                                                         # The residual of each node when it was updated.
+            stop, best, since = Stop(res, rz, rtol, atol, best, since, stall)
+        if callback is not None:                                                    # If the history is requested.
+            callback(res if check else err)
+
+    # Over-relaxation safeguard
+    reason = Reason(stop, err, tol)                                                 # Why the iteration ended.
+    if omega > 1 and reason not in Converged and iter < m_it:                       # If the over-relaxation diverged or stagnated.
+        omega = Relax(omega)                                                        # The weight of the restart.
+        if restart is not None:
+            restart(omega)
+        u_ap, it, reason = Cloud(p, vec, Gamma, u_0, F, method, omega, tol, m_it - iter, callback, rtol, atol, stall, restart)
+        iter += it
+    elif check or tol > 0 or reason == 'diverged':                                  # Unless a fixed number of sweeps was asked.
+        Warn('Relaxation.Cloud', reason, iter)
+
+    return u_ap, iter, reason
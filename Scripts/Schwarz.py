@@ -0,0 +1,276 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+# Schwarz
+# Domain decomposition relaxation for triangulations and unstructured clouds of points. The interior nodes are split in spatial
+# subdomains by recursive coordinate bisection; each subdomain is extended with layers of overlap along the graph of vec, and its
+# nodes are relaxed by Gauss-Seidel sweeps with the values outside the subdomain (the halo) fixed. Each outer iteration the
+# subdomains are given to the workers of a thread pool:
+#   'additive'          Restricted additive Schwarz. All the subdomains read the approximation of the previous iteration and
+#                       write only the nodes they own into a second array, so all of them run at once and the result does not
+#                       depend on the order of the workers.
+#   'multiplicative'    The subdomains are colored so that two of the same color never read the nodes the other one writes;
+#                       the colors are relaxed one after the other, in place, and the subdomains of a color run at once.
+# The sweeps are the ones of Kernels.Cloud_Sweep, which release the GIL when Numba is installed, so the threads run on separate
+# cores. Without Numba the sweeps are Python loops and the threads take turns.
+
+import os
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from scipy.sparse import csr_matrix
+import Scripts.Kernels as Kernels
+import Scripts.Relaxation as Relaxation
+
+def Partition(p, nsub):
+    """
+    Partition
+    Function to split the interior nodes in nsub spatial subdomains of nearly the same size by recursive coordinate bisection.
+
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        nsub                        integer         Number of subdomains.
+
+    Output:
+        part        m x 1           Array           Array with the subdomain of each node, -1 for the boundary nodes.
+    """
+
+    part  = np.zeros([len(p[:,0])], dtype=int) - 1                                  # The subdomains are initialized with -1.
+    stack = [(np.where(p[:,2] == 0)[0], 0, nsub)]                                   # Nodes, first subdomain and number of them.
+    while stack:                                                                    # For each of the pending sets.
+        nodes, first, k = stack.pop()
+        if k == 1 or len(nodes) <= 1:                                               # A single subdomain.
+            part[nodes] = first
+            continue
+        ext   = np.ptp(p[nodes,:2], axis=0)                                         # Extent of the set in x and y.
+        order = nodes[np.argsort(p[nodes, np.argmax(ext)], kind='stable')]          # Sorted along the longest side.
+        cut   = (len(nodes)*(k//2))//k                                              # Nodes of the first half.
+        stack.append((order[:cut], first, k//2))
+        stack.append((order[cut:], first + k//2, k - k//2))
+    return part
+
+def Subdomains(p, vec, Gamma, F, part, overlap = 1):
+    """
+    Subdomains
+    Function to build the local problem of each subdomain, extended with layers of overlap.
+
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        vec         m x nvec        Array           Array with the correspondence of the nvec neighbors of each node.
+        Gamma       m x nvec+1      Array           Array with the computed gamma values.
+        F           m x 1           Array           Array with the right side of the equation evaluated on the nodes.
+        part        m x 1           Array           Array with the subdomain of each node (see Partition).
+        overlap                     integer         Number of layers of neighbors added to each subdomain.
+
+    Output:
+        subs                        list            List with a tuple for each subdomain: the global index of its local nodes
+                                                    (owned, overlap and halo, in that order), the number of owned nodes, the
+                                                    local index of the relaxed nodes, and the local idx, W, G0 and Fi (see
+                                                    Relaxation.Cloud).
+    """
+
+    # Graph of the nodes, in both directions
+    m      = len(p[:,0])                                                            # The total number of nodes.
+    inner  = p[:,2] == 0                                                            # The interior nodes.
+    i, j   = np.nonzero(vec != -1)
+    A      = csr_matrix((np.ones(len(i)), (i, vec[i, j])), shape=(m, m))
+    A      = ((A + A.T) != 0).astype(float)                                         # i reads j or j reads i.
+
+    subs = []
+    for s in range(part.max() + 1):                                                 # For each of the subdomains.
+        own  = part == s                                                            # The nodes it owns.
+        ext  = own.copy()
+        for k in range(overlap):                                                    # Layers of overlap.
+            ext |= (A@ext > 0) & inner
+        nodes = np.concatenate([np.where(own)[0], np.where(ext & ~own)[0]])         # Owned nodes first.
+        halo  = np.setdiff1d(vec[nodes][vec[nodes] != -1], nodes)                   # Nodes read but not relaxed.
+        glob  = np.concatenate([nodes, halo])                                       # The local nodes.
+        loc   = np.zeros([m], dtype=int)
+        loc[glob] = np.arange(len(glob))                                            # Global to local index.
+        mask  = vec[nodes,:] != -1                                                  # The existing neighbors.
+        idx   = np.where(mask, loc[np.where(mask, vec[nodes,:], 0)], 0)             # Padded local neighbor indices.
+        W     = np.where(mask, Gamma[nodes,1:], 0)                                  # Padded neighbor Gammas.
+        subs.append((glob, int(own.sum()), np.arange(len(nodes)), idx, W, Gamma[nodes,0].copy(), F[nodes].copy()))
+    return subs
+
+def Colors(subs, m):
+    """
+    Colors
+    Function to group the subdomains so that two of the same group never read the nodes the other one writes.
+
+    Input:
+        subs                        list            List with the local problem of each subdomain (see Subdomains).
+        m                           integer         The total number of nodes.
+
+    Output:
+        groups                      list            List with the subdomains of each color.
+    """
+
+    owner = np.zeros([m], dtype=int) - 1
+    for s, sub in enumerate(subs):                                                  # The owner of each node.
+        owner[sub[0][:sub[1]]] = s
+    reads = [set(owner[sub[0]]) - {-1} for sub in subs]                             # Subdomains whose nodes each one reads.
+    color = np.zeros([len(subs)], dtype=int) - 1
+    for s in range(len(subs)):                                                      # Greedy coloring.
+        near = (reads[s] | {t for t in range(s) if s in reads[t]}) - {s}            # Read by s or reading s.
+        used = set(color[list(near)])
+        c    = 0
+        while c in used:
+            c += 1
+        color[s] = c
+    return [np.where(color == c)[0].tolist() for c in range(color.max() + 1)]
+
+def Sweep(sub, src, dst, omega, sweeps):
+    """
+    Sweep
+    Function to relax the nodes of a subdomain with the halo values of src, and to write the owned ones into dst.
+
+    Input:
+        sub                         tuple           Local problem of the subdomain (see Subdomains).
+        src         m x 1           Array           Array with the approximation to read.
+        dst         m x 1           Array           Array where the owned nodes are written, it can be src.
+        omega                       Real            Relaxation weight.
+        sweeps                      integer         Number of Gauss-Seidel sweeps.
+
+    Output:
+        err                         Real            Largest update of the last sweep.
+        res                         Real            Largest residual of the nodes when they were updated in the last sweep.
+    """
+
+    glob, own, nodes, idx, W, G0, Fi = sub
+    u = src[glob]                                                                   # Local copy, with the halo.
+    for k in range(sweeps):                                                         # Gauss-Seidel sweeps.
+        err, res = Kernels.Cloud_Sweep(nodes, idx, W, G0, Fi, u, omega)
+    dst[glob[:own]] = u[:own]                                                       # Only the owned nodes are written.
+    return err, res
+
+def Cloud(p, vec, Gamma, u_ap, F, method = 'additive', omega = 1, tol = 1e-10, m_it = 40000, callback = None, rtol = 0, atol = 0, stall = 0, workers = None, nsub = None, overlap = 1, sweeps = 4, restart = None):
+    """
+    Cloud
+    Function to solve the Generalized Finite Differences system of a triangulation or an unstructured cloud of points by domain
+    decomposition. The boundary values must be already stored in u_ap, only the interior nodes are updated.
+
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        vec         m x nvec        Array           Array with the correspondence of the nvec neighbors of each node.
+        Gamma       m x nvec+1      Array           Array with the computed gamma values.
+        u_ap        m x 1           Array           Array with the initial approximation and the boundary conditions.
+        F           m x 1           Array           Array with the right side of the equation evaluated on the nodes.
+        method                      string          'additive' or 'multiplicative' Schwarz.
+        omega                       Real            Relaxation weight of the sweeps. The optimal weight of point Gauss-Seidel
+                                                    does not hold for the subdomains, so it is not estimated. If an
+                                                    over-relaxation does not reach the tolerance, the iteration is restarted
+                                                    with the weight halfway to 1.
+        tol                         Real            Tolerance for the largest update, 0 to stop only by the residual.
+        m_it                        integer         Maximum number of outer iterations.
+        callback                    function        Function called after each outer iteration with the largest residual, or
+                                                    with the largest update if no residual criterion is used.
+        rtol                        Real            Tolerance for the largest residual, relative to the one of a zero initial
+                                                    approximation (see Relaxation.Cloud).
+        atol                        Real            Absolute tolerance for the largest residual.
+        stall                       integer         Number of iterations without a new smallest residual after which the
+                                                    iteration stops, 0 to never stop by stagnation.
+        workers                     integer         Number of threads, by default the number of processors.
+        nsub                        integer         Number of subdomains, by default the number of workers.
+        overlap                     integer         Layers of overlap of the subdomains.
+        sweeps                      integer         Gauss-Seidel sweeps on each subdomain per outer iteration; more sweeps
+                                                    take fewer outer iterations, so the workers synchronize less often.
+                                                    As in Relaxation.Cloud, the residual of an iteration is the largest
+                                                    residual of the nodes when they are updated in the last sweep, so it
+                                                    costs no extra pass; since it is computed with the halos of the start
+                                                    of the iteration, it is confirmed with the true residual once it
+                                                    reaches the tolerance.
+        restart                     function        Function called with the new weight each time an over-relaxation is
+                                                    restarted, so the weight finally used is known.
+
+    Output:
+        u_ap        m x 1           Array           Array with the computed approximation.
+        iter                        integer         Number of outer iterations.
+        reason                      string          Reason to stop (see Relaxation.Reasons). A warning is issued if the
+                                                    iteration did not converge, unless no tolerance was given.
+    """
+
+    # Variable initialization
+    err     = 1                                                                     # err initialization in 1.
+    iter    = 0                                                                     # Number of iterations.
+    u_0     = u_ap                                                                  # The initial approximation.
+    u_ap    = np.array(u_ap, dtype=float)                                           # The approximation is copied.
+    m       = len(p[:,0])                                                           # The total number of nodes.
+    workers = workers or os.cpu_count() or 1                                        # The number of threads.
+    subs    = Subdomains(p, vec, Gamma, F, Partition(p, nsub or workers), overlap)  # The local problems.
+    if method == 'additive':                                                        # All the subdomains at once.
+        groups = [list(range(len(subs)))]
+        u_new  = u_ap.copy()                                                        # The array where they write.
+    elif method == 'multiplicative':                                                # One color after the other.
+        groups = Colors(subs, m)
+    else:                                                                           # Any other method is not available.
+        raise ValueError('Unknown Schwarz method: ' + str(method))
+    inner = np.where(p[:,2] == 0)[0]                                                # The interior nodes.
+    mask  = vec[inner,:] != -1                                                      # The existing neighbors of the interior nodes.
+    idx   = np.where(mask, vec[inner,:], 0)                                         # Padded neighbor indices.
+    W     = np.where(mask, Gamma[inner,1:], 0)                                      # Padded neighbor Gammas.
+    G0    = Gamma[inner,0]                                                          # Gammas of the central nodes.
+    Fi    = F[inner]                                                                # Right side on the interior nodes.
+    check = rtol > 0 or atol > 0 or stall > 0                                       # If the residual is needed.
+    stop  = ''                                                                      # Residual based stop.
+    if check:                                                                       # If the residual is needed.
+        u_z   = u_ap.copy()
+        u_z[inner] = 0                                                              # Zero initial approximation.
+        rz    = Relaxation.Cloud_Residual(idx, W, G0, Fi, u_z, inner)               # Reference residual.
+        r0    = Relaxation.Cloud_Residual(idx, W, G0, Fi, u_ap, inner)              # Initial residual.
+        best  = r0                                                                  # Smallest residual.
+        since = 0                                                                   # Iterations since the smallest residual.
+        stop  = 'residual' if r0 <= max(atol, rtol*rz) else ''                      # The initial guess may be good enough.
+
+    # Outer iterations
+    with ThreadPoolExecutor(max_workers = workers) as pool:
+        while err >= tol and iter <= m_it and not stop:                             # Check for iterations and tolerance.
+            err = 0                                                                 # Error becomes zero to be able to update.
+            res = 0                                                                 # Residual of the iteration.
+            for group in groups:                                                    # For each color.
+                if method == 'additive':                                            # Read the old values, write the new ones.
+                    jobs = [pool.submit(Sweep, subs[s], u_ap, u_new, omega, sweeps) for s in group]
+                else:                                                               # In place.
+                    jobs = [pool.submit(Sweep, subs[s], u_ap, u_ap, omega, sweeps) for s in group]
+                for job in jobs:                                                    # The largest update and residual.
+                    e, r = job.result()
+                    err  = max(err, e)
+                    res  = max(res, r)
+            if method == 'additive':                                                # The new values become the current ones.
+                u_ap, u_new = u_new, u_ap
+            iter += 1                                                               # 1 is added to the number of iterations.
+            if check:                                                               # Residual based stop.
+                res = res/omega                                                     # The residual of each node when it was updated.
+                if res <= max(atol, rtol*rz):                                       # The halos were stale, so it is confirmed.
+                    res = Relaxation.Cloud_Residual(idx, W, G0, Fi, u_ap, inner)
+                stop, best, since = Relaxation.Stop(res, rz, rtol, atol, best, since, stall)
+            if callback is not None:                                                # If the history is requested.
+                callback(res if check else err)
+
+    # Over-relaxation safeguard
+    reason = Relaxation.Reason(stop, err, tol)                                      # Why the iteration ended.
+    if omega > 1 and reason not in Relaxation.Converged and iter < m_it:            # If the over-relaxation diverged or stagnated.
+        omega = Relaxation.Relax(omega)                                             # The weight of the restart.
+        if restart is not None:
+            restart(omega)
+        u_ap, it, reason = Cloud(p, vec, Gamma, u_0, F, method, omega, tol, m_it - iter, callback, rtol, atol, stall, workers, nsub, \
+                                 overlap, sweeps, restart)
+        iter += it
+    elif check or tol > 0 or reason == 'diverged':                                  # Unless a fixed number of iterations was asked.
+        Relaxation.Warn('Schwarz.Cloud', reason, iter)
+
+    return u_ap, iter, reason
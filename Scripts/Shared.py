@@ -0,0 +1,231 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+# Shared
+# Weighted Jacobi on several processes for triangulations and unstructured clouds of points. p, vec, Gamma, F and two copies of the
+# approximation are placed once in multiprocessing.shared_memory; the workers attach to them by name, so nothing is pickled but
+# the names, and each worker only allocates the arrays of its own range of interior nodes: the memory stays flat as the number of
+# workers grows. Each iteration every worker reads one copy of the approximation and writes its range of the other one, then all
+# of them wait at a barrier and swap the copies. The largest update and residual of each worker are also shared, so all of them
+# take the same decision to stop. If a worker fails it aborts the barrier, and the barrier has a timeout, so the others raise
+# instead of waiting forever and the parent reports the failure.
+
+import os
+import numpy as np
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import Scripts.Relaxation as Relaxation
+
+Timeout = 60                                                                        # Seconds a worker waits for the others.
+
+def Share(arrays):
+    """
+    Share
+    Function to copy a set of arrays into shared memory blocks.
+
+    Input:
+        arrays                      dict            Dict with the arrays to share.
+
+    Output:
+        blocks                      list            List with the shared memory blocks, to be closed and unlinked at the end.
+        specs                       dict            Dict with the name, shape and type of the block of each array.
+        views                       dict            Dict with the arrays, as views of the blocks.
+    """
+
+    blocks, specs, views = [], {}, {}
+    for key, value in arrays.items():                                               # For each of the arrays.
+        value = np.asarray(value)
+        block = shared_memory.SharedMemory(create=True, size=max(value.nbytes, 1))
+        views[key]  = np.ndarray(value.shape, value.dtype, buffer=block.buf)
+        views[key][...] = value                                                     # The values are copied once.
+        blocks.append(block)
+        specs[key] = (block.name, value.shape, value.dtype.str)
+    return blocks, specs, views
+
+def Attach(specs):
+    """
+    Attach
+    Function to open the shared arrays, without copying them.
+
+    Input:
+        specs                       dict            Dict with the name, shape and type of the block of each array (see Share).
+
+    Output:
+        blocks                      list            List with the shared memory blocks, to be closed at the end.
+        arrays                      dict            Dict with the arrays, as views of the blocks.
+    """
+
+    blocks, arrays = [], {}
+    for key, (name, shape, dtype) in specs.items():                                 # For each of the arrays.
+        block = shared_memory.SharedMemory(name=name)
+        blocks.append(block)
+        arrays[key] = np.ndarray(shape, dtype, buffer=block.buf)
+    return blocks, arrays
+
+def Worker(specs, barrier, rank, lo, hi, omega, tol, m_it, rtol, atol, stall):
+    """
+    Worker
+    Function run by each process: weighted Jacobi on the interior nodes lo to hi.
+
+    Input:
+        specs                       dict            Dict with the shared arrays (see Share).
+        barrier                     Barrier         Barrier shared by all the workers.
+        rank                        integer         Number of the worker.
+        lo, hi                      integers        Range of the interior nodes of the worker.
+        omega, tol, m_it,
+        rtol, atol, stall                           Parameters of the iteration (see Cloud).
+    """
+
+    blocks, a = [], None
+    try:
+        blocks, a = Attach(specs)
+        inner = a['inner'][lo:hi]                                                   # The nodes of the worker.
+        vec   = a['vec']
+        mask  = vec[inner,:] != -1                                                  # The existing neighbors of the nodes.
+        idx   = np.where(mask, vec[inner,:], 0)                                     # Padded neighbor indices.
+        W     = np.where(mask, a['Gamma'][inner,1:], 0)                             # Padded neighbor Gammas.
+        G0    = a['Gamma'][inner,0]                                                 # Gammas of the central nodes.
+        Fi    = a['F'][inner]                                                       # Right side on the nodes.
+        u, s  = a['u'], a['stats']                                                  # Approximations and statistics.
+        check = rtol > 0 or atol > 0 or stall > 0                                   # If the residual is needed.
+        rz    = a['info'][2]                                                        # Reference residual.
+        best  = a['info'][3]                                                        # Smallest residual.
+        since = 0                                                                   # Iterations since the smallest residual.
+        err   = 1                                                                   # err initialization in 1.
+        iter  = 0                                                                   # Number of iterations.
+        stop  = 'residual' if a['info'][4] > 0 else ''                              # The initial guess may be good enough.
+        while err >= tol and iter <= m_it and not stop:                             # Check for iterations and tolerance.
+            cur, new = u[iter % 2], u[(iter + 1) % 2]                               # The copy read and the copy written.
+            d = omega*(Relaxation.Cloud_Update(idx, W, G0, Fi, cur) - cur[inner])   # Update of the nodes.
+            new[inner] = cur[inner] + d                                             # Only the range of the worker is written.
+            s[iter % 2, rank] = (np.abs(d).max(), np.abs(d*G0).max()) if len(d) > 0 else (0, 0)
+            barrier.wait()                                                          # All the ranges are written.
+            err, res = s[iter % 2].max(axis=0)                                      # The largest update and residual.
+            iter += 1                                                               # 1 is added to the number of iterations.
+            if check:                                                               # Residual based stop.
+                res = res/omega                                                     # The residual of the previous iteration.
+                stop, best, since = Relaxation.Stop(res, rz, rtol, atol, best, since, stall)
+            if rank == 0:                                                           # The history is kept by the first one.
+                a['history'][iter - 1] = res if check else err
+        if rank == 0:
+            a['info'][:2] = iter, res if check and iter > 0 else err
+            a['info'][5]  = list(Relaxation.Reasons).index(Relaxation.Reason(stop, err, tol))
+    except BaseException:
+        barrier.abort()                                                             # The others stop waiting for this one.
+        raise
+    finally:
+        del a                                                                       # The views are released before closing.
+        for block in blocks:
+            block.close()
+
+def Cloud(p, vec, Gamma, u_ap, F, omega = 1, tol = 1e-10, m_it = 40000, callback = None, rtol = 0, atol = 0, stall = 0, workers = None, restart = None):
+    """
+    Cloud
+    Function to solve the Generalized Finite Differences system of a triangulation or an unstructured cloud of points by weighted
+    Jacobi on several processes sharing the arrays. The boundary values must be already stored in u_ap, only the interior nodes are
+    updated, and the result is the same as the one of Relaxation.Cloud with 'jacobi' for any number of workers.
+
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        vec         m x nvec        Array           Array with the correspondence of the nvec neighbors of each node.
+        Gamma       m x nvec+1      Array           Array with the computed gamma values.
+        u_ap        m x 1           Array           Array with the initial approximation and the boundary conditions.
+        F           m x 1           Array           Array with the right side of the equation evaluated on the nodes.
+        omega                       Real            Relaxation weight. If an over-relaxation does not reach the tolerance, the
+                                                    iteration is restarted with the weight halfway to 1.
+        tol                         Real            Tolerance for the largest update, 0 to stop only by the residual.
+        m_it                        integer         Maximum number of iterations.
+        callback                    function        Function called with the largest residual of each iteration, or with the
+                                                    largest update if no residual criterion is used, once the workers end.
+        rtol                        Real            Tolerance for the largest residual, relative to the one of a zero initial
+                                                    approximation (see Relaxation.Cloud).
+        atol                        Real            Absolute tolerance for the largest residual.
+        stall                       integer         Number of iterations without a new smallest residual after which the
+                                                    iteration stops, 0 to never stop by stagnation.
+        workers                     integer         Number of processes, by default the number of processors.
+        restart                     function        Function called with the new weight each time an over-relaxation is
+                                                    restarted, so the weight finally used is known.
+
+    Output:
+        u_ap        m x 1           Array           Array with the computed approximation.
+        iter                        integer         Number of iterations.
+        reason                      string          Reason to stop (see Relaxation.Reasons). A warning is issued if the
+                                                    iteration did not converge, unless no tolerance was given.
+    """
+
+    # Variable initialization
+    u_0     = u_ap                                                                  # The initial approximation.
+    inner   = np.where(p[:,2] == 0)[0]                                              # The interior nodes.
+    workers = max(1, min(workers or os.cpu_count() or 1, len(inner)))               # The number of processes.
+    bounds  = np.linspace(0, len(inner), workers + 1).astype(int)                   # The range of each worker.
+    info    = np.zeros([6])                                                         # Iterations, last value, rz, r0, stop, reason.
+    if rtol > 0 or atol > 0 or stall > 0:                                           # If the residual is needed.
+        mask  = vec[inner,:] != -1
+        idx   = np.where(mask, vec[inner,:], 0)
+        W     = np.where(mask, Gamma[inner,1:], 0)
+        u_z   = np.array(u_ap, dtype=float)
+        u_z[inner] = 0                                                              # Zero initial approximation.
+        info[2] = Relaxation.Cloud_Residual(idx, W, Gamma[inner,0], F[inner], u_z, inner)
+        info[3] = Relaxation.Cloud_Residual(idx, W, Gamma[inner,0], F[inner], u_ap, inner)
+        info[4] = info[3] <= max(atol, rtol*info[2])                                # The initial guess may be good enough.
+        del mask, idx, W, u_z
+    blocks, specs, a = Share(dict(vec = vec, Gamma = Gamma, F = np.asarray(F, dtype=float), inner = inner, \
+                               u = np.stack([u_ap, u_ap]).astype(float), stats = np.zeros([2, workers, 2]), \
+                               history = np.zeros([m_it + 2]), info = info))
+
+    # Iteration
+    procs = []                                                                      # The workers.
+    try:
+        ctx     = mp.get_context()
+        barrier = ctx.Barrier(workers, timeout = Timeout)                           # A lost worker breaks it.
+        procs   = [ctx.Process(target=Worker, args=(specs, barrier, k, bounds[k], bounds[k+1], omega, tol, m_it, rtol, atol, stall)) \
+                   for k in range(workers)]
+        for proc in procs:
+            proc.start()
+        for proc in procs:
+            proc.join()
+        codes = [proc.exitcode for proc in procs]
+        if any(code != 0 for code in codes):                                        # A worker failed.
+            raise RuntimeError('A worker of the shared memory solver failed, exit codes: ' + str(codes))
+        iter   = int(a['info'][0])                                                  # Number of iterations.
+        reason = list(Relaxation.Reasons)[int(a['info'][5])]                        # Why the iteration ended.
+        u_ap   = a['u'][iter % 2].copy()                                            # The last approximation written.
+        if callback is not None:                                                    # The history is reported.
+            for value in a['history'][:iter]:
+                callback(value)
+    finally:
+        for proc in procs:                                                          # None is left running on an error.
+            if proc.is_alive():
+                proc.terminate()
+                proc.join()
+        del a                                                                       # The views are released before closing.
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    # Over-relaxation safeguard
+    if omega > 1 and reason not in Relaxation.Converged and iter < m_it:            # If the over-relaxation diverged or stagnated.
+        omega = Relaxation.Relax(omega)                                             # The weight of the restart.
+        if restart is not None:
+            restart(omega)
+        u_ap, it, reason = Cloud(p, vec, Gamma, u_0, F, omega, tol, m_it - iter, callback, rtol, atol, stall, workers, restart)
+        iter += it
+    elif rtol > 0 or atol > 0 or stall > 0 or tol > 0 or reason == 'diverged':     # Unless a fixed number of iterations was asked.
+        Relaxation.Warn('Shared.Cloud', reason, iter)
+
+    return u_ap, iter, reason
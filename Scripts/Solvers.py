@@ -0,0 +1,212 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+import numpy as np
+from scipy.sparse import csc_matrix, csr_matrix, issparse
+from scipy.linalg import lu_factor, lu_solve
+from scipy.sparse.linalg import splu, spilu, gmres, bicgstab, LinearOperator
+import Scripts.Relaxation as Relaxation
+
+def Solve(K, R, solver = 'lu', tol = 1e-10, m_it = 1000, drop_tol = 1e-4, fill_factor = 10, factor = None, precond = 'ilu', callback = None, x0 = None, precision = 'double'):
+    """
+    Solve
+    Function to solve the linear system K un = R assembled by the Generalized Finite Differences schemes.
+
+    Input:
+        K           m x m           Array           K Matrix with the computed Gammas, dense or sparse.
+        R           m x 1           Array           Right hand side of the system.
+        solver                      string          Solver to use:
+                                                        'dense'     Dense least squares solution, kept for reference.
+                                                        'lu'        Sparse LU factorization.
+                                                        'gmres'     Preconditioned GMRES.
+                                                        'bicgstab'  Preconditioned BiCGSTAB.
+                                                        'amg'       Algebraic multigrid V-cycles, see Scripts.AMG.
+        tol                         Real            Relative tolerance for the iterative solvers.
+        m_it                        integer         Maximum number of iterations for the iterative solvers.
+        drop_tol                    Real            Drop tolerance of the incomplete LU factorization.
+        fill_factor                 Real            Fill factor of the incomplete LU factorization.
+        factor                      SuperLU         LU factorization of K already computed, used by the 'lu' solver.
+        precond                     string          Preconditioner of the Krylov solvers:
+                                                        'ilu'       Incomplete LU factorization.
+                                                        'amg'       One algebraic multigrid V-cycle, the hierarchy is cached.
+        callback                    function        Function called with the relative residual of each iteration of the
+                                                    iterative solvers; for GMRES it is the preconditioned residual.
+        x0          m x 1           Array           Initial approximation for the iterative solvers, zero if not given.
+        precision                   string          Precision of the factorizations:
+                                                        'double'    Everything in float64.
+                                                        'mixed'     Only the LU factorization of 'dense' and 'lu' is in float32:
+                                                                    it is computed and stored in single precision, and the
+                                                                    float64 accuracy is recovered by iterative refinement (see
+                                                                    Refine), whose residuals use K in float64 and sparse. For
+                                                                    'dense' the float32 array is built from the sparse K, no
+                                                                    dense float64 copy is made. The other solvers are not
+                                                                    changed.
+
+    Output:
+        un          m x 1           Array           Solution of the system.
+        info                        dict            Solver used, number of iterations, relative residual of the solution,
+                                                    whether it converged and the reason to stop (see Relaxation.Reasons). A
+                                                    warning is issued if an iterative solver did not converge.
+    """
+
+    # Variable initialization
+    R    = np.asarray(R, dtype=float).ravel()                                       # The right hand side as a vector.
+    if x0 is not None:                                                              # If there is an initial approximation.
+        x0 = np.asarray(x0, dtype=float).ravel()                                    # The initial approximation as a vector.
+    iter = 1                                                                        # Direct solvers need a single solve.
+
+    # Solution of the system
+    if precision not in ('double', 'mixed'):                                        # Any other precision is not available.
+        raise ValueError('Unknown precision: ' + str(precision))
+    if solver == 'dense' and precision == 'mixed':                                  # Dense LU in single precision.
+        K    = csr_matrix(K)                                                        # The residuals are computed with sparse K.
+        lu   = lu_factor(K.astype(np.float32).toarray(), overwrite_a=True)          # The only dense array is the float32 one.
+        un, iter = Refine(K, R, lambda r: lu_solve(lu, r.astype(np.float32)), callback = callback)
+    elif solver == 'dense':                                                         # Dense least squares solution.
+        if issparse(K):                                                             # If K was assembled as a sparse matrix.
+            K = K.toarray()                                                         # K is converted to a dense array.
+        un = np.linalg.lstsq(K, R, rcond=None)[0]                                   # The system is solved.
+    elif solver == 'lu':                                                            # Sparse LU factorization.
+        if factor is None:                                                          # If K was not factorized before.
+            factor = Factor(K, precision)                                           # K is factorized.
+        if precision == 'mixed':                                                    # The single precision solution is refined.
+            un, iter = Refine(K, R, lambda r: Apply(factor, r), callback = callback)
+        else:
+            un = factor.solve(R)                                                    # The system is solved.
+    elif solver in ('gmres', 'bicgstab'):                                           # Preconditioned Krylov solvers.
+        if precond == 'ilu':                                                        # Incomplete LU preconditioner.
+            K   = csc_matrix(K)                                                     # SuperLU works with the CSC format.
+            ilu = spilu(K, drop_tol=drop_tol, fill_factor=fill_factor)              # Incomplete LU factorization.
+            M   = LinearOperator(K.shape, ilu.solve)                                # The preconditioner as an operator.
+        elif precond == 'amg':                                                      # Algebraic multigrid preconditioner.
+            import Scripts.AMG as AMG
+            K   = csr_matrix(K)                                                     # The V-cycle works with the CSR format.
+            M   = AMG.Preconditioner(K)                                             # One V-cycle as an operator.
+        else:                                                                       # Any other preconditioner is not available.
+            raise ValueError('Unknown preconditioner: ' + str(precond))
+        iter = 0                                                                    # Number of iterations.
+        nR   = np.linalg.norm(R)                                                    # Norm of the right hand side.
+        def count(xk):                                                              # Callback called once per iteration.
+            nonlocal iter
+            iter += 1                                                               # 1 is added to the number of iterations.
+            if callback is not None:                                                # If the history is requested.
+                if solver == 'gmres':                                               # GMRES gives the residual norm.
+                    callback(float(xk))
+                else:                                                               # BiCGSTAB gives the approximation.
+                    callback(np.linalg.norm(R - K@xk)/nR if nR > 0 else np.linalg.norm(R - K@xk))
+        if solver == 'gmres':                                                       # GMRES.
+            un, flag = gmres(K, R, x0=x0, rtol=tol, atol=0, maxiter=m_it, M=M, \
+                             callback=count, callback_type='pr_norm')               # The system is solved.
+        else:                                                                       # BiCGSTAB.
+            un, flag = bicgstab(K, R, x0=x0, rtol=tol, atol=0, maxiter=m_it, M=M, \
+                                callback=count)                                     # The system is solved.
+    elif solver == 'amg':                                                           # Algebraic multigrid.
+        import Scripts.AMG as AMG
+        un, iter = AMG.Solve(K, R, tol, m_it, x0, callback)                         # The system is solved.
+    else:                                                                           # Any other solver is not available.
+        raise ValueError('Unknown solver: ' + str(solver))
+
+    # Residual computation
+    nR   = np.linalg.norm(R)                                                        # Norm of the right hand side.
+    res  = np.linalg.norm(R - K@un)                                                 # Norm of the residual.
+    if nR > 0:                                                                      # If the right hand side is not zero.
+        res = res/nR                                                                # The residual is made relative.
+
+    # Convergence
+    if not np.isfinite(res):                                                        # The solution overflowed.
+        reason = 'diverged'
+    elif solver in ('gmres', 'bicgstab'):                                           # The flag of the Krylov solver.
+        reason = 'residual' if flag == 0 else 'breakdown' if flag < 0 else 'm_it'
+    elif solver == 'amg':                                                           # The tolerance of the V-cycles.
+        reason = 'residual' if res <= tol else 'm_it'
+    else:                                                                           # Direct solvers.
+        reason = 'residual'
+    if solver in ('gmres', 'bicgstab', 'amg'):                                      # If an iterative solver did not converge.
+        Relaxation.Warn('Solvers.Solve (' + solver + ')', reason, iter)
+    info = {'solver': solver, 'iterations': iter, 'residual': float(res), \
+            'converged': reason in Relaxation.Converged, 'reason': reason}          # Solver report.
+
+    return un, info
+
+def Factor(K, precision = 'double'):
+    """
+    Factor
+    Function to compute the sparse LU factorization of K, so it can be reused for many right hand sides.
+
+    Input:
+        K           m x m           Array           K Matrix with the computed Gammas, dense or sparse.
+        precision                   string          'double', or 'mixed' to factorize and store it in float32 (see Solve).
+
+    Output:
+        factor                      SuperLU         LU factorization of K.
+    """
+
+    dtype = np.float32 if precision == 'mixed' else float                           # The type of the factorization.
+    return splu(csc_matrix(K, dtype=dtype))                                         # SuperLU works with the CSC format.
+
+def Apply(factor, R):
+    """
+    Apply
+    Function to solve with a factorization in its own precision, the right hand sides and the solution being float64.
+
+    Input:
+        factor                      SuperLU         LU factorization of K.
+        R           m x nrhs        Array           Right hand sides of the system.
+
+    Output:
+        un          m x nrhs        Array           Solutions of the system, as float64.
+    """
+
+    return factor.solve(np.asarray(R, dtype=factor.L.dtype)).astype(float)
+
+def Refine(K, R, solve, m_it = 20, callback = None):
+    """
+    Refine
+    Function to solve K un = R by iterative refinement: a low precision solve is corrected with the float64 residual until the
+    residual stops decreasing, which happens at the level of a float64 solve.
+
+    Input:
+        K           m x m           Array           K Matrix with the computed Gammas, in float64.
+        R           m x nrhs        Array           Right hand sides of the system.
+        solve                       function        Function that solves K d = r approximately, as a float32 factorization.
+        m_it                        integer         Maximum number of corrections.
+        callback                    function        Function called with the relative residual after each correction.
+
+    Output:
+        un          m x nrhs        Array           Solutions of the system.
+        iter                        integer         Number of corrections.
+    """
+
+    R    = np.asarray(R, dtype=float)
+    nR   = np.linalg.norm(R, axis=0)                                                # Norm of each right hand side.
+    nR   = np.where(nR > 0, nR, 1)
+    un   = np.asarray(solve(R), dtype=float)                                        # Single precision solution.
+    r    = R - K@un                                                                 # float64 residual.
+    res  = (np.linalg.norm(r, axis=0)/nR).max()                                     # Largest relative residual.
+    iter = 0                                                                        # Number of corrections.
+    while iter < m_it and res > 0:                                                  # While the residual can decrease.
+        new  = un + solve(r)                                                        # Correction.
+        r    = R - K@new
+        last = (np.linalg.norm(r, axis=0)/nR).max()
+        if not last < res/2:                                                        # No substantial progress.
+            break
+        un, res = new, last                                                         # The correction is kept.
+        iter   += 1                                                                 # 1 is added to the number of corrections.
+        if callback is not None:                                                    # If the history is requested.
+            callback(res)
+    return un, iter
@@ -0,0 +1,199 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+# Geometry store
+# The .mat files of Data/Clouds and Data/Meshes are converted once to one uncompressed .npy file per field, Store/<kind>/<name>/,
+# with an entry.json that lists the fields and the time of the .mat file. The fields are opened as read-only memory maps: nothing
+# is parsed or copied, and the worker processes of a batch share the pages of the same region. The triangles are stored numbered
+# from 0. An entry is converted again when its .mat file is newer, so the store never has to be rebuilt by hand.
+# Each region has its own entry file, so there is no shared index to read, modify and write back: processes that convert
+# different regions at the same time never overwrite each other's entries. Every file is written to a temporary name and published
+# with os.replace, so a reader sees either the whole file or the previous one.
+
+import os
+import json
+import numpy as np
+from scipy.io import loadmat
+
+Base   = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))                # The folder of the repository.
+Data   = os.path.join(Base, 'Data')                                                 # The .mat files.
+Folder = os.path.join(Base, 'Store')                                                # The converted files.
+Kinds  = ['Clouds', 'Meshes']                                                       # The kinds of geometry.
+Index  = None                                                                       # The entries, read once per process.
+
+def Read():
+    """
+    Read
+    Function to read the entries of the store.
+
+    Output:
+        index                       dict            Dict with an entry for each kind, with the fields, shapes and source time
+                                                    of each region and size.
+    """
+
+    global Index
+    if Index is None:                                                               # If the entries were not read yet.
+        Index = {}
+        for kind in Kinds:
+            Index[kind] = {}
+            folder = os.path.join(Folder, kind)
+            names  = sorted(os.listdir(folder)) if os.path.isdir(folder) else []    # The converted regions.
+            for name in names:
+                entry = Entry(kind, name)
+                if entry is not None:
+                    Index[kind][name] = entry
+    return Index
+
+def Entry(kind, name):
+    """
+    Entry
+    Function to read the entry of a region from its entry.json.
+
+    Input:
+        kind                        string          Kind of geometry: 'Clouds' or 'Meshes'.
+        name                        string          Name of the file, region and size, as 'CAB_1'.
+
+    Output:
+        entry                       dict            Entry of the region, None if it was not converted or it is damaged.
+    """
+
+    try:
+        with open(os.path.join(Folder, kind, name, 'entry.json')) as file:
+            return json.load(file)
+    except (OSError, ValueError):                                                   # Not converted, or a damaged entry.
+        return None
+
+def Write(kind, name, entry):
+    """
+    Write
+    Function to write the entry of a region, so readers never see a partial file.
+
+    Input:
+        kind                        string          Kind of geometry: 'Clouds' or 'Meshes'.
+        name                        string          Name of the file, region and size, as 'CAB_1'.
+        entry                       dict            Entry of the region.
+    """
+
+    path = os.path.join(Folder, kind, name, 'entry.json')
+    temp = path + '.' + str(os.getpid()) + '.tmp'                                   # Temporary file.
+    with open(temp, 'w') as file:
+        json.dump(entry, file, indent = 1, sort_keys = True)
+    os.replace(temp, path)                                                          # The entry is published.
+
+def Convert(kind, name):
+    """
+    Convert
+    Function to convert a .mat file to one .npy file per field, and write its entry once all of them are published.
+
+    Input:
+        kind                        string          Kind of geometry: 'Clouds' or 'Meshes'.
+        name                        string          Name of the file, region and size, as 'CAB_1'.
+
+    Output:
+        entry                       dict            Entry of the index, with the shape and type of each field and the time of
+                                                    the .mat file.
+    """
+
+    source = os.path.join(Data, kind, name + '.mat')                                # The .mat file.
+    mtime  = os.path.getmtime(source)                                               # Read before the data, so a newer file is seen.
+    mat    = loadmat(source)
+    folder = os.path.join(Folder, kind, name)
+    os.makedirs(folder, exist_ok=True)                                              # The folder is created if needed.
+    fields = {}
+    for field, value in mat.items():                                                # For each of the fields.
+        if field.startswith('__'):                                                  # The header of the .mat file.
+            continue
+        value = np.ascontiguousarray(value)
+        if field == 'tt' and value.size > 0 and value.min() == 1:                   # Triangles numbered from 1.
+            value = value - 1
+        path = os.path.join(folder, field + '.npy')
+        temp = path + '.' + str(os.getpid()) + '.tmp'                               # Temporary file.
+        with open(temp, 'wb') as file:
+            np.save(file, value)                                                    # Uncompressed, so it can be mapped.
+        os.replace(temp, path)                                                      # The field is published.
+        fields[field] = {'shape': list(value.shape), 'dtype': value.dtype.str}
+    entry = {'fields': fields, 'mtime': mtime}
+    Write(kind, name, entry)
+    return entry
+
+def Build(kinds = Kinds):
+    """
+    Build
+    Function to convert every .mat file that is not in the store or is newer than its entry.
+
+    Input:
+        kinds                       list            Kinds of geometry to convert.
+
+    Output:
+        index                       dict            Index of the store.
+    """
+
+    index = Read()
+    for kind in kinds:                                                              # For each kind of geometry.
+        for file in sorted(os.listdir(os.path.join(Data, kind))):                   # For each of the files.
+            if not file.endswith('.mat'):
+                continue
+            name  = file[:-4]
+            entry = index[kind].get(name)
+            if entry is None or entry['mtime'] < os.path.getmtime(os.path.join(Data, kind, file)):
+                index[kind][name] = Convert(kind, name)                             # The entry is converted.
+    return index
+
+def Load(kind, region, size):
+    """
+    Load
+    Function to open a region as read-only memory maps, converting it first if needed.
+
+    Input:
+        kind                        string          Kind of geometry: 'Clouds' or 'Meshes'.
+        region                      string          Name of the region.
+        size                        string          Size of the region.
+
+    Output:
+        data                        dict            Dict with each field as a read-only memory map, as loadmat gives them.
+    """
+
+    index  = Read()
+    name   = region + '_' + size
+    entry  = index[kind].get(name) or Entry(kind, name)                             # Maybe converted meanwhile by another process.
+    folder = os.path.join(Folder, kind, name)
+    if entry is not None and entry['mtime'] >= os.path.getmtime(os.path.join(Data, kind, name + '.mat')):
+        try:
+            return {f: np.load(os.path.join(folder, f + '.npy'), mmap_mode='r') for f in entry['fields']}
+        except (OSError, ValueError):                                               # A missing or damaged field.
+            pass
+    index[kind][name] = entry = Convert(kind, name)                                 # The entry is converted.
+    return {f: np.load(os.path.join(folder, f + '.npy'), mmap_mode='r') for f in entry['fields']}
+
+def Regions(kind):
+    """
+    Regions
+    Function to list the regions and sizes of the store.
+
+    Input:
+        kind                        string          Kind of geometry: 'Clouds' or 'Meshes'.
+
+    Output:
+        regions                     list            List with the (region, size) pairs.
+    """
+
+    return [tuple(name.rsplit('_', 1)) for name in sorted(Read()[kind])]
+
+if __name__ == '__main__':
+    index = Build()
+    print(', '.join(kind + ': ' + str(len(index[kind])) for kind in Kinds))
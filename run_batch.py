@@ -0,0 +1,213 @@
+# All the codes presented below were developed by:
+#   Dr. Gerardo Tinoco Guerrero
+#   Universidad Michoacana de San Nicolás de Hidalgo
+#   gerardo.tinoco@umich.mx
+#
+# With the funding of:
+#   National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+#   Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+#   Aula CIMNE-Morelia. México
+#
+# Date:
+#   October, 2026.
+#
+# Last Modification:
+#   October, 2026.
+
+# Batch runner.
+# Every (region, size, discretization) case is solved in a pool of processes, without any window being opened.
+# Each result is appended to a JSON Lines file as soon as its case finishes, so an interrupted batch is resumed by running this
+# script again: the cases already stored are skipped. A case whose solver did not converge is stored with the status
+# 'not_converged' or 'diverged', and like a failed one it is run again; errors that are not finite are stored as null.
+# The workers share the operator cache; its eviction is turned off while they run, so none of them removes an entry another one is
+# reading, and the cache is trimmed once when the batch ends.
+
+import os
+import json
+import time
+import traceback
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import Scripts.Cache as Cache
+import Scripts.Errors as Errors
+import Scripts.Store as Store
+import Poisson_2D
+
+# Cases to run.
+regions = ['CAB','CUA','CUI','DOW','ENG','GIB','HAB','MIC','PAT','ZIR']
+sizes   = ['1', '2', '3']
+kinds   = ['Mesh', 'Triangulation', 'Cloud']
+method  = 'gs'                                                                      # Relaxation method (see Poisson_2D).
+# Batch options.
+output  = 'Results/batch.jsonl'                                                     # File with one result per line.
+workers = None                                                                      # Number of processes, all the cores if None.
+plots   = False                                                                     # If True, the figures are saved on Results.
+
+# Boundary conditions
+# The boundary conditions are defined as
+#   \phi = 2e^{2x+y}
+#
+#   f = 10e^{2x+y}
+
+def phi(x,y):
+    fun = 2*np.exp(2*x+y)
+    return fun
+
+def f(x,y):
+    fun = 10*np.exp(2*x+y)
+    return fun
+
+def Case(region, size, kind, method = 'gs', plots = False):
+    # Case.
+    # Function to solve a single case of the batch. It runs in a worker process.
+    #
+    # Input parameters
+    #   region                      string          Name of the region.
+    #   size                        string          Size of the region.
+    #   kind                        string          Discretization: 'Mesh', 'Triangulation' or 'Cloud'.
+    #   method                      string          Relaxation method (see Poisson_2D).
+    #   plots                       bool            If True, the figure of the case is saved on Results.
+    #
+    # Output parameters
+    #   record                      dict            Result of the case: status, errors, timings, iterations, and whether the
+    #                                               solver converged and why it stopped (see Relaxation.Reasons).
+
+    record = {'region': region, 'size': size, 'kind': kind, 'method': method}
+    try:
+        # All data is loaded from the file
+        t0   = time.perf_counter()
+        if kind == 'Mesh':                                                          # Logically rectangular mesh.
+            mat  = Store.Load('Meshes', region, size)                               # Memory maps, shared by the workers.
+            x, y = mat['x'], mat['y']
+            m    = x.size                                                           # The total number of nodes.
+        else:                                                                       # Triangulation or cloud of points.
+            mat  = Store.Load('Clouds', region, size)                               # Memory maps, shared by the workers.
+            p, tt = mat['p'], mat['tt']
+            m    = len(p[:,0])                                                      # The total number of nodes.
+        t1   = time.perf_counter()
+
+        # Poisson 2D
+        if kind == 'Mesh':
+            u_ap, u_ex, info = Poisson_2D.Mesh(x, y, phi, f, method, cache = True, stats = True)
+        elif kind == 'Triangulation':
+            u_ap, u_ex, vec, info = Poisson_2D.Triangulation(p, tt, phi, f, method, cache = True, stats = True)
+        elif kind == 'Cloud':
+            u_ap, u_ex, vec, info = Poisson_2D.Cloud(p, phi, f, method, cache = True, stats = True)
+        else:
+            raise ValueError('Unknown discretization: ' + str(kind))
+        t2   = time.perf_counter()
+
+        # Errors
+        if kind == 'Mesh':
+            er, er_inf, er_rel = Errors.Mesh(x, y, u_ap, u_ex, norms = True)
+        else:
+            er, er_inf, er_rel = Errors.Cloud(p, vec, u_ap, u_ex, norms = True)
+        t3   = time.perf_counter()
+
+        # Figures, with a backend that needs no display
+        if plots:
+            import matplotlib
+            matplotlib.use('Agg')
+            import Scripts.Graph as Graph
+            folder = 'Results/' + {'Mesh': 'Meshes', 'Triangulation': 'Triangulations', 'Cloud': 'Clouds'}[kind]
+            os.makedirs(folder, exist_ok = True)
+            if kind == 'Mesh':
+                Graph.Mesh_Static_sav(x, y, u_ap, u_ex, folder + '/' + region + '_' + size + '.png')
+            else:
+                Graph.Cloud_Static_sav(p, tt, u_ap, u_ex, folder + '/' + region + '_' + size + '.png')
+
+        if info['converged']:                                                       # The status of the case.
+            status = 'ok'
+        else:
+            status = 'diverged' if info['reason'] == 'diverged' else 'not_converged'
+        record.update({'status': status, 'converged': bool(info['converged']), 'reason': info['reason'], 'nodes': m, \
+                       'iterations': int(info['iterations']), \
+                       'error': Finite(er), 'error_inf': Finite(er_inf), 'error_rel': Finite(er_rel), \
+                       'time_load': t1 - t0, 'time_solve': t2 - t1, 'time_errors': t3 - t2})
+    except Exception:                                                               # A failed case does not stop the batch.
+        record.update({'status': 'failed', 'traceback': traceback.format_exc()})
+    return record
+
+def Finite(value):
+    # Finite.
+    # Function to store a value in the JSON record: NaN and infinity are not valid JSON, they are stored as null.
+    #
+    # Input parameters
+    #   value                       Real            Value to store.
+    #
+    # Output parameters
+    #   value                       Real            The value as a float, or None if it is not finite.
+
+    value = float(value)
+    return value if np.isfinite(value) else None
+
+def Init():
+    # Init.
+    # Function run once by each worker process when it starts: the eviction of the operator cache is turned off.
+
+    Cache.Max_Entries = None
+
+def Done(output):
+    # Done.
+    # Function to read the cases already solved in a previous run of the batch.
+    #
+    # Input parameters
+    #   output                      string          File with one result per line.
+    #
+    # Output parameters
+    #   done                        set             Set with the (region, size, kind, method) of the solved cases.
+
+    done = set()
+    if os.path.exists(output):                                                      # If the batch was run before.
+        with open(output) as file:
+            for line in file:
+                try:
+                    r = json.loads(line)
+                except ValueError:                                                  # A line cut by an interruption is ignored.
+                    continue
+                if r.get('status') == 'ok':                                         # Only the converged cases are skipped.
+                    done.add((r['region'], r['size'], r['kind'], r['method']))
+    return done
+
+def Batch(regions, sizes, kinds, method = 'gs', output = 'Results/batch.jsonl', workers = None, plots = False):
+    # Batch.
+    # Function to solve all the cases of regions x sizes x kinds in a pool of processes, storing each result as it finishes.
+    #
+    # Input parameters
+    #   regions                     list            Names of the regions.
+    #   sizes                       list            Sizes of the regions.
+    #   kinds                       list            Discretizations: 'Mesh', 'Triangulation' or 'Cloud'.
+    #   method                      string          Relaxation method (see Poisson_2D).
+    #   output                      string          File with one result per line.
+    #   workers                     integer         Number of processes, all the cores if None.
+    #   plots                       bool            If True, the figures are saved on Results.
+
+    os.makedirs(os.path.dirname(output) or '.', exist_ok = True)
+    Store.Build()                                                                   # The regions are converted once, before the workers.
+    done  = Done(output)                                                            # The cases already solved.
+    cases = [(r, s, k) for r in regions for s in sizes for k in kinds if (r, s, k, method) not in done]
+    print(len(done), 'cases already solved,', len(cases), 'to run.')
+
+    with ProcessPoolExecutor(max_workers = workers, initializer = Init) as pool, open(output, 'a+') as file:
+        if file.tell() > 0:                                                         # If the batch was run before.
+            file.seek(file.tell() - 1)
+            if file.read(1) != '\n':                                               # If the last line was cut.
+                file.write('\n')                                                   # It is closed, so it is ignored.
+        jobs = [pool.submit(Case, r, s, k, method, plots) for r, s, k in cases]
+        for job in as_completed(jobs):                                              # As soon as each case finishes.
+            record = job.result()
+            file.write(json.dumps(record) + '\n')                                   # The result is stored...
+            file.flush()                                                            # ...and written to disk.
+            if record['status'] == 'ok':
+                print(record['kind'], record['region'], record['size'], 'error:', record['error'], \
+                      'iterations:', record['iterations'], 'time: %.2f s' % record['time_solve'])
+            elif record['status'] == 'failed':
+                print(record['kind'], record['region'], record['size'], 'failed:\n' + record['traceback'])
+            else:
+                print(record['kind'], record['region'], record['size'], record['status'] + ':', record['reason'], \
+                      'after', record['iterations'], 'iterations.')
+    if os.path.isdir(Cache.Folder):                                                 # The workers did not evict any entry.
+        Cache.Evict()
+
+if __name__ == '__main__':
+    Batch(regions, sizes, kinds, method, output, workers, plots)
@@ -0,0 +1,45 @@
+# All the codes presented below were developed by:
+#   Dr. Gerardo Tinoco Guerrero
+#   Universidad Michoacana de San Nicolás de Hidalgo
+#   gerardo.tinoco@umich.mx
+#
+# With the funding of:
+#   National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+#   Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+#   Aula CIMNE-Morelia. México
+#
+# Date:
+#   October, 2026.
+#
+# Last Modification:
+#   October, 2026.
+
+# Benchmark.
+# Every routine of Poisson_2D is measured stage by stage on every region and size, see Scripts/Benchmark.py.
+# The first run is stored as the baseline; the next runs are compared against it and any stage slower, or using more memory,
+# than the threshold is reported as a regression.
+
+import os
+import Scripts.Benchmark as Benchmark
+
+# Cases to run.
+regions   = ['CAB','CUA','CUI','DOW','ENG','GIB','HAB','MIC','PAT','ZIR']
+sizes     = ['1', '2', '3']
+kinds     = ['Mesh', 'Mesh_K', 'Triangulation', 'Cloud', 'Cloud_K']
+# Benchmark options.
+repeat    = 3                                                                       # Number of timed runs of each stage.
+memory    = True                                                                    # If True, the peak memory is measured.
+output    = 'Results/benchmark.json'                                                # File with the measurements.
+baseline  = 'Results/benchmark_baseline.json'                                       # File with the baseline.
+threshold = 0.1                                                                     # Relative change reported as a regression.
+
+results = Benchmark.Suite(regions, sizes, kinds, repeat, memory)
+Benchmark.Save(results, output)
+
+if os.path.exists(baseline):                                                        # If there is a baseline.
+    changes, regressions = Benchmark.Compare(results, Benchmark.Load(baseline), threshold)
+    Benchmark.Report(changes, threshold)
+    print(len(regressions), 'regressions over', '%d%%' % (100*threshold), 'in', len(changes), 'measurements.')
+else:                                                                               # The first run is the baseline.
+    Benchmark.Save(results, baseline)
+    print('Baseline stored in', baseline)
@@ -58,7 +58,7 @@ for reg in regions:
             return fun
 
         # Poisson 2D computed in an unstructured cloud of points
-        phi_ap, phi_ex, vec = Poisson_2D.Cloud_K(p, phi, f)
+        phi_ap, phi_ex, vec = Poisson_2D.Cloud_K(p, phi, f, cache = True)
         er = Errors.Cloud(p, vec, phi_ap, phi_ex)
         print('The mean square error in the unstructured cloud of points', region, 'with size', cloud, 'is: ', er)
         #Graph.Cloud_Static_sav(p, tt, phi_ap, phi_ex, nomc)
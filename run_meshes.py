@@ -54,7 +54,7 @@ for reg in regions:
             return fun
 
         # Poisson 2D computed in a logically rectangular mesh
-        phi_ap, phi_ex = Poisson_2D.Mesh_K(x, y, phi, f)
+        phi_ap, phi_ex = Poisson_2D.Mesh_K(x, y, phi, f, cache = True)
         er = Errors.Mesh(x, y, phi_ap, phi_ex)
         print('The mean square error in the mesh', region, 'with', mesh, 'points per side is: ', er)
         #Graph.Mesh_Static_sav(x, y, phi_ap, phi_ex, nomm)
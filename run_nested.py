@@ -0,0 +1,83 @@
+# All the codes presented below were developed by:
+#   Dr. Gerardo Tinoco Guerrero
+#   Universidad Michoacana de San Nicolás de Hidalgo
+#   gerardo.tinoco@umich.mx
+#
+# With the funding of:
+#   National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+#   Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+#   Aula CIMNE-Morelia. México
+#
+# Date:
+#   October, 2026.
+#
+# Last Modification:
+#   October, 2026.
+
+# Nested iteration.
+# The sizes of a region are solved from the coarsest to the finest one, and each solution is interpolated onto the nodes of the
+# next size as its initial approximation. The iterations are compared with the ones needed from a zero initial approximation.
+
+import numpy as np
+import Scripts.Errors as Errors
+import Scripts.Interpolation as Interpolation
+import Scripts.Store as Store
+import Poisson_2D
+
+# Region to work in.
+region = 'CUA'
+sizes  = ['1', '2', '3']                                                            # From the coarsest to the finest.
+method = 'gs'                                                                       # Relaxation method (see Poisson_2D).
+omega  = 1                                                                          # Relaxation weight (see Poisson_2D).
+
+# Boundary conditions
+# The boundary conditions are defined as
+#   \phi = 2e^{2x+y}
+#
+#   f = 10e^{2x+y}
+
+def phi(x,y):
+    fun = 2*np.exp(2*x+y)
+    return fun
+
+def f(x,y):
+    fun = 10*np.exp(2*x+y)
+    return fun
+
+# Logically rectangular meshes
+u0 = None                                                                           # No initial approximation on the coarsest.
+for size in sizes:
+    mat  = Store.Load('Meshes', region, size)
+    x, y = mat['x'], mat['y']
+    if u0 is not None:                                                              # The coarser solution is interpolated.
+        u0 = Interpolation.Mesh(u0, x.shape[0], x.shape[1])
+    phi_ap, phi_ex, cold = Poisson_2D.Mesh(x, y, phi, f, method, omega, stats = True)
+    u0, phi_ex, warm     = Poisson_2D.Mesh(x, y, phi, f, method, omega, stats = True, u0 = u0)
+    print('Mesh', region, size, 'iterations:', cold['iterations'], '->', warm['iterations'], \
+          'error:', Errors.Mesh(x, y, phi_ap, phi_ex), '->', Errors.Mesh(x, y, u0, phi_ex))
+
+# Triangulations, interpolated on the triangles of the coarser one
+u0 = None                                                                           # No initial approximation on the coarsest.
+for size in sizes:
+    mat   = Store.Load('Clouds', region, size)
+    p, tt = mat['p'], mat['tt']
+    if u0 is not None:                                                              # The coarser solution is interpolated.
+        u0 = Interpolation.Triangulation(pc, ttc, u0, p)
+    phi_ap, phi_ex, vec, cold = Poisson_2D.Triangulation(p, tt, phi, f, method, omega, stats = True)
+    u0, phi_ex, vec, warm     = Poisson_2D.Triangulation(p, tt, phi, f, method, omega, stats = True, u0 = u0)
+    print('Triangulation', region, size, 'iterations:', cold['iterations'], '->', warm['iterations'], \
+          'error:', Errors.Cloud(p, vec, phi_ap, phi_ex), '->', Errors.Cloud(p, vec, u0, phi_ex))
+    pc, ttc = p, tt                                                                 # The coarser triangulation.
+
+# Unstructured clouds of points, interpolated with radial basis functions
+u0 = None                                                                           # No initial approximation on the coarsest.
+for size in sizes:
+    mat = Store.Load('Clouds', region, size)
+    p   = mat['p']
+    if u0 is not None:                                                              # The coarser solution is interpolated.
+        u0 = Interpolation.Cloud(pc, u0, p)
+    phi_ap, phi_ex, vec, cold = Poisson_2D.Cloud(p, phi, f, method, omega, stats = True)
+    u0, phi_ex, vec, warm     = Poisson_2D.Cloud(p, phi, f, method, omega, stats = True, u0 = u0)
+    print('Cloud', region, size, 'iterations:', cold['iterations'], '->', warm['iterations'], \
+          'error:', Errors.Cloud(p, vec, phi_ap, phi_ex), '->', Errors.Cloud(p, vec, u0, phi_ex))
+    pc = p                                                                          # The coarser cloud.
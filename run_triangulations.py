@@ -57,8 +57,8 @@ for reg in regions:
             return fun
 
         # Poisson 2D computed in a triangulation
-        phi_ap, phi_ex, vec = Poisson_2D.Triangulation(p, tt, phi, f)
-        er = Errors.Cloud_Static(p, vec, phi_ap, phi_ex)
+        phi_ap, phi_ex, vec = Poisson_2D.Triangulation(p, tt, phi, f, cache = True)
+        er = Errors.Cloud(p, vec, phi_ap, phi_ex)
         print('The mean square error in the triangulation', region, 'with size', cloud, 'is: ', er)
         Graph.Cloud_Static_sav(p, tt, phi_ap, phi_ex, nomt)
         #Graph.Cloud_Static(p, tt, phi_ap, phi_ex)
\ No newline at end of file
@@ -0,0 +1,98 @@
+# All the codes presented below were developed by:
+#   Dr. Gerardo Tinoco Guerrero
+#   Universidad Michoacana de San Nicolás de Hidalgo
+#   gerardo.tinoco@umich.mx
+#
+# With the funding of:
+#   National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+#   Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+#   Aula CIMNE-Morelia. México
+#
+# Date:
+#   October, 2026.
+#
+# Last Modification:
+#   October, 2026.
+
+# Shared fixtures of the tests.
+# The regions are read from Data/, so the tests are run from the root folder of the repository, which is put on the path. Each
+# test has an empty operator cache in a temporary folder, and the geometry store of the tests is another temporary folder.
+
+import os
+import sys
+import numpy as np
+import pytest
+from scipy.io import loadmat
+
+Root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))                 # The root folder of the repository.
+sys.path.insert(0, Root)
+os.chdir(Root)                                                                      # Data/ is relative to it.
+
+import Poisson_2D
+import Scripts.Cache as Cache
+import Scripts.Store as Store
+
+Tol = 1e-5                                                                          # Largest difference with the LU solution.
+
+# Test problem
+# The problem of the run_*.py scripts:
+#   \phi = 2e^{2x+y}
+#
+#   f = 10e^{2x+y}
+
+def phi(x, y):
+    return 2*np.exp(2*x+y)
+
+def f(x, y):
+    return 10*np.exp(2*x+y)
+
+def Close(u_ap, u_lu):
+    # The approximation is finite and agrees with the LU solution: the iterative solvers stop at a relative residual of 1e-10,
+    # so they must agree with it far below the discretization error.
+    assert np.all(np.isfinite(u_ap))
+    np.testing.assert_allclose(u_ap, u_lu, rtol=0, atol=Tol)
+
+def Region(kind, region, size):
+    # The arrays of a region, Meshes or Clouds; the triangles are numbered from 0.
+    mat = loadmat(os.path.join(Root, 'Data', kind, region + '_' + size + '.mat'))
+    if 'tt' in mat and mat['tt'].min() == 1:
+        mat['tt'] = mat['tt'] - 1
+    return mat
+
+@pytest.fixture(scope='session', autouse=True)
+def store(tmp_path_factory):
+    # The regions are converted once for all the tests to a store of their own, so the one of the repository is not touched.
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(Store, 'Folder', str(tmp_path_factory.mktemp('Store')))
+        patch.setattr(Store, 'Index', None)
+        yield Store.Folder
+
+@pytest.fixture(autouse=True)
+def cache(tmp_path, monkeypatch):
+    # Every test uses an empty operator cache of its own, so the one of the repository is not touched.
+    monkeypatch.setattr(Cache, 'Folder', str(tmp_path / 'Cache'))
+    monkeypatch.setattr(Cache, 'Factors', type(Cache.Factors)())
+
+@pytest.fixture(scope='module')
+def mesh():
+    # Logically rectangular mesh of CUA_1.
+    mat = Region('Meshes', 'CUA', '1')
+    return mat['x'], mat['y']
+
+@pytest.fixture(scope='module')
+def cloud():
+    # Triangulation of CUA_1: the nodes and the triangles.
+    mat = Region('Clouds', 'CUA', '1')
+    return mat['p'], mat['tt']
+
+@pytest.fixture(scope='module')
+def mesh_lu(mesh):
+    # Sparse LU solution on the mesh, the reference of the mesh solvers.
+    x, y = mesh
+    return Poisson_2D.Mesh_K(x, y, phi, f, 'lu')[0]
+
+@pytest.fixture(scope='module')
+def cloud_lu(cloud):
+    # Sparse LU solution on the cloud, the reference of the cloud solvers.
+    p, tt = cloud
+    return Poisson_2D.Cloud_K(p, phi, f, 'lu')[0]
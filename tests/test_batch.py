@@ -0,0 +1,93 @@
+# All the codes presented below were developed by:
+#   Dr. Gerardo Tinoco Guerrero
+#   Universidad Michoacana de San Nicolás de Hidalgo
+#   gerardo.tinoco@umich.mx
+#
+# With the funding of:
+#   National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+#   Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+#   Aula CIMNE-Morelia. México
+#
+# Date:
+#   October, 2026.
+#
+# Last Modification:
+#   October, 2026.
+
+# Tests of the batch runner.
+# The cases are solved on CUA_1 and the results are written to a temporary file.
+
+import os
+import json
+import numpy as np
+import pytest
+import run_batch
+
+def Lines(output):
+    # The records stored in the output file.
+    with open(output) as file:
+        return [json.loads(line) for line in file]
+
+def test_case():
+    for kind in ['Mesh', 'Triangulation', 'Cloud']:
+        record = run_batch.Case('CUA', '1', kind)
+        assert record['status'] == 'ok' and record['converged'], record.get('traceback')
+        assert record['error'] < 0.1 and record['iterations'] > 0
+        assert min(record['time_load'], record['time_solve'], record['time_errors']) >= 0
+
+def test_case_failed():
+    record = run_batch.Case('CUA', '1', 'Voronoi')                                  # A failed case is reported, not raised.
+    assert record['status'] == 'failed' and 'Unknown discretization' in record['traceback']
+
+def test_done(tmp_path):
+    output = str(tmp_path/'batch.jsonl')
+    with open(output, 'w') as file:
+        file.write(json.dumps({'region': 'CUA', 'size': '1', 'kind': 'Mesh', 'method': 'gs', 'status': 'ok'}) + '\n')
+        file.write(json.dumps({'region': 'CUA', 'size': '1', 'kind': 'Cloud', 'method': 'gs', 'status': 'failed'}) + '\n')
+        file.write('{"region": "CUA", "si')                                         # A line cut by an interruption.
+    assert run_batch.Done(output) == {('CUA', '1', 'Mesh', 'gs')}
+
+def test_batch(tmp_path):
+    output = str(tmp_path/'Results'/'batch.jsonl')
+    run_batch.Batch(['CUA'], ['1'], ['Mesh', 'Cloud'], output = output, workers = 1)
+    records = Lines(output)
+    assert sorted(r['kind'] for r in records) == ['Cloud', 'Mesh']
+    assert all(r['status'] == 'ok' for r in records)
+    run_batch.Batch(['CUA'], ['1'], ['Mesh', 'Cloud'], output = output, workers = 1)  # The batch is resumed.
+    assert len(Lines(output)) == 2                                                  # Nothing was run again.
+
+def test_batch_cut(tmp_path):
+    # A line cut by an interruption is closed, so the next result is still readable.
+    output = str(tmp_path/'batch.jsonl')
+    with open(output, 'w') as file:
+        file.write('{"region": "CUA", "si')
+    run_batch.Batch(['CUA'], ['1'], ['Mesh'], output = output, workers = 1)
+    with open(output) as file:
+        lines = file.read().splitlines()
+    assert len(lines) == 2 and json.loads(lines[1])['status'] == 'ok'
+
+def test_eviction(tmp_path, monkeypatch):
+    # The workers do not evict the shared cache; it is trimmed once when the batch ends.
+    monkeypatch.setattr(run_batch.Cache, 'Max_Entries', 1)
+    run_batch.Init()
+    assert run_batch.Cache.Max_Entries is None
+    monkeypatch.setattr(run_batch.Cache, 'Max_Entries', 1)
+    run_batch.Batch(['CUA'], ['1'], ['Mesh', 'Cloud'], output = str(tmp_path/'batch.jsonl'), workers = 1)
+    assert len(os.listdir(run_batch.Cache.Folder)) == 1
+
+def test_not_converged(tmp_path):
+    # On PAT_1 the over-relaxation does not converge: the case is stored with the reason, without NaN, and run again.
+    with pytest.warns(RuntimeWarning, match='did not converge'):
+        record = run_batch.Case('PAT', '1', 'Mesh', 'jacobi')
+    assert record['status'] in ('not_converged', 'diverged') and not record['converged']
+    assert record['reason'] in ('stalled', 'diverged', 'm_it')
+    output = str(tmp_path/'batch.jsonl')
+    run_batch.Batch(['PAT'], ['1'], ['Mesh'], 'jacobi', output = output, workers = 1)
+    with open(output) as file:
+        line = file.read()
+    assert 'NaN' not in line and 'Infinity' not in line
+    assert run_batch.Done(output) == set()                                          # It is run again.
+
+def test_finite():
+    assert run_batch.Finite(np.float64(0.5)) == 0.5 and type(run_batch.Finite(np.float64(0.5))) is float
+    assert run_batch.Finite(np.nan) is None and run_batch.Finite(-np.inf) is None
@@ -0,0 +1,62 @@
+# All the codes presented below were developed by:
+#   Dr. Gerardo Tinoco Guerrero
+#   Universidad Michoacana de San Nicolás de Hidalgo
+#   gerardo.tinoco@umich.mx
+#
+# With the funding of:
+#   National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+#   Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+#   Aula CIMNE-Morelia. México
+#
+# Date:
+#   October, 2026.
+#
+# Last Modification:
+#   October, 2026.
+
+# Tests of the benchmark suite.
+# The cases are measured on CUA_1; the comparison is checked on measurements written by hand.
+
+import pytest
+import Scripts.Benchmark as Benchmark
+from conftest import Region
+
+def test_read():
+    mat = Benchmark.Read('Clouds', 'CUA', '1')
+    assert mat['tt'].min() == 0                                                     # The triangles are numbered from 0.
+    assert (mat['tt'] == Region('Clouds', 'CUA', '1')['tt']).all()
+
+@pytest.mark.parametrize('kind', Benchmark.Kinds)
+def test_case(kind):
+    record = Benchmark.Case(kind, 'CUA', '1', memory = kind == 'Mesh_K')
+    stages = record['stages']
+    info   = Benchmark.Run(kind, Benchmark.Read('Meshes' if 'Mesh' in kind else 'Clouds', 'CUA', '1'))[-1]
+    assert list(stages) == ['load'] + list(info['stages']) + ['errors']             # The stages of the routine itself.
+    assert {'gammas', 'rhs', 'solve'} <= set(stages)
+    assert record['time'] == pytest.approx(sum(s['time'] for s in stages.values()))
+    assert record['iterations'] > 0 and record['nodes'] > 0
+    if kind == 'Mesh_K':                                                            # The peak memory of every stage.
+        assert record['memory'] == max(s['memory'] for s in stages.values()) > 0
+    else:
+        assert 'memory' not in record
+
+def test_unknown_routine():
+    with pytest.raises(ValueError, match='Unknown routine'):
+        Benchmark.Case('Voronoi', 'CUA', '1', memory = False)
+
+def Record(kind, load, solve):
+    return {'kind': kind, 'region': 'CUA', 'size': '1', 'stages': {'load': {'time': load}, 'solve': solve}}
+
+def test_compare():
+    baseline = [Record('Mesh', 1.0, {'time': 2.0, 'memory': 100}), Record('Cloud', 1.0, {'time': 1.0})]
+    results  = [Record('Mesh', 1.05, {'time': 3.0, 'memory': 50}), Record('Mesh_K', 1.0, {'time': 1.0})]
+    changes, regressions = Benchmark.Compare(results, baseline, 0.1)
+    assert [c[3:5] for c in changes] == [('load', 'time'), ('solve', 'time'), ('solve', 'memory')]
+    assert [c[-1] for c in changes] == pytest.approx([0.05, 0.5, -0.5])
+    assert regressions == [changes[1]]                                              # Only the slower solve is over the threshold.
+
+def test_save(tmp_path):
+    results = [Record('Mesh', 1.0, {'time': 2.0})]
+    name    = str(tmp_path/'Results'/'benchmark.json')
+    Benchmark.Save(results, name)
+    assert Benchmark.Load(name) == results
@@ -0,0 +1,118 @@
+# All the codes presented below were developed by:
+#   Dr. Gerardo Tinoco Guerrero
+#   Universidad Michoacana de San Nicolás de Hidalgo
+#   gerardo.tinoco@umich.mx
+#
+# With the funding of:
+#   National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+#   Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+#   Aula CIMNE-Morelia. México
+#
+# Date:
+#   October, 2026.
+#
+# Last Modification:
+#   October, 2026.
+
+# Tests of the operator cache.
+# A hit must give the same solution without computing the operator again: the routines that compute it are replaced by ones
+# that fail.
+
+import os
+import numpy as np
+import pytest
+import Poisson_2D
+import Scripts.Cache as Cache
+import Scripts.Gammas as Gammas
+import Scripts.Neighbors as Neighbors
+from conftest import phi, f, Close
+
+L = np.vstack([[0], [0], [2], [0], [2]])                                            # The Laplacian.
+
+def Fail(*args, **kwargs):
+    raise AssertionError('The operator was computed again.')
+
+def test_cloud_k_hit(cloud, cloud_lu, monkeypatch):
+    p, tt = cloud
+    u_ap, u_ex, vec = Poisson_2D.Cloud_K(p, phi, f, 'lu', cache = True)
+    Close(u_ap, cloud_lu)
+    monkeypatch.setattr(Neighbors, 'Cloud', Fail)                                   # A hit reads everything from disk.
+    monkeypatch.setattr(Gammas, 'Cloud', Fail)
+    monkeypatch.setattr(Gammas, 'Assemble_Cloud', Fail)
+    Cache.Factors.clear()                                                           # As a new process: K is factorized again.
+    u_ap, u_ex, hit = Poisson_2D.Cloud_K(p, phi, f, 'lu', cache = True)
+    Close(u_ap, cloud_lu)
+    np.testing.assert_array_equal(hit, vec)
+    u_ap, u_ex, vec = Poisson_2D.Cloud(p, phi, f, 'gs', cache = True)               # The relaxation shares the entry.
+    Close(u_ap, cloud_lu)
+
+def test_mesh_k_hit(mesh, mesh_lu, monkeypatch):
+    x, y = mesh
+    u_ap, u_ex = Poisson_2D.Mesh_K(x, y, phi, f, 'lu', cache = True)
+    Close(u_ap, mesh_lu)
+    monkeypatch.setattr(Gammas, 'Mesh', Fail)
+    monkeypatch.setattr(Gammas, 'Assemble_Mesh', Fail)
+    u_ap, u_ex = Poisson_2D.Mesh_K(x, y, phi, f, 'lu', cache = True)
+    Close(u_ap, mesh_lu)
+
+def test_keys(cloud):
+    # Another geometry or another search gives another entry.
+    p, tt = cloud
+    key   = Cache.Cloud(p, L)[3]
+    q     = p.copy()
+    q[0,0] += 1e-9
+    assert Cache.Cloud(q, L)[3] != key
+    assert Cache.Cloud(p, L, 6)[3] != key
+    assert Cache.Cloud(p, L, 8, tt)[3] != key
+    assert Cache.Cloud(p, L)[3] == key
+    assert len(os.listdir(Cache.Folder)) == 4
+
+def test_damaged(cloud):
+    # A damaged entry is computed again.
+    p, tt = cloud
+    vec, Gamma, K, key = Cache.Cloud(p, L)
+    with open(os.path.join(Cache.Folder, key + '.npz'), 'wb') as file:
+        file.write(b'damaged')
+    again = Cache.Cloud(p, L)
+    np.testing.assert_array_equal(again[1], Gamma)
+
+def test_eviction(mesh, monkeypatch):
+    x, y = mesh
+    monkeypatch.setattr(Cache, 'Max_Entries', 2)
+    keys = [Cache.Mesh(x + k, y, L)[2] for k in range(3)]                           # Three geometries.
+    assert sorted(os.listdir(Cache.Folder)) == sorted(k + '.npz' for k in keys[1:])  # The oldest one was evicted.
+
+def test_factor(mesh):
+    x, y = mesh
+    Gamma, K, key = Cache.Mesh(x, y, L)
+    factor = Cache.Factor(key, K)
+    assert Cache.Factor(key, K) is factor                                           # Factorized only once.
+    Cache.Clear()
+    assert len(Cache.Factors) == 0 and os.listdir(Cache.Folder) == []
+
+# Concurrent processes
+# Another process may evict or replace an entry at any time: the entry is then just missing, never an error.
+
+def test_remove(tmp_path):
+    Cache.Remove(str(tmp_path / 'missing.npz'))                                     # Already removed.
+    assert Cache.Load('missing') is None
+
+def test_evict_race(mesh, monkeypatch):
+    x, y = mesh
+    keys     = [Cache.Mesh(x + k, y, L)[2] for k in range(3)]
+    getmtime = os.path.getmtime
+    def Evicted(name):
+        if name.endswith(keys[0] + '.npz'):                                         # Removed by another process meanwhile.
+            os.remove(name)
+        return getmtime(name)
+    monkeypatch.setattr(os.path, 'getmtime', Evicted)
+    monkeypatch.setattr(Cache, 'Max_Entries', 1)
+    Cache.Evict()
+    assert os.listdir(Cache.Folder) == [keys[2] + '.npz']
+
+def test_no_eviction(mesh, monkeypatch):
+    x, y = mesh
+    monkeypatch.setattr(Cache, 'Max_Entries', None)
+    for k in range(3):
+        Cache.Mesh(x + k, y, L)
+    assert len(os.listdir(Cache.Folder)) == 3                                       # No temporary file is left either.
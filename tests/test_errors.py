@@ -0,0 +1,70 @@
+# All the codes presented below were developed by:
+#   Dr. Gerardo Tinoco Guerrero
+#   Universidad Michoacana de San Nicolás de Hidalgo
+#   gerardo.tinoco@umich.mx
+#
+# With the funding of:
+#   National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+#   Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+#   Aula CIMNE-Morelia. México
+#
+# Date:
+#   October, 2026.
+#
+# Last Modification:
+#   October, 2026.
+
+# Tests of the error norms.
+# The areas are compared with PolyArea applied to the polygon of each node, as the original loops did.
+
+import numpy as np
+import Scripts.Errors as Errors
+import Scripts.Neighbors as Neighbors
+
+def test_mesh_area(mesh):
+    x, y = mesh
+    area = Errors.Mesh_Area(x, y)
+    for i, j in [(1, 1), (4, 13), (x.shape[0] - 2, x.shape[1] - 2)]:
+        px = np.array([x[i+1, j], x[i+1, j+1], x[i, j+1], x[i-1, j+1], x[i-1, j], x[i-1, j-1], x[i, j-1], x[i+1, j-1]])
+        py = np.array([y[i+1, j], y[i+1, j+1], y[i, j+1], y[i-1, j+1], y[i-1, j], y[i-1, j-1], y[i, j-1], y[i+1, j-1]])
+        np.testing.assert_allclose(area[i,j], Errors.PolyArea(px, py), rtol=1e-12)
+    assert np.all(area[0] == 0) and np.all(area[:,-1] == 0)                         # No polygon on the boundary.
+
+def test_cloud_area(cloud):
+    p, tt = cloud
+    vec   = Neighbors.Cloud(p, 8)
+    area  = Errors.Cloud_Area(p, vec)
+    for i in range(len(p)):
+        nb = vec[i, vec[i] != -1]
+        np.testing.assert_allclose(area[i], Errors.PolyArea(p[nb,0], p[nb,1]), rtol=1e-12, atol=1e-15)
+
+def test_norms(cloud):
+    p, tt = cloud
+    vec   = Neighbors.Cloud(p, 8)
+    u_ex  = np.exp(p[:,0])
+    u_ap  = u_ex + np.linspace(0, 1e-3, len(p))
+    area  = Errors.Cloud_Area(p, vec)
+    er    = Errors.Cloud(p, vec, u_ap, u_ex)
+    assert np.isclose(er, np.sqrt((area*(u_ap - u_ex)**2).sum()))                   # The L2 error of the original loop.
+    er2, er_inf, er_rel = Errors.Cloud(p, vec, u_ap, u_ex, norms = True)
+    assert er2 == er
+    assert np.isclose(er_inf, 1e-3)
+    assert np.isclose(er_rel, er/np.sqrt((area*u_ex**2).sum()))
+
+def test_norms_time(cloud):
+    # With a time axis, one norm for each step.
+    p, tt = cloud
+    vec   = Neighbors.Cloud(p, 8)
+    u_ex  = np.stack([np.exp(p[:,0]), np.exp(p[:,1])], axis=1)
+    u_ap  = u_ex + 1e-3
+    er    = Errors.Cloud(p, vec, u_ap, u_ex)
+    assert er.shape == (2,)
+    np.testing.assert_allclose(er, [Errors.Cloud(p, vec, u_ap[:,k], u_ex[:,k]) for k in range(2)])
+
+def test_area_cache(mesh):
+    x, y = mesh
+    Errors.Areas.clear()
+    area = Errors.Mesh_Area(x, y)
+    assert Errors.Mesh_Area(x, y) is area                                           # Read from the cache.
+    assert not area.flags.writeable
+    assert len(Errors.Areas) == 1
@@ -0,0 +1,68 @@
+# All the codes presented below were developed by:
+#   Dr. Gerardo Tinoco Guerrero
+#   Universidad Michoacana de San Nicolás de Hidalgo
+#   gerardo.tinoco@umich.mx
+#
+# With the funding of:
+#   National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+#   Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+#   Aula CIMNE-Morelia. México
+#
+# Date:
+#   October, 2026.
+#
+# Last Modification:
+#   October, 2026.
+
+# Tests of the evaluation of the boundary condition and the right side on the nodes.
+
+import math
+import numpy as np
+import Poisson_2D
+import Scripts.Functions as Functions
+from conftest import phi, f
+
+def test_callable(mesh):
+    x, y  = mesh
+    calls = []
+    def g(x, y):
+        calls.append(1)
+        return phi(x, y)
+    np.testing.assert_array_equal(Functions.Evaluate(g, x, y), phi(x, y))
+    assert len(calls) == 1                                                          # A single call with all the nodes.
+    assert Functions.Evaluate(lambda x, y: 4, x, y).shape == x.shape                # A constant is broadcast.
+
+def test_values(cloud):
+    p, tt = cloud
+    x, y  = p[:,0], p[:,1]
+    u     = phi(x, y)
+    np.testing.assert_array_equal(Functions.Evaluate(u, x, y), u)
+    np.testing.assert_array_equal(Functions.Evaluate(u[:,None], x, y), u)           # A column vector.
+    np.testing.assert_array_equal(Functions.Evaluate(4, x, y), np.full(len(x), 4.0))
+    v     = Functions.Evaluate(u, x, y)
+    v[0]  = 0
+    assert u[0] != 0                                                                # The values are copied.
+
+def test_scalar_function(mesh):
+    # Functions written for scalars are evaluated node by node.
+    x, y = mesh
+    def g(x, y):
+        return 2*math.exp(2*x + y)
+    def h(x, y):
+        if x > 0.5:
+            return 1.0
+        return 0.0
+    np.testing.assert_allclose(Functions.Evaluate(g, x, y), phi(x, y), rtol=1e-15)
+    np.testing.assert_array_equal(Functions.Evaluate(h, x, y), np.where(x > 0.5, 1.0, 0.0))
+
+def test_poisson(mesh, cloud):
+    # The values on the nodes give the same solution as the functions.
+    x, y  = mesh
+    u_ap, u_ex = Poisson_2D.Mesh_K(x, y, phi, f)
+    u_va, u_ev = Poisson_2D.Mesh_K(x, y, phi(x, y), f(x, y))
+    np.testing.assert_array_equal(u_va, u_ap)
+    np.testing.assert_array_equal(u_ev, u_ex)
+    p, tt = cloud
+    u_ap, u_ex, vec = Poisson_2D.Cloud(p, phi, f)
+    u_va, u_ev, vec = Poisson_2D.Cloud(p, phi(p[:,0], p[:,1]), f(p[:,0], p[:,1]))
+    np.testing.assert_array_equal(u_va, u_ap)
@@ -0,0 +1,94 @@
+# All the codes presented below were developed by:
+#   Dr. Gerardo Tinoco Guerrero
+#   Universidad Michoacana de San Nicolás de Hidalgo
+#   gerardo.tinoco@umich.mx
+#
+# With the funding of:
+#   National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+#   Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+#   Aula CIMNE-Morelia. México
+#
+# Date:
+#   October, 2026.
+#
+# Last Modification:
+#   October, 2026.
+
+# Tests of the Gammas and of the assembly of K.
+
+import numpy as np
+from scipy.sparse import issparse
+import Scripts.Gammas as Gammas
+import Scripts.Neighbors as Neighbors
+from conftest import phi, f
+
+L = np.vstack([[0], [0], [2], [0], [2]])                                            # The Laplacian.
+
+def test_mesh_sparse_k(mesh):
+    x, y = mesh
+    K, R = Gammas.K_Mesh(x, y, L, phi, f)
+    S, T = Gammas.K_Mesh(x, y, L, phi, f, sparse = True)
+    assert issparse(S)
+    np.testing.assert_array_equal(S.toarray(), K)                                   # The same triplets.
+    np.testing.assert_array_equal(T, R)
+
+def test_mesh_k_rows(mesh):
+    x, y = mesh
+    m, n = x.shape
+    K, R = Gammas.K_Mesh(x, y, L, phi, f)
+    bnd  = np.ones([m, n], dtype=bool)
+    bnd[1:m-1, 1:n-1] = False
+    bnd  = bnd.transpose().ravel()                                                  # The nodes are numbered as i + j*m.
+    np.testing.assert_array_equal(K[bnd], np.eye(m*n)[bnd])                         # Identity rows on the boundary.
+    np.testing.assert_allclose(K[~bnd].sum(axis=1), 0, atol=1e-8*np.abs(K).max())   # The Gammas of a node add up to 0.
+
+def test_cloud_sparse_k(cloud):
+    p, tt = cloud
+    vec   = Neighbors.Cloud(p, 8)
+    K     = Gammas.Cloud_K(p, vec, L)
+    S     = Gammas.Cloud_K(p, vec, L, sparse = True)
+    assert issparse(S)
+    np.testing.assert_array_equal(S.toarray(), K)
+
+def test_cloud_k_columns(cloud):
+    # The columns of the boundary nodes keep the weights of the interior rows, whatever the numbering.
+    p, tt = cloud
+    vec   = Neighbors.Cloud(p, 8)
+    K     = Gammas.Cloud_K(p, vec, L)
+    bnd   = p[:,2] == 1
+    np.testing.assert_array_equal(K[bnd], np.eye(len(p))[bnd])
+    np.testing.assert_allclose(K[~bnd].sum(axis=1), 0, atol=1e-8*np.abs(K).max())
+    assert np.count_nonzero(K[np.ix_(~bnd, bnd)]) > 0                               # Interior rows coupled to the boundary.
+
+def Node(dx, dy):
+    # The Gammas of one node, with the pseudoinverse of its own M matrix as the original loop computed them.
+    M  = np.vstack([[dx], [dy], [dx**2], [dx*dy], [dy**2]])
+    YY = np.linalg.pinv(M)@L
+    return np.hstack([-YY.sum(), YY[:,0]])
+
+def test_batch_padding():
+    # A missing neighbor, with dx = dy = 0, gives the same Gammas as if it was not there.
+    rng    = np.random.default_rng(0)
+    dx, dy = rng.normal(size=[2, 7])
+    full   = Gammas.Batch(np.hstack([dx, 0])[None,:], np.hstack([dy, 0])[None,:], L)[0]
+    np.testing.assert_allclose(full[:8], Node(dx, dy), rtol=1e-10, atol=1e-10)
+    assert full[8] == 0 or abs(full[8]) < 1e-10*np.abs(full).max()
+
+def test_cloud_batch(cloud):
+    p, tt = cloud
+    vec   = Neighbors.Cloud(p, 8)
+    Gamma = Gammas.Cloud(p, vec, L)
+    for i in np.where(p[:,2] == 0)[0]:                                              # Node by node.
+        nb  = vec[i, vec[i] != -1]
+        ref = Node(p[nb,0] - p[i,0], p[nb,1] - p[i,1])
+        np.testing.assert_allclose(Gamma[i,:len(ref)], ref, rtol=0, atol=1e-10*np.abs(ref).max())
+    np.testing.assert_array_equal(Gamma[p[:,2] == 1], 0)                            # No Gammas on the boundary.
+
+def test_mesh_batch(mesh):
+    x, y  = mesh
+    Gamma = Gammas.Mesh(x, y, L)
+    for i, j in [(1, 1), (5, 9), (10, 10), (x.shape[0] - 2, x.shape[1] - 2)]:       # A few interior nodes.
+        dx  = np.array([x[i+di, j+dj] - x[i,j] for di, dj in Gammas.Stencil])
+        dy  = np.array([y[i+di, j+dj] - y[i,j] for di, dj in Gammas.Stencil])
+        ref = Node(dx, dy)
+        np.testing.assert_allclose(Gamma[i,j], ref, rtol=0, atol=1e-10*np.abs(ref).max())
@@ -0,0 +1,106 @@
+# All the codes presented below were developed by:
+#   Dr. Gerardo Tinoco Guerrero
+#   Universidad Michoacana de San Nicolás de Hidalgo
+#   gerardo.tinoco@umich.mx
+#
+# With the funding of:
+#   National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+#   Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+#   Aula CIMNE-Morelia. México
+#
+# Date:
+#   October, 2026.
+#
+# Last Modification:
+#   October, 2026.
+
+# Tests of the Geometry container.
+# Every routine that takes p and vec must give the same result with a Geometry of CUA_1.
+
+import numpy as np
+import pytest
+import Poisson_2D
+import Scripts.Cache as Cache
+import Scripts.Errors as Errors
+import Scripts.Gammas as Gammas
+import Scripts.Neighbors as Neighbors
+import Scripts.Relaxation as Relaxation
+from Scripts.Geometry import Geometry, Split, Nodes, Inner, Has_Neighbors
+from conftest import phi, f
+
+L = np.vstack([[0], [0], [2], [0], [2]])                                            # The Laplacian.
+
+@pytest.fixture(scope='module')
+def geometry(cloud):
+    # CUA_1 with its neighbors and triangles, and the loose arrays.
+    p, tt = cloud
+    vec   = Neighbors.Cloud(p, 8)
+    return Geometry(p, vec, tt), p, vec, tt
+
+def test_arrays(geometry):
+    G, p, vec, tt = geometry
+    np.testing.assert_array_equal(G.Points(), p)
+    np.testing.assert_array_equal(G.Vec(), vec)
+    np.testing.assert_array_equal(G.Counts(), (vec != -1).sum(axis=1))
+    np.testing.assert_array_equal(G.inner, np.where(p[:,2] == 0)[0])
+    np.testing.assert_array_equal(G.bnd, np.where(p[:,2] == 1)[0])
+    assert G.m == len(p) and G.nbytes < p.nbytes + vec.nbytes                       # The compact form is smaller.
+    assert G.Vec(10).shape == (len(p), 10)
+    assert not hasattr(G, '__dict__')
+
+def test_triangles(cloud):
+    p, tt = cloud
+    np.testing.assert_array_equal(Geometry(p, tt = tt + 1).tt, tt)                  # Numbered from 0.
+    assert Geometry(p).ptr is None and Geometry(p).tt is None
+
+def test_split(geometry):
+    G, p, vec, tt = geometry
+    q, v = Split(G)
+    np.testing.assert_array_equal(q, p)
+    np.testing.assert_array_equal(v, vec)
+    assert Split(p, vec) == (p, vec)
+    assert Split(Geometry(p))[1] is None                                            # No neighbors yet.
+
+def test_nodes(geometry):
+    G, p, vec, tt = geometry
+    for q in [G, p]:
+        xy, bnd = Nodes(q)
+        np.testing.assert_array_equal(xy, p[:,:2])
+        np.testing.assert_array_equal(bnd, p[:,2] == 1)
+    inner, nb = Inner(G)
+    np.testing.assert_array_equal(inner, np.where(p[:,2] == 0)[0])
+    np.testing.assert_array_equal(nb, vec[inner,:])                                 # Only the interior rows are built.
+    np.testing.assert_array_equal(Inner(p, vec)[1], nb)
+    assert Has_Neighbors(G) and not Has_Neighbors(Geometry(p)) and not Has_Neighbors(p)
+
+def test_routines(geometry):
+    G, p, vec, tt = geometry
+    np.testing.assert_array_equal(Neighbors.Cloud(Geometry(p), 8), vec)
+    np.testing.assert_array_equal(Neighbors.Triangulation(Geometry(p, tt = tt), None, 8), Neighbors.Triangulation(p, tt, 8))
+    np.testing.assert_array_equal(Gammas.Cloud(G, None, L), Gammas.Cloud(p, vec, L))
+    Gamma = Gammas.Cloud(p, vec, L)
+    assert (Gammas.Assemble_Cloud(G, None, Gamma, sparse=True) != Gammas.Assemble_Cloud(p, vec, Gamma, sparse=True)).nnz == 0
+    np.testing.assert_array_equal(Relaxation.Coloring(G, None), Relaxation.Coloring(p, vec))
+    u = phi(p[:,0], p[:,1])
+    assert Errors.Cloud(G, None, u + 1e-3, u) == Errors.Cloud(p, vec, u + 1e-3, u)
+
+def test_poisson(geometry):
+    G, p, vec, tt = geometry
+    for method in ['gs', 'amg']:
+        np.testing.assert_array_equal(Poisson_2D.Cloud(G, phi, f, method)[0], Poisson_2D.Cloud(p, phi, f, method)[0])
+    np.testing.assert_array_equal(Poisson_2D.Cloud_K(G, phi, f)[0], Poisson_2D.Cloud_K(p, phi, f)[0])
+    np.testing.assert_array_equal(Poisson_2D.Triangulation(Geometry(p, tt = tt), None, phi, f)[0], \
+                                  Poisson_2D.Triangulation(p, tt, phi, f)[0])
+    u_ap, u_ex = Poisson_2D.Cloud_Solver(G).Solve(phi, f)
+    np.testing.assert_array_equal(u_ap, Poisson_2D.Cloud_Solver(p).Solve(phi, f)[0])
+
+def test_cache(geometry, monkeypatch):
+    # The neighbors of the Geometry are used, not searched again, and they are part of the key.
+    G, p, vec, tt = geometry
+    def fail(*args, **kwargs):
+        raise AssertionError('The neighbors were searched again.')
+    monkeypatch.setattr(Neighbors, 'Cloud', fail)
+    v, Gamma, K, key = Cache.Cloud(G, L)
+    np.testing.assert_array_equal(v, vec)
+    np.testing.assert_array_equal(Gamma, Gammas.Cloud(p, vec, L))
+    assert Cache.Cloud(Geometry(p, vec[:,:6]), L)[3] != key
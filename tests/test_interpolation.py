@@ -0,0 +1,87 @@
+# All the codes presented below were developed by:
+#   Dr. Gerardo Tinoco Guerrero
+#   Universidad Michoacana de San Nicolás de Hidalgo
+#   gerardo.tinoco@umich.mx
+#
+# With the funding of:
+#   National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+#   Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+#   Aula CIMNE-Morelia. México
+#
+# Date:
+#   October, 2026.
+#
+# Last Modification:
+#   October, 2026.
+
+# Tests of the interpolation between sizes of a region and of the initial approximation of the solvers.
+# CUA_1 and CUA_2 are nested, so the coarse solution is interpolated onto the nodes of the fine one.
+
+import numpy as np
+import pytest
+import Poisson_2D
+import Scripts.Interpolation as Interpolation
+from conftest import phi, f, Close, Region
+
+def Linear(q):
+    # A linear function, reproduced by the three interpolations.
+    return 1 + 2*q[...,0] - 3*q[...,1]
+
+def test_mesh(mesh):
+    x, y = mesh
+    fine = Region('Meshes', 'CUA', '2')
+    u    = Interpolation.Mesh(phi(x, y), *fine['x'].shape)
+    np.testing.assert_array_equal(u[::2, ::2], phi(x, y))                           # Exact at the shared nodes.
+    s, t = np.meshgrid(np.linspace(0, 1, 21), np.linspace(0, 1, 21), indexing='ij')
+    S, T = np.meshgrid(np.linspace(0, 1, 41), np.linspace(0, 1, 41), indexing='ij')
+    np.testing.assert_allclose(Interpolation.Mesh(s*t + s, 41, 41), S*T + S, atol=1e-14)
+
+def test_triangulation(cloud):
+    p, tt = cloud
+    q     = Region('Clouds', 'CUA', '2')['p']
+    np.testing.assert_allclose(Interpolation.Triangulation(p, tt, Linear(p[:,:2]), q), Linear(q[:,:2]), atol=1e-12)
+    u     = phi(p[:,0], p[:,1])
+    np.testing.assert_allclose(Interpolation.Triangulation(p, tt, u, p), u)        # Exact at the nodes.
+
+def test_cloud(cloud):
+    p, tt = cloud
+    q     = Region('Clouds', 'CUA', '2')['p']
+    np.testing.assert_allclose(Interpolation.Cloud(p, Linear(p[:,:2]), q), Linear(q[:,:2]), atol=1e-12)
+
+# Initial approximation
+
+@pytest.mark.parametrize('method', ['gs', 'multigrid'])
+def test_mesh_u0(mesh, mesh_lu, method):
+    # The solution as the initial approximation needs no iterations; a coarser one needs fewer.
+    x, y = mesh
+    u_ap, u_ex, info = Poisson_2D.Mesh(x, y, phi, f, method, stats = True, u0 = mesh_lu)
+    Close(u_ap, mesh_lu)
+    assert info['iterations'] == 0
+    u0   = Interpolation.Mesh(mesh_lu[::2, ::2], *x.shape)
+    u_ap, u_ex, warm = Poisson_2D.Mesh(x, y, phi, f, method, stats = True, u0 = u0)
+    u_ap, u_ex, cold = Poisson_2D.Mesh(x, y, phi, f, method, stats = True)
+    Close(u_ap, mesh_lu)
+    assert warm['iterations'] <= cold['iterations']                                 # Multigrid already starts from a coarse solve.
+
+def test_cloud_u0(cloud, cloud_lu):
+    p, tt = cloud
+    u0    = cloud_lu.copy()
+    u0[p[:,2] == 1] = 0                                                             # The boundary values are set from phi.
+    for method in ['gs', 'jacobi']:
+        u_ap, u_ex, vec, info = Poisson_2D.Cloud(p, phi, f, method, stats = True, u0 = u0)
+        Close(u_ap, cloud_lu)
+        assert info['iterations'] == 0
+    u_ap, u_ex, vec, warm = Poisson_2D.Triangulation(p, tt, phi, f, stats = True, u0 = cloud_lu)
+    u_ap, u_ex, vec, cold = Poisson_2D.Triangulation(p, tt, phi, f, stats = True)
+    assert warm['iterations'] < cold['iterations']                                  # A close approximation needs fewer.
+
+@pytest.mark.parametrize('solver', ['gmres', 'bicgstab'])
+def test_k_u0(mesh, mesh_lu, cloud, cloud_lu, solver):
+    x, y  = mesh
+    u_ap, u_ex, info = Poisson_2D.Mesh_K(x, y, phi, f, solver, stats = True, u0 = mesh_lu)
+    Close(u_ap, mesh_lu)
+    assert info['iterations'] == 0
+    p, tt = cloud
+    u_ap, u_ex, vec, info = Poisson_2D.Cloud_K(p, phi, f, solver, stats = True, u0 = cloud_lu)
+    Close(u_ap, cloud_lu)
+    assert info['iterations'] == 0
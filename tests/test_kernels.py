@@ -0,0 +1,80 @@
+# All the codes presented below were developed by:
+#   Dr. Gerardo Tinoco Guerrero
+#   Universidad Michoacana de San Nicolás de Hidalgo
+#   gerardo.tinoco@umich.mx
+#
+# With the funding of:
+#   National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+#   Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+#   Aula CIMNE-Morelia. México
+#
+# Date:
+#   October, 2026.
+#
+# Last Modification:
+#   October, 2026.
+
+# Tests of the compiled kernels.
+# Every kernel is compared with its plain Python version, and the neighbor search with Kernels.Use True and False; the results
+# must be identical, not only close.
+
+import numpy as np
+import pytest
+import Scripts.Gammas as Gammas
+import Scripts.Kernels as Kernels
+import Scripts.Neighbors as Neighbors
+import Scripts.Relaxation as Relaxation
+from conftest import phi, f
+
+def Python(kernel):
+    # The plain Python version of a kernel, the kernel itself without Numba.
+    return getattr(kernel, 'py_func', kernel)
+
+def test_mesh_sweep(mesh):
+    x, y  = mesh
+    Gamma = Gammas.Mesh(x, y, np.vstack([[0], [0], [2], [0], [2]]))
+    F     = np.zeros(x.shape)
+    F[1:-1, 1:-1] = f(x, y)[1:-1, 1:-1]
+    DI    = np.array([di for di, dj in Gammas.Stencil])
+    DJ    = np.array([dj for di, dj in Gammas.Stencil])
+    u, v  = phi(x, y), phi(x, y)
+    u[1:-1, 1:-1], v[1:-1, 1:-1] = 0, 0
+    for k in range(3):                                                              # A few sweeps, with over-relaxation.
+        assert Kernels.Mesh_Sweep(Gamma, u, F, DI, DJ, 1.5) == Python(Kernels.Mesh_Sweep)(Gamma, v, F, DI, DJ, 1.5)
+        np.testing.assert_array_equal(u, v)
+
+def test_cloud_sweep(cloud):
+    p, tt = cloud
+    vec   = Neighbors.Cloud(p, 8)
+    Gamma = Gammas.Cloud(p, vec, np.vstack([[0], [0], [2], [0], [2]]))
+    inner = np.where(p[:,2] == 0)[0]
+    mask  = vec[inner,:] != -1
+    idx   = np.where(mask, vec[inner,:], 0)
+    W     = np.where(mask, Gamma[inner,1:], 0)
+    Fi    = f(p[inner,0], p[inner,1])
+    u     = np.where(p[:,2] == 1, phi(p[:,0], p[:,1]), 0)
+    v     = u.copy()
+    for k in range(3):
+        assert Kernels.Cloud_Sweep(inner, idx, W, Gamma[inner,0], Fi, u, 1.5) == \
+               Python(Kernels.Cloud_Sweep)(inner, idx, W, Gamma[inner,0], Fi, v, 1.5)
+        np.testing.assert_array_equal(u, v)
+
+@pytest.mark.parametrize('radius, nvec', [(None, 8), (0.12, 30), (0.12, 4)])
+def test_select(cloud, monkeypatch, radius, nvec):
+    p, tt = cloud
+    vec   = Neighbors.Cloud(p, nvec, radius = radius)
+    monkeypatch.setattr(Kernels, 'Use', False)                                      # The NumPy code.
+    np.testing.assert_array_equal(vec, Neighbors.Cloud(p, nvec, radius = radius))
+
+def test_sequential(cloud, monkeypatch):
+    # The sequential relaxation gives the same solution whether Numba is used or not.
+    p, tt = cloud
+    vec   = Neighbors.Cloud(p, 8)
+    Gamma = Gammas.Cloud(p, vec, np.vstack([[0], [0], [2], [0], [2]]))
+    u_ap  = np.where(p[:,2] == 1, phi(p[:,0], p[:,1]), 0)
+    F     = np.where(p[:,2] == 1, 0, f(p[:,0], p[:,1]))
+    u, iter, reason = Relaxation.Cloud(p, vec, Gamma, u_ap, F, 'sequential', 1, 0, 40000, rtol = 1e-10)
+    monkeypatch.setattr(Kernels, 'Cloud_Sweep', Python(Kernels.Cloud_Sweep))
+    v, it, why = Relaxation.Cloud(p, vec, Gamma, u_ap, F, 'sequential', 1, 0, 40000, rtol = 1e-10)
+    np.testing.assert_array_equal(u, v)
+    assert it == iter and why == reason == 'residual'
@@ -0,0 +1,87 @@
+# All the codes presented below were developed by:
+#   Dr. Gerardo Tinoco Guerrero
+#   Universidad Michoacana de San Nicolás de Hidalgo
+#   gerardo.tinoco@umich.mx
+#
+# With the funding of:
+#   National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+#   Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+#   Aula CIMNE-Morelia. México
+#
+# Date:
+#   October, 2026.
+#
+# Last Modification:
+#   October, 2026.
+
+# Tests of the geometric multigrid solver.
+
+import warnings
+import numpy as np
+import pytest
+import Poisson_2D
+import Scripts.Gammas as Gammas
+import Scripts.Multigrid as Multigrid
+from conftest import phi, f, Close, Region
+
+L = np.vstack([[0], [0], [2], [0], [2]])                                            # The Laplacian.
+
+def test_hierarchy(mesh):
+    x, y = mesh
+    levels, factor = Multigrid.Hierarchy(x, y, L)
+    assert [G.shape[:2] for G in levels] == [(21, 21), (11, 11), (6, 6)]            # Coarsened while the sides are odd.
+    np.testing.assert_allclose(levels[1], Gammas.Mesh(x[::2, ::2], y[::2, ::2], L))
+
+def test_even(mesh):
+    # Only an odd number of nodes on each side can be coarsened: an even side stops the coarsening with a warning.
+    x, y = mesh
+    with pytest.warns(RuntimeWarning, match='cannot coarsen a mesh of 20 x 21 nodes'):
+        levels, factor = Multigrid.Hierarchy(x[:20], y[:20], L)
+    assert len(levels) == 1
+    with pytest.warns(RuntimeWarning, match='cannot coarsen a mesh of 11 x 10 nodes'):
+        levels, factor = Multigrid.Hierarchy(x[:, :19], y[:, :19], L)
+    assert len(levels) == 2
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        Multigrid.Hierarchy(x, y, L)                                                # Coarsened down to m_min.
+
+def test_transfer():
+    # The interpolation is exact for a bilinear function, and the full weighting keeps a constant.
+    i, j = np.meshgrid(np.arange(5.), np.arange(7.), indexing='ij')
+    e    = Multigrid.Prolong(1 + i + 2*j + i*j)
+    I, J = np.meshgrid(np.arange(9.)/2, np.arange(13.)/2, indexing='ij')
+    np.testing.assert_allclose(e, 1 + I + 2*J + I*J)
+    r    = np.zeros([9, 13])
+    r[1:-1, 1:-1] = 1
+    np.testing.assert_allclose(Multigrid.Restrict(r)[1:-1, 1:-1], 1)
+
+@pytest.mark.parametrize('fmg', [True, False])
+def test_mesh(mesh, mesh_lu, fmg):
+    x, y = mesh
+    m, n = x.shape
+    u_ex = phi(x, y)
+    u_ap = u_ex.copy()
+    u_ap[1:-1, 1:-1] = 0                                                            # The boundary conditions.
+    F    = np.zeros([m, n])
+    F[1:-1, 1:-1] = f(x, y)[1:-1, 1:-1]
+    u_ap, iter, reason = Multigrid.Mesh(x, y, L, u_ap, F, fmg = fmg)
+    Close(u_ap, mesh_lu)
+    assert iter <= 10 and reason == 'residual'                                      # A few V-cycles, whatever the size.
+
+def test_poisson(mesh, mesh_lu):
+    x, y = mesh
+    u_ap, u_ex = Poisson_2D.Mesh(x, y, phi, f, 'multigrid')
+    Close(u_ap, mesh_lu)
+
+def test_diverged():
+    # On PAT_3 the smoother blows up: the V-cycles stop and say so instead of returning NaN as a solution.
+    mat = Region('Meshes', 'PAT', '3')
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)                             # The overflows of the V-cycles.
+        warnings.filterwarnings('error', 'Multigrid.Mesh did not converge', RuntimeWarning)
+        with pytest.raises(RuntimeWarning, match='the iteration diverged'):
+            Poisson_2D.Mesh(mat['x'], mat['y'], phi, f, 'multigrid')
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        u_ap, u_ex, info = Poisson_2D.Mesh(mat['x'], mat['y'], phi, f, 'multigrid', stats = True)
+    assert not info['converged'] and info['reason'] == 'diverged' and info['iterations'] < 100
@@ -0,0 +1,83 @@
+# All the codes presented below were developed by:
+#   Dr. Gerardo Tinoco Guerrero
+#   Universidad Michoacana de San Nicolás de Hidalgo
+#   gerardo.tinoco@umich.mx
+#
+# With the funding of:
+#   National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+#   Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+#   Aula CIMNE-Morelia. México
+#
+# Date:
+#   October, 2026.
+#
+# Last Modification:
+#   October, 2026.
+
+# Tests of the neighbor search.
+
+import numpy as np
+import pytest
+import Scripts.Neighbors as Neighbors
+
+def Brute(p, nvec):
+    # The neighbors of the original search, comparing all the pairs of nodes in the same order.
+    m    = len(p)
+    d    = np.sqrt((p[:,None,0] - p[None,:,0])**2 + (p[:,None,1] - p[None,:,1])**2)
+    np.fill_diagonal(d, np.inf)
+    dist = (3/2)*min(1, d.min(axis=1).max())                                        # The search radius.
+    vec  = np.zeros([m, nvec], dtype=int) - 1
+    for i in range(m):
+        temp = 0
+        for j in np.where(d[i] < dist)[0]:                                          # The candidates, by index.
+            if temp < nvec:
+                vec[i,temp] = j
+                temp       += 1
+            else:                                                                   # The farthest neighbor is replaced.
+                I = np.argmax(d[i, vec[i]])
+                if d[i,j] < d[i, vec[i,I]]:
+                    vec[i,I] = j
+    return vec
+
+def test_radius(cloud):
+    p, tt = cloud
+    np.testing.assert_array_equal(Neighbors.Cloud(p, 8), Brute(p, 8))               # The same vec as the original search.
+
+def test_radius_given(cloud):
+    p, tt = cloud
+    vec   = Neighbors.Cloud(p, 30, radius = 0.12)
+    for i in range(0, len(p), 50):                                                  # Every node closer than the radius.
+        d = np.hypot(p[:,0] - p[i,0], p[:,1] - p[i,1])
+        d[i] = np.inf
+        assert set(vec[i, vec[i] != -1]) == set(np.where(d < 0.12)[0])
+
+def test_knn(cloud):
+    p, tt = cloud
+    vec   = Neighbors.Cloud(p, 8, method = 'knn')
+    assert np.all(vec != -1)
+    for i in range(0, len(p), 25):                                                  # The 8 nearest nodes, nearest first.
+        d = np.hypot(p[:,0] - p[i,0], p[:,1] - p[i,1])
+        d[i] = np.inf
+        np.testing.assert_array_equal(np.sort(d[vec[i]]), d[vec[i]])
+        assert d[vec[i]].max() <= np.sort(d)[7]
+
+def test_unknown_method(cloud):
+    p, tt = cloud
+    with pytest.raises(ValueError):
+        Neighbors.Cloud(p, 8, method = 'delaunay')
+
+def test_triangulation(cloud):
+    p, tt = cloud
+    vec   = Neighbors.Triangulation(p, tt, 12)
+    for i in range(len(p)):                                                         # The nodes sharing a triangle, by index.
+        ref = np.setdiff1d(tt[np.any(tt == i, axis=1)], i)
+        np.testing.assert_array_equal(vec[i, :len(ref)], ref)
+        assert np.all(vec[i, len(ref):] == -1)
+
+def test_triangulation_valence(cloud):
+    # The neighbors that do not fit in vec are dropped with a warning, keeping the ones with the lowest index.
+    p, tt = cloud
+    full  = Neighbors.Triangulation(p, tt, 12)
+    with pytest.warns(UserWarning, match='more than 3 neighbors'):
+        vec = Neighbors.Triangulation(p, tt, 3)
+    np.testing.assert_array_equal(vec, full[:,:3])
@@ -0,0 +1,86 @@
+# All the codes presented below were developed by:
+#   Dr. Gerardo Tinoco Guerrero
+#   Universidad Michoacana de San Nicolás de Hidalgo
+#   gerardo.tinoco@umich.mx
+#
+# With the funding of:
+#   National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+#   Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+#   Aula CIMNE-Morelia. México
+#
+# Date:
+#   October, 2026.
+#
+# Last Modification:
+#   October, 2026.
+
+# Tests of the profiling reports.
+
+import json
+import tracemalloc
+import numpy as np
+import pytest
+import Poisson_2D
+import Scripts.Profile as Profile
+from conftest import phi, f
+
+def test_off():
+    # With no report the stages do nothing and there is no callback.
+    assert Profile.Stage(None, 'solve') is Profile.Null
+    assert Profile.History(None) is None
+
+def test_stage():
+    report = Profile.Report()
+    for k in range(2):                                                              # A repeated stage is accumulated.
+        with Profile.Stage(report, 'solve'):
+            a = np.ones(1000)
+    assert list(report['stages']) == ['solve'] and report['stages']['solve']['time'] > 0
+    assert 'memory' not in report['stages']['solve']                                # tracemalloc is not tracing.
+    tracemalloc.start()
+    try:
+        with Profile.Stage(report, 'rhs'):
+            a = np.ones(100000)
+    finally:
+        tracemalloc.stop()
+    assert report['stages']['rhs']['memory'] >= a.nbytes
+
+def test_net_blocks():
+    # The net change of the blocks of the Python allocator: the objects kept alive, not the NumPy buffers.
+    report = Profile.Report()
+    kept   = []
+    with Profile.Stage(report, 'objects'):
+        kept.extend(object() for k in range(1000))
+    with Profile.Stage(report, 'freed'):
+        [object() for k in range(1000)]
+    assert set(report['stages']['objects']) == {'time', 'net_blocks'}
+    assert report['stages']['objects']['net_blocks'] >= 1000 > report['stages']['freed']['net_blocks']
+
+def test_history():
+    report   = Profile.Report()
+    callback = Profile.History(report)
+    callback(np.float64(0.5))
+    callback(0.25)
+    assert report['history'] == [0.5, 0.25] and type(report['history'][0]) is float
+
+@pytest.mark.parametrize('method', ['gs', 'multigrid'])
+def test_mesh(mesh, method):
+    x, y = mesh
+    u_ap, u_ex, info = Poisson_2D.Mesh(x, y, phi, f, method, stats = True)
+    assert list(info['stages']) == ['boundary', 'gammas', 'rhs', 'solve']
+    assert len(info['history']) == info['iterations']                               # One error per iteration.
+    np.testing.assert_array_equal(u_ap, Poisson_2D.Mesh(x, y, phi, f, method)[0])  # The profiling does not change the result.
+    json.dumps(info)                                                                # The report can be stored.
+
+def test_mesh_k(mesh):
+    x, y = mesh
+    u_ap, u_ex, info = Poisson_2D.Mesh_K(x, y, phi, f, 'gmres', stats = True)
+    assert list(info['stages']) == ['boundary', 'gammas', 'assembly', 'rhs', 'solve']
+    assert len(info['history']) == info['iterations']
+
+def test_cloud(cloud):
+    p, tt = cloud
+    u_ap, u_ex, vec, info = Poisson_2D.Cloud(p, phi, f, 'amg', stats = True)
+    assert list(info['stages']) == ['boundary', 'neighbors', 'gammas', 'rhs', 'solve']
+    assert len(info['history']) == info['iterations']
+    u_ap, u_ex, vec, info = Poisson_2D.Cloud_K(p, phi, f, 'lu', stats = True, cache = True)
+    assert list(info['stages']) == ['boundary', 'cache', 'rhs', 'solve']   # The operator is read from the cache.
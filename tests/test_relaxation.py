@@ -0,0 +1,182 @@
+# All the codes presented below were developed by:
+#   Dr. Gerardo Tinoco Guerrero
+#   Universidad Michoacana de San Nicolás de Hidalgo
+#   gerardo.tinoco@umich.mx
+#
+# With the funding of:
+#   National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+#   Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+#   Aula CIMNE-Morelia. México
+#
+# Date:
+#   October, 2026.
+#
+# Last Modification:
+#   October, 2026.
+
+# Tests of the relaxation solvers.
+# The relaxation of each routine of Poisson_2D is compared with the sparse LU solution on CUA_1.
+
+import warnings
+import numpy as np
+import pytest
+import Poisson_2D
+import Scripts.Gammas as Gammas
+import Scripts.Neighbors as Neighbors
+import Scripts.Relaxation as Relaxation
+from conftest import phi, f, Close, Region
+
+@pytest.mark.parametrize('method, omega', [('gs', 1), ('jacobi', 1), ('sequential', 1)])
+def test_mesh(mesh, mesh_lu, method, omega):
+    x, y = mesh
+    u_ap, u_ex = Poisson_2D.Mesh(x, y, phi, f, method, omega)
+    Close(u_ap, mesh_lu)
+
+@pytest.mark.parametrize('method, omega', [('gs', 1), ('jacobi', 1), ('sequential', 1)])
+def test_cloud(cloud, cloud_lu, method, omega):
+    p, tt = cloud
+    u_ap, u_ex, vec = Poisson_2D.Cloud(p, phi, f, method, omega)
+    Close(u_ap, cloud_lu)
+
+@pytest.mark.parametrize('method', ['gs', 'jacobi'])
+def test_triangulation(cloud, method):
+    p, tt = cloud
+    u_ap, u_ex, vec = Poisson_2D.Triangulation(p, tt, phi, f, method)
+    assert np.abs(u_ap - u_ex).max() < 0.1                                          # The discretization error of CUA_1.
+
+def test_coloring(cloud):
+    p, tt = cloud
+    vec   = Neighbors.Cloud(p, 8)
+    color = Relaxation.Coloring(p, vec)
+    np.testing.assert_array_equal(color < 0, p[:,2] == 1)                           # Only the interior nodes are colored.
+    for i, j in np.argwhere(vec != -1):                                             # No node shares the color of a neighbor.
+        assert color[i] < 0 or color[i] != color[vec[i, j]]
+
+# Stopping criteria
+
+def Problem(mesh):
+    # The Gammas, boundary conditions and right side of CUA_1.
+    x, y  = mesh
+    Gamma = Gammas.Mesh(x, y, np.vstack([[0], [0], [2], [0], [2]]))
+    u_ap  = phi(x, y)
+    u_ap[1:-1, 1:-1] = 0
+    F     = np.zeros(x.shape)
+    F[1:-1, 1:-1] = f(x, y)[1:-1, 1:-1]
+    return Gamma, u_ap, F
+
+def test_stop():
+    assert Relaxation.Stop(1e-11, 1, 1e-10, 0, 1, 0, 5)[0] == 'residual'            # Converged.
+    assert Relaxation.Stop(np.nan, 1, 1e-10, 0, 1, 0, 5)[0] == 'diverged'           # Not finite.
+    assert Relaxation.Stop(0.3, 1, 1e-10, 0, 0.4, 4, 5) == ('', 0.3, 0)             # A new smallest residual.
+    assert Relaxation.Stop(0.5, 1, 1e-10, 0, 0.4, 4, 5) == ('stalled', 0.4, 5)      # Stagnated.
+    assert Relaxation.Stop(0.5, 1, 1e-10, 0, 0.4, 4, 0) == ('', 0.4, 5)             # Never stagnated.
+
+def test_reason():
+    assert Relaxation.Reason('stalled', 0, 1e-10) == 'stalled'                      # The residual criteria come first.
+    assert Relaxation.Reason('', np.inf, 1e-10) == 'diverged'
+    assert Relaxation.Reason('', 1e-11, 1e-10) == 'update'
+    assert Relaxation.Reason('', 1e-9, 1e-10) == 'm_it'
+
+def test_warn():
+    with pytest.warns(RuntimeWarning, match='did not converge after 7 iterations: the residual stagnated'):
+        Relaxation.Warn('Relaxation.Mesh', 'stalled', 7)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        Relaxation.Warn('Relaxation.Mesh', 'residual', 7)                           # No warning once converged.
+
+@pytest.mark.parametrize('method', ['gs', 'jacobi', 'sequential'])
+def test_rtol(mesh, method):
+    Gamma, u_ap, F = Problem(mesh)
+    r0      = Relaxation.Mesh_Residual(Gamma, u_ap, F)
+    history = []
+    u_ap, iter, reason = Relaxation.Mesh(Gamma, u_ap, F, method, 1, 0, 40000, history.append, rtol = 1e-8)
+    assert reason == 'residual' and len(history) == iter and history[-1] <= 1e-8*r0 < history[-2]            # Stopped on the first sweep under rtol.
+    assert Relaxation.Mesh_Residual(Gamma, u_ap, F) < 1e-7*r0
+
+def test_stall(mesh):
+    # A diverging iteration stops after stall sweeps without a new smallest residual, then it is restarted.
+    Gamma, u_ap, F = Problem(mesh)
+    history = []
+    with pytest.warns(RuntimeWarning, match='the residual stagnated'):
+        u_ap, iter, reason = Relaxation.Mesh(Gamma, u_ap, F, 'jacobi', 3, 0, 40000, history.append, stall = 20)
+    assert reason == 'stalled' and len(history) == iter > 20 and all(np.diff(history[:20]) > 0)
+
+def test_cloud_rtol(cloud):
+    p, tt = cloud
+    vec   = Neighbors.Cloud(p, 8)
+    Gamma = Gammas.Cloud(p, vec, np.vstack([[0], [0], [2], [0], [2]]))
+    bnd   = p[:,2] == 1
+    u_ap  = np.where(bnd, phi(p[:,0], p[:,1]), 0)
+    F     = np.where(bnd, 0, f(p[:,0], p[:,1]))
+    history = []
+    u_ap, iter, reason = Relaxation.Cloud(p, vec, Gamma, u_ap, F, 'gs', 1, 0, 40000, history.append, rtol = 1e-8)
+    assert reason == 'residual' and history[-1] <= 1e-8*history[0] and iter < 40000
+
+# Over-relaxation
+
+def test_omega():
+    assert Relaxation.Omega(0) == 1 and Relaxation.Omega(0.8) == pytest.approx(1.25)
+    assert Relaxation.Omega(1.2) == 1 and Relaxation.Omega(np.inf) == 1             # Jacobi does not converge.
+
+def test_mesh_auto(mesh, mesh_lu):
+    x, y = mesh
+    u_ap, u_ex, gs  = Poisson_2D.Mesh(x, y, phi, f, 'gs', 1, stats = True)
+    u_ap, u_ex, sor = Poisson_2D.Mesh(x, y, phi, f, 'gs', 'auto', stats = True)
+    Close(u_ap, mesh_lu)
+    assert 1 < sor['omega'] < 2 and sor['iterations'] < gs['iterations']/2
+
+def test_cloud_auto(cloud, cloud_lu):
+    p, tt = cloud
+    u_ap, u_ex, vec, gs  = Poisson_2D.Cloud(p, phi, f, 'gs', 1, stats = True)
+    u_ap, u_ex, vec, sor = Poisson_2D.Cloud(p, phi, f, 'gs', 'auto', stats = True)
+    Close(u_ap, cloud_lu)
+    assert 1 < sor['omega'] < 2 and sor['iterations'] < gs['iterations']/2
+
+def test_restart(mesh):
+    # An over-relaxation that diverges is restarted with a smaller weight.
+    Gamma, u_ap, F = Problem(mesh)
+    r0      = Relaxation.Mesh_Residual(Gamma, u_ap, F)
+    u_ap, iter, reason = Relaxation.Mesh(Gamma, u_ap, F, 'jacobi', 3, 0, 40000, rtol = 1e-8, stall = 20)
+    assert reason == 'residual' and iter > 20                                       # Restarted until the tolerance is reached.
+    assert Relaxation.Mesh_Residual(Gamma, u_ap, F) < 1e-7*r0
+
+def test_restart_weight(mesh, mesh_lu):
+    # The report gives the weight of the last restart, not the one asked for.
+    Gamma, u_ap, F = Problem(mesh)
+    weights = []
+    u_ap, iter, reason = Relaxation.Mesh(Gamma, u_ap, F, 'jacobi', 3, 0, 40000, rtol = 1e-8, stall = 20, restart = weights.append)
+    assert weights[0] == Relaxation.Relax(3) and all(a > b for a, b in zip(weights, weights[1:]))
+    x, y = mesh
+    u_ap, u_ex, info = Poisson_2D.Mesh(x, y, phi, f, 'jacobi', 3, stats = True)
+    Close(u_ap, mesh_lu)
+    assert info['omega'] == weights[-1] < 3
+
+def test_relax():
+    assert Relaxation.Relax(1.8) == pytest.approx(1.4) and Relaxation.Relax(1.05) == 1
+
+@pytest.mark.parametrize('kind', ['Mesh', 'Cloud'])
+def test_jacobi_auto(mesh, mesh_lu, cloud, cloud_lu, kind):
+    # The estimated weight only holds for Gauss-Seidel; over-relaxed Jacobi would diverge.
+    if kind == 'Mesh':
+        u_ap, u_ex, info = Poisson_2D.Mesh(*mesh, phi, f, 'jacobi', 'auto', stats = True)
+        Close(u_ap, mesh_lu)
+    else:
+        u_ap, u_ex, vec, info = Poisson_2D.Cloud(cloud[0], phi, f, 'jacobi', 'auto', stats = True)
+        Close(u_ap, cloud_lu)
+    assert info['omega'] == 1
+
+# Non convergence
+# On the mesh of PAT_1 the relaxation blows up: it must stop and say so, in its report and with a warning.
+
+@pytest.mark.parametrize('method', ['gs', 'jacobi'])
+def test_stats(mesh, method):
+    x, y = mesh
+    u_ap, u_ex, info = Poisson_2D.Mesh(x, y, phi, f, method, 1, stats = True)
+    assert info['converged'] and info['reason'] in Relaxation.Converged
+
+@pytest.mark.parametrize('method', ['gs', 'jacobi'])
+def test_not_converged(method):
+    mat = Region('Meshes', 'PAT', '1')
+    with pytest.warns(RuntimeWarning, match='Relaxation.Mesh did not converge'):
+        u_ap, u_ex, info = Poisson_2D.Mesh(mat['x'], mat['y'], phi, f, method, 'auto', stats = True)
+    assert not info['converged'] and info['reason'] in ('stalled', 'diverged', 'm_it')
@@ -0,0 +1,96 @@
+# All the codes presented below were developed by:
+#   Dr. Gerardo Tinoco Guerrero
+#   Universidad Michoacana de San Nicolás de Hidalgo
+#   gerardo.tinoco@umich.mx
+#
+# With the funding of:
+#   National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+#   Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+#   Aula CIMNE-Morelia. México
+#
+# Date:
+#   October, 2026.
+#
+# Last Modification:
+#   October, 2026.
+
+# Tests of the Schwarz domain decomposition.
+# The subdomains are checked on CUA_1 and the solutions are compared with the sparse LU solution.
+
+import numpy as np
+import pytest
+import Poisson_2D
+import Scripts.Gammas as Gammas
+import Scripts.Neighbors as Neighbors
+import Scripts.Schwarz as Schwarz
+from conftest import phi, f, Close, Region
+
+@pytest.fixture(scope='module')
+def problem(cloud):
+    # Neighbors, Gammas, boundary conditions and right side of CUA_1.
+    p, tt = cloud
+    vec   = Neighbors.Cloud(p, 8)
+    Gamma = Gammas.Cloud(p, vec, np.vstack([[0], [0], [2], [0], [2]]))
+    u_ap  = np.where(p[:,2] == 1, phi(p[:,0], p[:,1]), 0)
+    F     = np.where(p[:,2] == 1, 0, f(p[:,0], p[:,1]))
+    return p, vec, Gamma, u_ap, F
+
+@pytest.mark.parametrize('nsub', [1, 3, 4, 7])
+def test_partition(cloud, nsub):
+    p, tt = cloud
+    part  = Schwarz.Partition(p, nsub)
+    np.testing.assert_array_equal(part < 0, p[:,2] == 1)                            # Only the interior nodes have a subdomain.
+    sizes = np.bincount(part[part >= 0])
+    assert len(sizes) == nsub and sizes.max() - sizes.min() <= 1                    # Nearly the same size.
+
+def test_subdomains(problem):
+    p, vec, Gamma, u_ap, F = problem
+    subs  = Schwarz.Subdomains(p, vec, Gamma, F, Schwarz.Partition(p, 4), overlap = 1)
+    owned = np.concatenate([glob[:own] for glob, own, *rest in subs])
+    np.testing.assert_array_equal(np.sort(owned), np.where(p[:,2] == 0)[0])        # Every interior node is owned once.
+    for glob, own, nodes, idx, W, G0, Fi in subs:
+        assert len(nodes) > own                                                     # The overlap.
+        assert np.all(p[glob[nodes], 2] == 0)                                       # Only interior nodes are relaxed.
+    for group in Schwarz.Colors(subs, len(p)):                                      # No subdomain reads what another one of its
+        for s in group:                                                             # color writes.
+            for t in group:
+                if s != t:
+                    assert not np.isin(subs[t][0][:subs[t][1]], subs[s][0]).any()
+
+@pytest.mark.parametrize('method', ['additive', 'multiplicative'])
+def test_workers(problem, method):
+    # The result does not depend on the number of threads.
+    p, vec, Gamma, u_ap, F = problem
+    u, iter, reason = Schwarz.Cloud(p, vec, Gamma, u_ap, F, method, rtol = 1e-10, workers = 1, nsub = 4)
+    v, it, why = Schwarz.Cloud(p, vec, Gamma, u_ap, F, method, rtol = 1e-10, workers = 4, nsub = 4)
+    np.testing.assert_array_equal(u, v)
+    assert it == iter and why == reason == 'residual'
+
+@pytest.mark.parametrize('method', ['additive', 'multiplicative'])
+def test_cloud(cloud, cloud_lu, method):
+    p, tt = cloud
+    u_ap, u_ex, vec = Poisson_2D.Cloud(p, phi, f, method, workers = 4)
+    Close(u_ap, cloud_lu)
+    u_ap, u_ex, vec = Poisson_2D.Triangulation(p, tt, phi, f, method, workers = 4)
+    assert np.abs(u_ap - u_ex).max() < 0.1                                          # The discretization error of CUA_1.
+
+def test_unknown_method(problem):
+    p, vec, Gamma, u_ap, F = problem
+    with pytest.raises(ValueError):
+        Schwarz.Cloud(p, vec, Gamma, u_ap, F, 'jacobi')
+
+@pytest.mark.parametrize('method', ['additive', 'multiplicative'])
+def test_auto(method):
+    # On CAB_3 the weight estimated for Gauss-Seidel made the subdomain sweeps stop far from the solution.
+    p = Region('Clouds', 'CAB', '3')['p']
+    u_lu, u_ex, vec = Poisson_2D.Cloud_K(p, phi, f, 'lu')
+    u_ap, u_ex, vec, info = Poisson_2D.Cloud(p, phi, f, method, 'auto', stats = True, workers = 2)
+    Close(u_ap, u_lu)
+    assert info['omega'] == 1
+
+def test_restart(cloud, cloud_lu):
+    # A diverging over-relaxation is restarted with a smaller weight, which is the one reported.
+    p, tt = cloud
+    u_ap, u_ex, vec, info = Poisson_2D.Cloud(p, phi, f, 'multiplicative', 3, stats = True, stall = 20, workers = 2)
+    Close(u_ap, cloud_lu)
+    assert 1 <= info['omega'] < 3 and info['converged']
@@ -0,0 +1,79 @@
+# All the codes presented below were developed by:
+#   Dr. Gerardo Tinoco Guerrero
+#   Universidad Michoacana de San Nicolás de Hidalgo
+#   gerardo.tinoco@umich.mx
+#
+# With the funding of:
+#   National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+#   Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+#   Aula CIMNE-Morelia. México
+#
+# Date:
+#   October, 2026.
+#
+# Last Modification:
+#   October, 2026.
+
+# Tests of the shared-memory Jacobi solver.
+# The processes must give the same iterations as the weighted Jacobi of Relaxation.Cloud, not only a close solution.
+
+import os
+import numpy as np
+import pytest
+import Poisson_2D
+import Scripts.Gammas as Gammas
+import Scripts.Neighbors as Neighbors
+import Scripts.Relaxation as Relaxation
+import Scripts.Shared as Shared
+from conftest import phi, f, Close
+
+@pytest.fixture(scope='module')
+def problem(cloud):
+    # Neighbors, Gammas, boundary conditions and right side of CUA_1.
+    p, tt = cloud
+    vec   = Neighbors.Cloud(p, 8)
+    Gamma = Gammas.Cloud(p, vec, np.vstack([[0], [0], [2], [0], [2]]))
+    u_ap  = np.where(p[:,2] == 1, phi(p[:,0], p[:,1]), 0)
+    F     = np.where(p[:,2] == 1, 0, f(p[:,0], p[:,1]))
+    return p, vec, Gamma, u_ap, F
+
+@pytest.mark.parametrize('workers', [1, 2, 3])
+def test_jacobi(problem, workers):
+    p, vec, Gamma, u_ap, F = problem
+    h_r, h_s = [], []
+    u, iter, reason = Relaxation.Cloud(p, vec, Gamma, u_ap, F, 'jacobi', 1, 0, 40000, h_r.append, rtol = 1e-10, stall = 100)
+    v, it, why = Shared.Cloud(p, vec, Gamma, u_ap, F, 1, 0, 40000, h_s.append, rtol = 1e-10, stall = 100, workers = workers)
+    np.testing.assert_array_equal(u, v)
+    assert it == iter and h_s == h_r and why == reason
+
+def test_cloud(cloud, cloud_lu):
+    shm   = set(os.listdir('/dev/shm')) if os.path.isdir('/dev/shm') else set()
+    p, tt = cloud
+    u_ap, u_ex, vec = Poisson_2D.Cloud(p, phi, f, 'shared', workers = 2)
+    Close(u_ap, cloud_lu)
+    if os.path.isdir('/dev/shm'):                                                   # No shared block is left behind.
+        assert set(os.listdir('/dev/shm')) <= shm
+
+def test_failure(problem, monkeypatch):
+    # A worker that fails aborts the barrier, so the others do not wait for it and the solver raises.
+    p, vec, Gamma, u_ap, F = problem
+    worker = Shared.Worker
+    def Failing(*args):
+        if args[2] == 1:                                                            # The second worker fails while iterating.
+            monkeypatch.setattr(Relaxation, 'Cloud_Update', Fail)
+        worker(*args)
+    def Fail(*args):
+        raise ValueError('A failing worker.')
+    monkeypatch.setattr(Shared, 'Worker', Failing)
+    monkeypatch.setattr(Shared, 'Timeout', 10)                                      # The barrier must not be what stops it.
+    with pytest.raises(RuntimeError, match='exit codes: \\[1, 1, 1\\]'):
+        Shared.Cloud(p, vec, Gamma, u_ap, F, 1, 0, 40000, rtol = 1e-10, workers = 3)
+
+def test_restart(problem):
+    # A diverging over-relaxation is restarted as in Relaxation.Cloud, and the weights are reported.
+    p, vec, Gamma, u_ap, F = problem
+    w_r, w_s = [], []
+    u, iter, reason = Relaxation.Cloud(p, vec, Gamma, u_ap, F, 'jacobi', 3, 0, 40000, rtol = 1e-10, stall = 20, restart = w_r.append)
+    v, it, why = Shared.Cloud(p, vec, Gamma, u_ap, F, 3, 0, 40000, rtol = 1e-10, stall = 20, workers = 2, restart = w_s.append)
+    np.testing.assert_array_equal(u, v)
+    assert w_s == w_r and len(w_r) > 0 and it == iter and why == reason == 'residual'
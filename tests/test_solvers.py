@@ -0,0 +1,209 @@
+# All the codes presented below were developed by:
+#   Dr. Gerardo Tinoco Guerrero
+#   Universidad Michoacana de San Nicolás de Hidalgo
+#   gerardo.tinoco@umich.mx
+#
+# With the funding of:
+#   National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+#   Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+#   Aula CIMNE-Morelia. México
+#
+# Date:
+#   October, 2026.
+#
+# Last Modification:
+#   October, 2026.
+
+# Tests of the solvers.
+# Every solution path of Poisson_2D is compared with the sparse LU solution of Mesh_K or Cloud_K on CUA_1.
+
+import numpy as np
+import pytest
+import Poisson_2D
+import Scripts.AMG as AMG
+import Scripts.Cache as Cache
+import Scripts.Gammas as Gammas
+import Scripts.Solvers as Solvers
+from conftest import phi, f, Close
+
+# Direct and Krylov solvers
+
+@pytest.mark.parametrize('solver', ['dense', 'gmres', 'bicgstab'])
+def test_mesh_k(mesh, mesh_lu, solver):
+    x, y = mesh
+    u_ap, u_ex, info = Poisson_2D.Mesh_K(x, y, phi, f, solver, stats = True)
+    Close(u_ap, mesh_lu)
+    assert info['solver'] == solver and info['residual'] < 1e-9
+
+@pytest.mark.parametrize('solver', ['dense', 'gmres', 'bicgstab'])
+def test_cloud_k(cloud, cloud_lu, solver):
+    p, tt = cloud
+    u_ap, u_ex, vec, info = Poisson_2D.Cloud_K(p, phi, f, solver, stats = True)
+    Close(u_ap, cloud_lu)
+    np.testing.assert_array_equal(u_ap[p[:,2] == 1], u_ex[p[:,2] == 1])            # The boundary values are kept.
+    assert info['residual'] < 1e-9 and info['converged'] and info['reason'] == 'residual'
+
+@pytest.mark.parametrize('solver', ['gmres', 'bicgstab', 'amg'])
+def test_not_converged(cloud, cloud_lu, solver):
+    # The flag of the Krylov solvers is reported, and a warning is issued.
+    p, tt = cloud
+    K     = Poisson_2D.Cloud_Solver(p).K
+    with pytest.warns(RuntimeWarning, match='Solvers.Solve \\(' + solver + '\\) did not converge'):
+        un, info = Solvers.Solve(K, K@cloud_lu, solver, tol = 1e-15, m_it = 1)     # A restart of GMRES counts as one.
+    assert not info['converged'] and info['reason'] == 'm_it'
+
+def test_breakdown(monkeypatch):
+    monkeypatch.setattr(Solvers, 'bicgstab', lambda K, R, **kwargs: (np.zeros(len(R)), -10))
+    with pytest.warns(RuntimeWarning, match='broke down'):
+        un, info = Solvers.Solve(np.eye(2), np.ones(2), 'bicgstab')
+    assert not info['converged'] and info['reason'] == 'breakdown'
+
+def test_lu_discretization(cloud, cloud_lu):
+    p, tt = cloud
+    u_ex  = phi(p[:,0], p[:,1])
+    assert np.abs(cloud_lu - u_ex).max() < 0.1                                      # The discretization error of CUA_1.
+
+def test_unknown_solver():
+    with pytest.raises(ValueError):
+        Solvers.Solve(np.eye(2), np.ones(2), 'cholesky')
+
+# Algebraic multigrid
+
+def test_cloud_amg(cloud, cloud_lu):
+    p, tt = cloud
+    u_ap, u_ex, vec = Poisson_2D.Cloud(p, phi, f, 'amg')
+    Close(u_ap, cloud_lu)
+    u_ap, u_ex, vec, info = Poisson_2D.Cloud(p, phi, f, 'amg', 'auto', stats = True)
+    assert info['omega'] is None                                                    # The V-cycles have no weight.
+    u_ap, u_ex, vec, info = Poisson_2D.Cloud_K(p, phi, f, 'amg', stats = True)
+    Close(u_ap, cloud_lu)
+    assert info['solver'] == 'amg' and info['residual'] < 1e-9
+
+@pytest.mark.parametrize('solver', ['gmres', 'bicgstab'])
+def test_amg_preconditioner(cloud, cloud_lu, solver):
+    p, tt = cloud
+    K     = Poisson_2D.Cloud_Solver(p).K
+    un, info = Solvers.Solve(K, K@cloud_lu, solver, precond = 'amg')
+    Close(un, cloud_lu)
+    assert info['residual'] < 1e-9
+
+def test_amg_hierarchy(cloud):
+    # The hierarchy is coarser on each level and is built only once for the same K.
+    p, tt  = cloud
+    K      = Poisson_2D.Cloud_Solver(p).K
+    levels, factor = AMG.Setup(K)
+    sizes  = [lev['A'].shape[0] for lev in levels]
+    assert len(sizes) > 1 and all(a > b for a, b in zip(sizes, sizes[1:]))
+    assert AMG.Setup(K.copy())[0] is levels
+
+def test_unknown_preconditioner():
+    with pytest.raises(ValueError):
+        Solvers.Solve(np.eye(2), np.ones(2), 'gmres', precond = 'jacobi')
+
+# Solvers for many right sides
+
+def phi2(x, y):
+    return x**2 + y**2
+
+def f2(x, y):
+    return 4 + 0*x
+
+def Counter(monkeypatch):
+    # Solvers.Factor, counting its calls.
+    calls  = []
+    factor = Solvers.Factor
+    def count(*args, **kwargs):
+        calls.append(1)
+        return factor(*args, **kwargs)
+    monkeypatch.setattr(Solvers, 'Factor', count)
+    return calls
+
+def test_mesh_solver(mesh, monkeypatch):
+    x, y   = mesh
+    refs   = [Poisson_2D.Mesh_K(x, y, g, h, 'lu')[0] for g, h in [(phi, f), (phi2, f2)]]
+    calls  = Counter(monkeypatch)
+    solver = Poisson_2D.Mesh_Solver(x, y)
+    u_ap, u_ex = solver.Solve(phi, f)                                               # One right hand side.
+    np.testing.assert_allclose(u_ap, refs[0], rtol=0, atol=1e-10)
+    u_ap, u_ex = solver.Solve_Batch([(phi, f), (phi2, f2)])                         # A batch.
+    for k, g in enumerate([phi, phi2]):
+        np.testing.assert_allclose(u_ap[:,:,k], refs[k], rtol=0, atol=1e-10)
+        np.testing.assert_allclose(u_ex[:,:,k], g(x, y))
+    assert len(calls) == 1                                                          # K was factorized once.
+
+def test_cloud_solver(cloud, monkeypatch):
+    p, tt  = cloud
+    refs   = [Poisson_2D.Cloud_K(p, g, h, 'lu')[0] for g, h in [(phi, f), (phi2, f2)]]
+    calls  = Counter(monkeypatch)
+    solver = Poisson_2D.Cloud_Solver(p)
+    u_ap, u_ex = solver.Solve(phi, f)
+    np.testing.assert_allclose(u_ap, refs[0], rtol=0, atol=1e-10)
+    u_ap, u_ex = solver.Solve_Batch([(phi, f), (phi2, f2)])
+    for k in range(2):
+        np.testing.assert_allclose(u_ap[:,k], refs[k], rtol=0, atol=1e-10)
+    R = np.random.default_rng(0).normal(size=[len(p), 3])
+    np.testing.assert_allclose(solver.K@solver.Solve_RHS(R), R, atol=1e-10)         # Every column is solved.
+    assert len(calls) == 1
+
+def test_solver_cache(cloud, monkeypatch):
+    # With the cache, a second solver on the same geometry reuses the factorization.
+    p, tt = cloud
+    first = Poisson_2D.Cloud_Solver(p, cache = True)
+    calls = Counter(monkeypatch)
+    again = Poisson_2D.Cloud_Solver(p, cache = True)
+    assert again.factor is first.factor and len(calls) == 0
+
+# Mixed precision
+
+@pytest.mark.parametrize('solver', ['lu', 'dense'])
+def test_mixed(cloud, cloud_lu, solver):
+    # The float32 factorization is refined to the float64 solution.
+    p, tt = cloud
+    K     = Poisson_2D.Cloud_Solver(p).K
+    R     = K@cloud_lu
+    un, info = Solvers.Solve(K, R, solver, precision = 'mixed')
+    np.testing.assert_allclose(un, cloud_lu, rtol=0, atol=1e-10)
+    assert info['residual'] < 1e-12 and info['iterations'] > 0                      # At least one correction.
+
+def test_mixed_factor(cloud):
+    p, tt  = cloud
+    K      = Poisson_2D.Cloud_Solver(p).K
+    single = Solvers.Factor(K, 'mixed')
+    assert single.L.dtype == np.float32 and Solvers.Factor(K).L.dtype == np.float64
+    assert Cache.Factor('key', K, 'mixed') is not Cache.Factor('key', K)            # Each precision is kept apart.
+    assert Cache.Factor('key', K, 'mixed').L.dtype == np.float32
+
+def test_mixed_dense(cloud, cloud_lu, monkeypatch):
+    # Only the factorization is in single precision: the dense array is built in float32 from the sparse K.
+    p, tt   = cloud
+    K       = Poisson_2D.Cloud_Solver(p).K
+    toarray = type(K).toarray
+    def Single(self, *args, **kwargs):
+        assert self.dtype == np.float32, 'A dense float64 copy of K was made.'
+        return toarray(self, *args, **kwargs)
+    monkeypatch.setattr(type(K), 'toarray', Single)
+    un, info = Solvers.Solve(K, K@cloud_lu, 'dense', precision = 'mixed')
+    np.testing.assert_allclose(un, cloud_lu, rtol=0, atol=1e-10)
+    assemble = Gammas.Assemble_Cloud
+    def Sparse(*args, sparse = False):
+        assert sparse, 'K was assembled dense.'
+        return assemble(*args, sparse = sparse)
+    monkeypatch.setattr(Gammas, 'Assemble_Cloud', Sparse)
+    u_ap, u_ex, vec = Poisson_2D.Cloud_K(p, phi, f, 'dense', precision = 'mixed')
+    np.testing.assert_allclose(u_ap, cloud_lu, rtol=0, atol=1e-10)
+
+def test_mixed_routines(mesh, mesh_lu, cloud, cloud_lu):
+    x, y  = mesh
+    u_ap, u_ex = Poisson_2D.Mesh_K(x, y, phi, f, precision = 'mixed')
+    np.testing.assert_allclose(u_ap, mesh_lu, rtol=0, atol=1e-10)
+    p, tt = cloud
+    u_ap, u_ex, vec = Poisson_2D.Cloud_K(p, phi, f, 'dense', precision = 'mixed')
+    np.testing.assert_allclose(u_ap, cloud_lu, rtol=0, atol=1e-10)
+    solver = Poisson_2D.Cloud_Solver(p, precision = 'mixed')
+    u_ap, u_ex = solver.Solve_Batch([(phi, f), (phi2, f2)])
+    np.testing.assert_allclose(u_ap[:,0], cloud_lu, rtol=0, atol=1e-10)
+    np.testing.assert_allclose(u_ap[:,1], Poisson_2D.Cloud_K(p, phi2, f2)[0], rtol=0, atol=1e-10)
+
+def test_unknown_precision():
+    with pytest.raises(ValueError):
+        Solvers.Solve(np.eye(2), np.ones(2), precision = 'half')
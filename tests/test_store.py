@@ -0,0 +1,125 @@
+# All the codes presented below were developed by:
+#   Dr. Gerardo Tinoco Guerrero
+#   Universidad Michoacana de San Nicolás de Hidalgo
+#   gerardo.tinoco@umich.mx
+#
+# With the funding of:
+#   National Council of Science and Technology, CONACyT (Consejo Nacional de Ciencia y Tecnología, CONACyT). México.
+#   Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+#   Aula CIMNE-Morelia. México
+#
+# Date:
+#   October, 2026.
+#
+# Last Modification:
+#   October, 2026.
+
+# Tests of the geometry store.
+# Each test converts CUA_1 to an empty store, from a copy of its .mat files, and compares the maps with loadmat.
+
+import os
+import json
+import shutil
+import numpy as np
+import pytest
+import Poisson_2D
+import Scripts.Store as Store
+from conftest import phi, f, Region
+
+@pytest.fixture
+def empty(tmp_path, monkeypatch):
+    # An empty store, with only CUA_1 in its data.
+    for kind in Store.Kinds:
+        os.makedirs(tmp_path/'Data'/kind)
+        shutil.copy2(os.path.join(Store.Data, kind, 'CUA_1.mat'), tmp_path/'Data'/kind)
+    monkeypatch.setattr(Store, 'Data', str(tmp_path/'Data'))
+    monkeypatch.setattr(Store, 'Folder', str(tmp_path/'Store'))
+    monkeypatch.setattr(Store, 'Index', None)
+    return tmp_path
+
+def Counter(monkeypatch):
+    # Store.Convert, counting its calls.
+    calls   = []
+    convert = Store.Convert
+    def count(*args):
+        calls.append(args)
+        return convert(*args)
+    monkeypatch.setattr(Store, 'Convert', count)
+    return calls
+
+@pytest.mark.parametrize('kind', ['Meshes', 'Clouds'])
+def test_load(empty, kind):
+    data = Store.Load(kind, 'CUA', '1')
+    mat  = Region(kind, 'CUA', '1')
+    assert set(data) == {k for k in mat if not k.startswith('__')}
+    for field, value in data.items():
+        assert isinstance(value, np.memmap) and not value.flags.writeable          # Read-only memory maps.
+        np.testing.assert_array_equal(value, mat[field])
+    if kind == 'Clouds':
+        assert data['tt'].min() == 0                                                # The triangles are numbered from 0.
+    with open(empty/'Store'/kind/'CUA_1'/'entry.json') as file:
+        fields = json.load(file)['fields']                                          # The entry lists every field.
+    assert {k: tuple(v['shape']) for k, v in fields.items()} == {k: v.shape for k, v in data.items()}
+
+def test_reuse(empty, monkeypatch):
+    Store.Load('Clouds', 'CUA', '1')
+    calls = Counter(monkeypatch)
+    monkeypatch.setattr(Store, 'Index', None)                                       # A new process reads the index from disk.
+    Store.Load('Clouds', 'CUA', '1')
+    assert calls == []
+
+def test_newer(empty, monkeypatch):
+    # An entry is converted again when its .mat file is newer.
+    Store.Load('Clouds', 'CUA', '1')
+    calls  = Counter(monkeypatch)
+    source = empty/'Data'/'Clouds'/'CUA_1.mat'
+    os.utime(source, (os.path.getatime(source), os.path.getmtime(source) + 10))
+    Store.Load('Clouds', 'CUA', '1')
+    Store.Load('Clouds', 'CUA', '1')
+    assert calls == [('Clouds', 'CUA_1')]
+
+def test_damaged(empty, monkeypatch):
+    Store.Load('Meshes', 'CUA', '1')
+    os.remove(empty/'Store'/'Meshes'/'CUA_1'/'x.npy')
+    calls = Counter(monkeypatch)
+    np.testing.assert_array_equal(Store.Load('Meshes', 'CUA', '1')['x'], Region('Meshes', 'CUA', '1')['x'])
+    assert len(calls) == 1
+
+def test_build(empty):
+    index = Store.Build()
+    assert sorted(index) == sorted(Store.Kinds)
+    assert Store.Regions('Clouds') == Store.Regions('Meshes') == [('CUA', '1')]
+
+def test_solve(empty):
+    # The solvers work on the read-only maps.
+    data = Store.Load('Clouds', 'CUA', '1')
+    mat  = Region('Clouds', 'CUA', '1')
+    for routine in [Poisson_2D.Cloud_K, Poisson_2D.Cloud]:
+        np.testing.assert_array_equal(routine(data['p'], phi, f)[0], routine(mat['p'], phi, f)[0])
+    np.testing.assert_array_equal(Poisson_2D.Triangulation(data['p'], data['tt'], phi, f)[0], \
+                                  Poisson_2D.Triangulation(mat['p'], mat['tt'], phi, f)[0])
+
+def test_concurrent(empty, monkeypatch):
+    # Another process converts a region meanwhile: its entry is read, not converted again, and no entry of another region is
+    # overwritten, since there is no shared index.
+    Store.Load('Meshes', 'CUA', '1')
+    monkeypatch.setattr(Store, 'Index', None)
+    Store.Read()                                                                    # This process read the store first...
+    index = Store.Index
+    monkeypatch.setattr(Store, 'Index', None)
+    Store.Load('Clouds', 'CUA', '1')                                                # ...and another one converted a region.
+    monkeypatch.setattr(Store, 'Index', index)
+    calls = Counter(monkeypatch)
+    Store.Load('Clouds', 'CUA', '1')
+    assert calls == []
+    assert Store.Entry('Meshes', 'CUA_1') is not None and Store.Entry('Clouds', 'CUA_1') is not None
+    assert not [f for f in os.listdir(empty/'Store'/'Clouds'/'CUA_1') if f.endswith('.tmp')]
+
+def test_damaged_entry(empty, monkeypatch):
+    Store.Load('Meshes', 'CUA', '1')
+    with open(empty/'Store'/'Meshes'/'CUA_1'/'entry.json', 'w') as file:
+        file.write('{"fields": ')                                                   # A damaged entry.
+    monkeypatch.setattr(Store, 'Index', None)
+    calls = Counter(monkeypatch)
+    np.testing.assert_array_equal(Store.Load('Meshes', 'CUA', '1')['x'], Region('Meshes', 'CUA', '1')['x'])
+    assert len(calls) == 1 and Store.Entry('Meshes', 'CUA_1') is not None